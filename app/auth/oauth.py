@@ -3,6 +3,7 @@
 import json
 import logging
 import secrets
+from datetime import UTC
 from typing import Any
 
 from google.auth.transport.requests import Request
@@ -17,7 +18,7 @@ logger = logging.getLogger(__name__)
 class OAuthService:
     """Service for managing Google OAuth authentication with DB persistence.
     
-    Tokens are stored encrypted in the database using Fernet encryption.
+    Tokens are stored encrypted in the database using AES-GCM encryption.
     Supports multi-user token storage keyed by user_id.
     """
 
@@ -38,7 +39,7 @@ class OAuthService:
         """
         from sqlalchemy import select
 
-        from app.crypto import decrypt_token
+        from app.crypto import decrypt_tokens
         from app.database import get_db_context
         from app.models import OAuthToken
 
@@ -53,10 +54,21 @@ class OAuthService:
                     return None
 
                 # Decrypt tokens
-                access_token = decrypt_token(token_record.encrypted_access_token)
-                refresh_token = decrypt_token(token_record.encrypted_refresh_token)
+                access_token, refresh_token = decrypt_tokens(
+                    [
+                        token_record.encrypted_access_token,
+                        token_record.encrypted_refresh_token,
+                    ]
+                )
                 scopes = json.loads(token_record.scopes)
 
+                # google-auth compares expiry against naive UTC time. Without
+                # it, credentials.expired is always False and an expired token
+                # is only noticed once a request fails with 401.
+                expiry = token_record.expires_at
+                if expiry is not None and expiry.tzinfo is not None:
+                    expiry = expiry.astimezone(UTC).replace(tzinfo=None)
+
                 return Credentials(
                     token=access_token,
                     refresh_token=refresh_token,
@@ -64,6 +76,7 @@ class OAuthService:
                     client_id=self.settings.google_client_id,
                     client_secret=self.settings.google_client_secret,
                     scopes=scopes,
+                    expiry=expiry,
                 )
         except Exception as e:
             logger.warning(f"Failed to load credentials from DB: {type(e).__name__}")
@@ -83,13 +96,14 @@ class OAuthService:
 
         from sqlalchemy import select
 
-        from app.crypto import encrypt_token
+        from app.crypto import encrypt_tokens
         from app.database import get_db_context
         from app.models import OAuthToken
 
         try:
-            encrypted_access = encrypt_token(credentials.token or "")
-            encrypted_refresh = encrypt_token(credentials.refresh_token or "")
+            encrypted_access, encrypted_refresh = encrypt_tokens(
+                [credentials.token or "", credentials.refresh_token or ""]
+            )
             scopes_json = json.dumps(list(credentials.scopes or []))
 
             async with get_db_context() as session:
@@ -16,8 +16,12 @@ from fastapi.templating import Jinja2Templates
 
 from app.auth.oauth import OAuthService
 from app.auth.schemas import AuthStatus, UserInfo
-from app.auth.simple_auth import get_session_manager
-from app.core.dependencies import get_oauth_service_dep, get_session_data
+from app.auth.simple_auth import SessionManager
+from app.core.dependencies import (
+    get_oauth_service_dep,
+    get_session_data,
+    get_session_manager_dep,
+)
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -56,18 +60,18 @@ async def login_page(
 async def login_submit(
     username: str = Form(...),
     password: str = Form(...),
+    session_manager: SessionManager = Depends(get_session_manager_dep),
 ) -> RedirectResponse:
     """Process login form submission.
 
     Args:
         username: Form username
         password: Form password
+        session_manager: Session manager (injected via DI)
 
     Returns:
         Redirect to dashboard on success, login page on failure
     """
-    session_manager = get_session_manager()
-
     if not session_manager.verify_credentials(username, password):
         return RedirectResponse(
             url="/auth/login?error=ユーザー名またはパスワードが正しくありません",
@@ -42,6 +42,13 @@ class Settings(BaseSettings):
     # Queue settings
     max_concurrent_uploads: int = 2
     upload_chunk_size: int = 10 * 1024 * 1024  # 10MB
+    single_request_threshold: int = 5 * 1024 * 1024  # 5MB - smaller files skip chunking
+    chunk_retry_count: int = 5  # Retries per failed upload chunk before giving up
+    progress_update_hz: float = 4.0  # Max upload progress updates per second per job
+
+    # Local cache directory (e.g., resolved YouTube uploads playlist IDs);
+    # empty disables the on-disk cache
+    cache_dir: str = ""
 
     # File size limits
     max_file_size: int = 5 * 1024 * 1024 * 1024  # 5GB - hard limit (rejected)
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.auth.oauth import OAuthService
+from app.auth.simple_auth import SessionManager, get_session_manager
 
     
 from app.drive.services import DriveService
@@ -126,6 +127,15 @@ def get_oauth_service_dep() -> OAuthService:
     return get_oauth_service()
 
 
+def get_session_manager_dep() -> SessionManager:
+    """Get SessionManager instance.
+
+    Returns:
+        SessionManager singleton instance
+    """
+    return get_session_manager()
+
+
 async def get_session_data(
     session_token: str | None = Cookie(None, alias="session"),
 ) -> dict | None:
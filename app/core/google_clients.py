@@ -0,0 +1,122 @@
+"""Shared Google API discovery clients.
+
+build() parses the discovery document and generates Resource classes on
+every call, which is wasted work when each request constructs a new
+service for the same user. Clients are cached per API and access token.
+"""
+
+import functools
+import threading
+from typing import Any
+
+import google_auth_httplib2
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest, build_http
+
+
+class _CredentialsKey:
+    """Hashable wrapper that identifies credentials by client ID and token."""
+
+    __slots__ = ("credentials", "key")
+
+    def __init__(self, credentials: Credentials) -> None:
+        self.credentials = credentials
+        self.key = (credentials.client_id, credentials.token)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _CredentialsKey) and self.key == other.key
+
+
+class _ThreadLocalHttp:
+    """Authorized transport that keeps one connection per calling thread.
+
+    httplib2.Http is not thread-safe, but requests are often built on the
+    event loop and executed in worker threads. Attribute lookups (such as
+    ``request``) are resolved against the executing thread's own
+    AuthorizedHttp, so each thread reuses its kept-alive connection.
+    """
+
+    def __init__(self, credentials: Credentials) -> None:
+        self._credentials = credentials
+        self._local = threading.local()
+
+    def _transport(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Get the calling thread's transport, creating it on first use."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            # build_http() applies the client's timeout and keeps 308 (used
+            # by resumable uploads) out of httplib2's redirect handling
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=build_http())
+            self._local.http = http
+        return http
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._transport(), name)
+
+
+def _build_client(api_name: str, api_version: str, credentials: Credentials) -> Any:
+    """Build an API client from the bundled discovery document.
+
+    Requests share a per-thread transport, so calls on the same thread reuse
+    a connection while one client can still be shared by concurrent calls
+    running in worker threads.
+
+    Args:
+        api_name: API name (e.g., "youtube")
+        api_version: API version (e.g., "v3")
+        credentials: Google OAuth credentials
+
+    Returns:
+        API service resource
+    """
+
+    transport = _ThreadLocalHttp(credentials)
+
+    def request_builder(http: Any, *args: Any, **kwargs: Any) -> HttpRequest:
+        return HttpRequest(transport, *args, **kwargs)
+
+    return build(
+        api_name,
+        api_version,
+        credentials=credentials,
+        requestBuilder=request_builder,
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _build_client_cached(api_name: str, api_version: str, credentials_key: _CredentialsKey) -> Any:
+    """Build an API client, reused for the lifetime of an access token.
+
+    Args:
+        api_name: API name
+        api_version: API version
+        credentials_key: Credentials wrapped in a hashable key
+
+    Returns:
+        API service resource
+    """
+    return _build_client(api_name, api_version, credentials_key.credentials)
+
+
+def get_api_client(api_name: str, api_version: str, credentials: Credentials) -> Any:
+    """Get an API client for the given credentials.
+
+    Credentials without an access token yet are never shared between users.
+
+    Args:
+        api_name: API name (e.g., "drive")
+        api_version: API version (e.g., "v3")
+        credentials: Google OAuth credentials
+
+    Returns:
+        API service resource
+    """
+    if getattr(credentials, "token", None):
+        return _build_client_cached(api_name, api_version, _CredentialsKey(credentials))
+    return _build_client(api_name, api_version, credentials)
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     import io
+    from collections.abc import AsyncIterator, Collection
     from uuid import UUID
 
     from google.oauth2.credentials import Credentials
@@ -82,16 +83,17 @@ class DriveRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_file_content_stream(
-        self, file_id: str
-    ) -> tuple["io.BytesIO", object]:
-        """Get a file content stream for downloading.
+    def iter_file_chunks(
+        self, file_id: str, chunk_size: int
+    ) -> "AsyncIterator[bytes]":
+        """Download a file in chunks, yielding each chunk as it arrives.
 
         Args:
             file_id: Drive file ID
+            chunk_size: Download chunk size in bytes
 
         Returns:
-            Tuple of (BytesIO buffer, MediaIoBaseDownload instance)
+            Async iterator over consecutive chunks of file content
         """
         ...
 
@@ -222,9 +224,14 @@ class QueueRepositoryProtocol(Protocol):
         """
         ...
 
-    async def get_next_pending_job(self) -> "QueueJob | None":
+    async def get_next_pending_job(
+        self, exclude_ids: "Collection[UUID | str] | None" = None
+    ) -> "QueueJob | None":
         """Get the next pending job in queue order (FIFO).
 
+        Args:
+            exclude_ids: Job IDs to skip, e.g. jobs already being processed
+
         Returns:
             Next pending QueueJob or None
         """
@@ -1,72 +1,159 @@
 """Cryptographic utilities for token encryption.
 
-Uses Fernet symmetric encryption from the cryptography library.
-The encryption key is derived from the SECRET_KEY setting.
+Uses AES-256-GCM authenticated encryption from the cryptography library.
+Tokens written by earlier releases with Fernet are still decrypted.
+The encryption keys are derived from the SECRET_KEY setting.
 """
 
 import base64
+import binascii
 import hashlib
+import os
+from collections.abc import Sequence
 from functools import lru_cache
 
-from cryptography.fernet import Fernet
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+# Leading byte of AES-GCM tokens; Fernet tokens always start with 0x80
+_AESGCM_VERSION = b"\x01"
+_FERNET_VERSION = 0x80
+_NONCE_SIZE = 12
+
+
+def _get_secret_key() -> bytes:
+    """Get the configured SECRET_KEY as bytes."""
+    from app.config import get_settings
+
+    return get_settings().secret_key.encode()
 
 
 @lru_cache(maxsize=1)
-def _get_fernet() -> Fernet:
-    """Get or create Fernet instance with derived key.
-    
-    Uses SECRET_KEY from settings, hashed to 32 bytes for Fernet.
-    
+def _get_cipher() -> AESGCM:
+    """Get or create AES-GCM instance with derived key.
+
+    Uses SECRET_KEY from settings, expanded to a 256-bit key with HKDF so it
+    differs from the key used by legacy Fernet tokens.
+
     Returns:
-        Fernet instance for encryption/decryption
+        AESGCM instance for encryption/decryption
     """
-    from app.config import get_settings
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"cloudvid-bridge oauth token encryption",
+    ).derive(_get_secret_key())
+    return AESGCM(key)
 
-    settings = get_settings()
-    secret_key = settings.secret_key
 
+@lru_cache(maxsize=1)
+def _get_fernet() -> Fernet:
+    """Get or create Fernet instance for tokens stored by earlier releases.
+
+    Uses SECRET_KEY from settings, hashed to 32 bytes for Fernet.
+
+    Returns:
+        Fernet instance for decryption of legacy tokens
+    """
     # Derive a 32-byte key from SECRET_KEY using SHA-256
-    key_bytes = hashlib.sha256(secret_key.encode()).digest()
+    key_bytes = hashlib.sha256(_get_secret_key()).digest()
     # Fernet requires base64-encoded 32-byte key
-    fernet_key = base64.urlsafe_b64encode(key_bytes)
-
-    return Fernet(fernet_key)
+    return Fernet(base64.urlsafe_b64encode(key_bytes))
 
 
 def encrypt_token(plaintext: str) -> str:
     """Encrypt a token string.
-    
+
     Args:
         plaintext: The token to encrypt
-        
+
     Returns:
-        Base64-encoded encrypted token
+        Base64-encoded version byte, nonce and ciphertext with its tag
     """
-    fernet = _get_fernet()
-    encrypted_bytes = fernet.encrypt(plaintext.encode("utf-8"))
-    return encrypted_bytes.decode("utf-8")
+    return _seal(_get_cipher(), os.urandom(_NONCE_SIZE), plaintext)
+
+
+def encrypt_tokens(plaintexts: Sequence[str]) -> list[str]:
+    """Encrypt several token strings at once.
+
+    Draws every nonce from a single os.urandom call.
+
+    Args:
+        plaintexts: The tokens to encrypt
+
+    Returns:
+        Encrypted tokens, in the same order as the input
+    """
+    cipher = _get_cipher()
+    nonces = memoryview(os.urandom(_NONCE_SIZE * len(plaintexts)))
+    return [
+        _seal(cipher, nonces[i * _NONCE_SIZE : (i + 1) * _NONCE_SIZE].tobytes(), text)
+        for i, text in enumerate(plaintexts)
+    ]
 
 
 def decrypt_token(ciphertext: str) -> str:
     """Decrypt an encrypted token string.
-    
+
     Args:
         ciphertext: Base64-encoded encrypted token
-        
+
     Returns:
         Decrypted plaintext token
-        
+
     Raises:
         cryptography.fernet.InvalidToken: If decryption fails
     """
-    fernet = _get_fernet()
-    decrypted_bytes = fernet.decrypt(ciphertext.encode("utf-8"))
+    try:
+        data = base64.urlsafe_b64decode(ciphertext)
+    except (binascii.Error, ValueError) as e:
+        raise InvalidToken from e
+
+    if data[:1] == _AESGCM_VERSION:
+        nonce = data[1 : 1 + _NONCE_SIZE]
+        try:
+            decrypted_bytes = _get_cipher().decrypt(
+                nonce, data[1 + _NONCE_SIZE :], _AESGCM_VERSION
+            )
+        except (InvalidTag, ValueError) as e:
+            raise InvalidToken from e
+    elif data[:1] == bytes([_FERNET_VERSION]):
+        decrypted_bytes = _get_fernet().decrypt(ciphertext.encode("utf-8"))
+    else:
+        raise InvalidToken
+
     return decrypted_bytes.decode("utf-8")
 
 
-def clear_fernet_cache() -> None:
-    """Clear the cached Fernet instance.
-    
+def decrypt_tokens(ciphertexts: Sequence[str]) -> list[str]:
+    """Decrypt several encrypted token strings at once.
+
+    Args:
+        ciphertexts: Base64-encoded encrypted tokens
+
+    Returns:
+        Decrypted plaintext tokens, in the same order as the input
+
+    Raises:
+        cryptography.fernet.InvalidToken: If any decryption fails
+    """
+    return [decrypt_token(ciphertext) for ciphertext in ciphertexts]
+
+
+def _seal(cipher: AESGCM, nonce: bytes, plaintext: str) -> str:
+    """Encrypt one token with the given nonce and encode the stored form."""
+    sealed = cipher.encrypt(nonce, plaintext.encode("utf-8"), _AESGCM_VERSION)
+    return base64.urlsafe_b64encode(_AESGCM_VERSION + nonce + sealed).decode("ascii")
+
+
+def clear_cipher_cache() -> None:
+    """Clear the cached cipher instances.
+
     Useful for testing with different keys.
     """
+    _get_cipher.cache_clear()
     _get_fernet.cache_clear()
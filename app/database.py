@@ -3,6 +3,7 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+from sqlalchemy import Connection
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -95,13 +96,26 @@ async def get_db_context() -> AsyncGenerator[AsyncSession, None]:
 async def init_db() -> None:
     """Initialize database tables.
 
-    Creates all tables defined by models that inherit from Base.
+    Creates all tables defined by models that inherit from Base, plus any
+    indexes added to existing tables since they were created.
     """
     from app import models  # noqa: F401 - Import models to register them
 
     engine = get_engine()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _create_missing_indexes(connection: Connection) -> None:
+    """Create model indexes missing from tables that already existed.
+
+    create_all skips existing tables entirely, so indexes added to a model
+    later would otherwise never reach an existing database.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 
 async def close_db() -> None:
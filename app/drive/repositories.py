@@ -4,14 +4,14 @@ Provides low-level API access abstraction for Google Drive operations.
 This layer handles direct API calls while the Service layer handles business logic.
 """
 
-import io
+from collections.abc import AsyncIterator
 from typing import Any
 
 from anyio.to_thread import run_sync
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 
+from app.core.google_clients import get_api_client
 from app.core.protocols import DriveRepositoryProtocol
 from app.drive.schemas import DriveFile, DriveFolder, FileType
 
@@ -29,6 +29,28 @@ VIDEO_MIME_TYPES = {
 }
 
 
+class _ChunkSink:
+    """Write-only file object that keeps downloaded chunks as-is.
+
+    MediaIoBaseDownload only calls write(); collecting the response bytes
+    instead of writing them into a BytesIO avoids copying every chunk twice.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._parts.append(data)
+        return len(data)
+
+    def take(self) -> bytes:
+        """Return and clear everything written since the last call."""
+        # join() returns a single bytes part without copying it
+        data = b"".join(self._parts)
+        self._parts.clear()
+        return data
+
+
 class DriveRepository(DriveRepositoryProtocol):
     """Repository for Google Drive API operations.
 
@@ -43,7 +65,7 @@ class DriveRepository(DriveRepositoryProtocol):
             credentials: Google OAuth credentials
         """
         self._credentials = credentials
-        self._service = build("drive", "v3", credentials=credentials)
+        self._service = get_api_client("drive", "v3", credentials)
 
     @staticmethod
     async def _execute_async(request: Any, cancellable: bool = True) -> Any:
@@ -229,46 +251,31 @@ class DriveRepository(DriveRepositoryProtocol):
             total_videos=total_videos,
         )
 
-    def get_file_content_stream(
-        self, file_id: str
-    ) -> tuple[io.BytesIO, MediaIoBaseDownload]:
-        """Get a file content stream for downloading.
-
-        Note: This method is synchronous as it only creates the downloader.
-        The actual download (next_chunk calls) should be run in a thread pool.
-
-        Args:
-            file_id: Drive file ID
+    async def iter_file_chunks(
+        self, file_id: str, chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        """Download a file in chunks, yielding each chunk as it arrives.
 
-        Returns:
-            Tuple of (BytesIO buffer, MediaIoBaseDownload instance)
-        """
-        request = self._service.files().get_media(fileId=file_id)
-        buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(buffer, request)
-        return buffer, downloader
-
-    def download_to_file(
-        self, file_id: str, file_handle: io.IOBase
-    ) -> MediaIoBaseDownload:
-        """Download a file to a file handle (e.g., temp file).
-
-        This is more memory-efficient than get_file_content_stream for large files
-        as it writes directly to disk instead of holding the entire file in memory.
-
-        Note: This method is synchronous as it only creates the downloader.
-        The actual download (next_chunk calls) should be run in a thread pool.
+        Only the current chunk is held in memory, so callers can forward the
+        content (e.g., to a YouTube upload) while the download is in progress.
 
         Args:
             file_id: Drive file ID
-            file_handle: Writable file handle (e.g., open temp file in 'wb' mode)
+            chunk_size: Download chunk size in bytes
 
-        Returns:
-            MediaIoBaseDownload instance for chunked downloading
+        Yields:
+            Consecutive chunks of file content
         """
         request = self._service.files().get_media(fileId=file_id)
-        downloader = MediaIoBaseDownload(file_handle, request)
-        return downloader
+        sink = _ChunkSink()
+        downloader = MediaIoBaseDownload(sink, request, chunksize=chunk_size)
+
+        done = False
+        while not done:
+            _, done = await run_sync(downloader.next_chunk, cancellable=True)
+            chunk = sink.take()
+            if chunk:
+                yield chunk
 
     @staticmethod
     def _determine_file_type(mime_type: str) -> FileType:
@@ -4,6 +4,7 @@ Provides high-level operations for Google Drive, using the Repository layer
 for API access and implementing business logic like filtering and validation.
 """
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from google.oauth2.credentials import Credentials
@@ -97,30 +98,17 @@ class DriveService:
         """
         return await self._repository.scan_folder(folder_id, recursive, video_only)
 
-    def get_file_content_stream(self, file_id: str):
-        """Get a file content stream for downloading.
-
-        Note: This method is synchronous as it only creates the downloader.
-
-        Args:
-            file_id: Drive file ID
-
-        Returns:
-            Tuple of (BytesIO buffer, MediaIoBaseDownload instance)
-        """
-        return self._repository.get_file_content_stream(file_id)
-
-    def download_to_file(self, file_id: str, file_handle):
-        """Download a file to a file handle.
+    def iter_file_chunks(self, file_id: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Download a file in chunks, yielding each chunk as it arrives.
 
         Args:
             file_id: Drive file ID
-            file_handle: Writable file handle
+            chunk_size: Download chunk size in bytes
 
         Returns:
-            MediaIoBaseDownload instance
+            Async iterator over consecutive chunks of file content
         """
-        return self._repository.download_to_file(file_id, file_handle)
+        return self._repository.iter_file_chunks(file_id, chunk_size)
 
     async def get_file_metadata(self, file_id: str) -> dict[str, Any]:
         """Get file metadata including MD5 checksum.
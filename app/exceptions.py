@@ -66,6 +66,16 @@ class UploadError(CloudVidBridgeError):
         super().__init__(f"Upload failed for file {file_id}: {message}")
 
 
+class UploadStreamError(CloudVidBridgeError):
+    """Raised when a streamed upload body cannot serve the requested bytes.
+
+    This exception is raised when the upload asks for bytes that the
+    Drive-to-YouTube pipeline has already discarded, so the video cannot be
+    completed without restarting the transfer.
+    """
+    pass
+
+
 class DriveAccessError(CloudVidBridgeError):
     """Raised when Google Drive access fails.
 
@@ -84,6 +94,15 @@ class QueueError(CloudVidBridgeError):
     pass
 
 
+class PlaylistLookupError(CloudVidBridgeError):
+    """Raised when the uploads playlist for a channel cannot be resolved.
+
+    This exception is raised instead of silently falling back to search.list
+    (100 quota units), so callers must opt in to the expensive path explicitly.
+    """
+    pass
+
+
 class FileSizeExceededError(CloudVidBridgeError):
     """Raised when a file exceeds the maximum allowed size.
 
@@ -106,22 +125,3 @@ class FileSizeExceededError(CloudVidBridgeError):
             + (f": {file_name}" if file_name else "")
         )
 
-
-class InsufficientDiskSpaceError(CloudVidBridgeError):
-    """Raised when there's not enough disk space for temporary file storage.
-
-    This exception is raised when the available disk space is insufficient
-    to download and process a file.
-
-    Attributes:
-        required: Required disk space in bytes
-        available: Available disk space in bytes
-    """
-    def __init__(self, required: int, available: int):
-        self.required = required
-        self.available = available
-        req_gb = required / (1024 ** 3)
-        avail_gb = available / (1024 ** 3)
-        super().__init__(
-            f"Insufficient disk space: required {req_gb:.2f}GB, available {avail_gb:.2f}GB"
-        )
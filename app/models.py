@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import BigInteger, DateTime, Float, Integer, String, Text, func
+from sqlalchemy import BigInteger, DateTime, Float, Index, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -59,6 +59,11 @@ class QueueJobModel(Base):
     """
 
     __tablename__ = "queue_jobs"
+    # The worker polls pending jobs oldest first; this index serves both the
+    # status filter and the ordering, so the queue head is found without a sort
+    __table_args__ = (
+        Index("ix_queue_jobs_status_created_at", "status", "created_at"),
+    )
 
     # UUID stored as String(36) for SQLite compatibility
     # Type annotation uses str to match actual database type
@@ -77,7 +82,7 @@ class QueueJobModel(Base):
     batch_id: Mapped[str | None] = mapped_column(String(100), nullable=True, index=True)
     metadata_json: Mapped[str] = mapped_column(Text, nullable=False)  # VideoMetadata as JSON
     status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default="pending", index=True
+        String(20), nullable=False, default="pending"
     )  # pending, downloading, uploading, completed, failed, cancelled
     progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     message: Mapped[str] = mapped_column(Text, nullable=False, default="")
@@ -118,7 +123,7 @@ class OAuthToken(Base):
     """Encrypted OAuth token storage.
     
     Stores OAuth credentials with encryption for security.
-    Tokens are encrypted using Fernet symmetric encryption.
+    Tokens are encrypted using AES-GCM authenticated encryption.
     """
 
     __tablename__ = "oauth_tokens"
@@ -5,10 +5,12 @@ This layer handles direct database operations while the Service layer handles bu
 """
 
 import logging
+from collections.abc import Collection
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+import orjson
+from sqlalchemy import bindparam, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.protocols import QueueRepositoryProtocol
@@ -18,6 +20,27 @@ from app.youtube.schemas import VideoMetadata
 
 logger = logging.getLogger(__name__)
 
+# Statements run on every worker poll, built once. SQLAlchemy caches their
+# compiled SQL; reusing the objects also skips rebuilding them per call.
+_PENDING_JOBS_QUERY = (
+    select(QueueJobModel)
+    .where(QueueJobModel.status == JobStatus.PENDING.value)
+    .order_by(QueueJobModel.created_at.asc())
+)
+_NEXT_PENDING_JOB_QUERY = _PENDING_JOBS_QUERY.limit(1)
+_NEXT_PENDING_JOB_EXCLUDING_QUERY = _PENDING_JOBS_QUERY.where(
+    QueueJobModel.id.not_in(bindparam("exclude_ids", expanding=True))
+).limit(1)
+_ACTIVE_JOBS_QUERY = (
+    select(QueueJobModel)
+    .where(
+        QueueJobModel.status.in_(
+            [JobStatus.DOWNLOADING.value, JobStatus.UPLOADING.value]
+        )
+    )
+    .order_by(QueueJobModel.created_at.asc())
+)
+
 
 class QueueRepository(QueueRepositoryProtocol):
     """Repository for queue database operations.
@@ -45,14 +68,12 @@ class QueueRepository(QueueRepositoryProtocol):
         Returns:
             QueueJob schema
         """
-        import json
-
         metadata = None
         if model.metadata_json:
             try:
-                metadata_dict = json.loads(model.metadata_json)
+                metadata_dict = orjson.loads(model.metadata_json)
                 metadata = VideoMetadata(**metadata_dict)
-            except (json.JSONDecodeError, TypeError):
+            except (orjson.JSONDecodeError, TypeError):
                 pass
 
         return QueueJob(
@@ -91,12 +112,11 @@ class QueueRepository(QueueRepositoryProtocol):
         Returns:
             Created QueueJob
         """
-        import json
         from uuid import uuid4
 
         metadata_json = None
         if job_create.metadata:
-            metadata_json = json.dumps(job_create.metadata.model_dump())
+            metadata_json = orjson.dumps(job_create.metadata.model_dump()).decode()
 
         model = QueueJobModel(
             id=str(uuid4()),
@@ -120,6 +140,21 @@ class QueueRepository(QueueRepositoryProtocol):
         logger.info(f"Added job {model.id} for file {job_create.drive_file_name}")
         return self._model_to_schema(model)
 
+    async def _get_model(self, job_id: UUID | str) -> QueueJobModel | None:
+        """Load a job row by primary key.
+
+        session.get() returns a row already loaded in this session from the
+        identity map without a query, e.g. when the worker updates progress
+        of the job it is processing.
+
+        Args:
+            job_id: Job UUID
+
+        Returns:
+            QueueJobModel or None if not found
+        """
+        return await self._db.get(QueueJobModel, str(job_id))
+
     async def get_job(self, job_id: UUID) -> QueueJob | None:
         """Get a job by ID.
 
@@ -129,10 +164,7 @@ class QueueRepository(QueueRepositoryProtocol):
         Returns:
             QueueJob or None if not found
         """
-        result = await self._db.execute(
-            select(QueueJobModel).where(QueueJobModel.id == job_id)
-        )
-        model = result.scalars().first()
+        model = await self._get_model(job_id)
         return self._model_to_schema(model) if model else None
 
     async def update_job(
@@ -159,10 +191,7 @@ class QueueRepository(QueueRepositoryProtocol):
         Returns:
             Updated QueueJob or None if not found
         """
-        result = await self._db.execute(
-            select(QueueJobModel).where(QueueJobModel.id == job_id)
-        )
-        model = result.scalars().first()
+        model = await self._get_model(job_id)
 
         if not model:
             return None
@@ -195,10 +224,7 @@ class QueueRepository(QueueRepositoryProtocol):
         Returns:
             Cancelled QueueJob or None if not found or not cancellable
         """
-        result = await self._db.execute(
-            select(QueueJobModel).where(QueueJobModel.id == job_id)
-        )
-        model = result.scalars().first()
+        model = await self._get_model(job_id)
 
         if not model:
             return None
@@ -266,26 +292,28 @@ class QueueRepository(QueueRepositoryProtocol):
         Returns:
             List of pending QueueJobs
         """
-        result = await self._db.execute(
-            select(QueueJobModel)
-            .where(QueueJobModel.status == JobStatus.PENDING.value)
-            .order_by(QueueJobModel.created_at.asc())
-        )
+        result = await self._db.execute(_PENDING_JOBS_QUERY)
         models = result.scalars().all()
         return [self._model_to_schema(m) for m in models]
 
-    async def get_next_pending_job(self) -> QueueJob | None:
+    async def get_next_pending_job(
+        self, exclude_ids: Collection[UUID | str] | None = None
+    ) -> QueueJob | None:
         """Get the next pending job in queue order (FIFO).
 
+        Args:
+            exclude_ids: Job IDs to skip, e.g. jobs already being processed
+
         Returns:
             Next pending QueueJob or None
         """
-        result = await self._db.execute(
-            select(QueueJobModel)
-            .where(QueueJobModel.status == JobStatus.PENDING.value)
-            .order_by(QueueJobModel.created_at.asc())
-            .limit(1)
-        )
+        if exclude_ids:
+            result = await self._db.execute(
+                _NEXT_PENDING_JOB_EXCLUDING_QUERY,
+                {"exclude_ids": [str(i) for i in exclude_ids]},
+            )
+        else:
+            result = await self._db.execute(_NEXT_PENDING_JOB_QUERY)
         model = result.scalars().first()
         return self._model_to_schema(model) if model else None
 
@@ -295,12 +323,7 @@ class QueueRepository(QueueRepositoryProtocol):
         Returns:
             List of active QueueJobs
         """
-        active_statuses = [JobStatus.DOWNLOADING.value, JobStatus.UPLOADING.value]
-        result = await self._db.execute(
-            select(QueueJobModel)
-            .where(QueueJobModel.status.in_(active_statuses))
-            .order_by(QueueJobModel.created_at.asc())
-        )
+        result = await self._db.execute(_ACTIVE_JOBS_QUERY)
         models = result.scalars().all()
         return [self._model_to_schema(m) for m in models]
 
@@ -447,10 +470,7 @@ class QueueRepository(QueueRepositoryProtocol):
         Returns:
             Updated QueueJob or None if not found
         """
-        result = await self._db.execute(
-            select(QueueJobModel).where(QueueJobModel.id == job_id)
-        )
-        model = result.scalars().first()
+        model = await self._get_model(job_id)
 
         if not model:
             return None
@@ -7,8 +7,9 @@ from typing import TYPE_CHECKING, Any
 
 from app.auth.oauth import get_oauth_service
 from app.config import get_settings
+from app.exceptions import QuotaExceededError
 from app.queue.schemas import JobStatus, QueueJob
-from app.youtube.quota import get_quota_tracker
+from app.youtube.quota import QuotaReservation, get_quota_tracker
 from app.youtube.schemas import UploadProgress
 from app.youtube.service import YouTubeService
 
@@ -29,6 +30,13 @@ class QueueWorker:
         self.settings = get_settings()
         self._running = False
         self._task: asyncio.Task[Any] | None = None
+        # Each job holds one slot until it finishes, so up to
+        # max_concurrent_uploads jobs download and upload at the same time.
+        self._upload_slots = asyncio.Semaphore(self.settings.max_concurrent_uploads)
+        self._in_flight: set[Any] = set()
+        self._job_tasks: set[asyncio.Task[None]] = set()
+        # Set once the processing loop is running, so callers can wait on it
+        self._loop_started = asyncio.Event()
 
     async def start(self) -> None:
         """Start the background worker."""
@@ -37,6 +45,7 @@ class QueueWorker:
             return
 
         self._running = True
+        self._loop_started.clear()
         self._task = asyncio.create_task(self._process_loop())
         logger.info("Queue worker started")
 
@@ -49,8 +58,61 @@ class QueueWorker:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        for task in self._job_tasks:
+            task.cancel()
+        if self._job_tasks:
+            await asyncio.gather(*self._job_tasks, return_exceptions=True)
         logger.info("Queue worker stopped")
 
+    def _spawn_job(
+        self, job_id: Any, reservation: QuotaReservation
+    ) -> asyncio.Task[None]:
+        """Run a job in the background while holding an upload slot.
+
+        The caller must have acquired a slot from ``_upload_slots``; it is
+        released when the job finishes, fails, or is cancelled. The quota
+        reservation is committed by a successful upload and refunded
+        otherwise.
+
+        Args:
+            job_id: Job UUID to process
+            reservation: videos.insert quota held for this job
+
+        Returns:
+            Task running the job
+        """
+        self._in_flight.add(job_id)
+        task = asyncio.create_task(self._process_job(job_id, reservation))
+        self._job_tasks.add(task)
+
+        def _on_done(done: asyncio.Task[None]) -> None:
+            self._job_tasks.discard(done)
+            self._in_flight.discard(job_id)
+            # No-op after a successful upload committed it
+            reservation.rollback()
+            self._upload_slots.release()
+            if not done.cancelled() and done.exception() is not None:
+                logger.error(
+                    "Job %s failed", job_id, exc_info=done.exception()
+                )
+
+        task.add_done_callback(_on_done)
+        return task
+
+    async def _next_job_id(self) -> Any | None:
+        """Get the next pending job that is not already being processed.
+
+        Returns:
+            Job UUID or None if no pending job is available
+        """
+        from app.database import get_db_context
+        from app.queue.repositories import QueueRepository
+
+        async with get_db_context() as db:
+            repo = QueueRepository(db)
+            next_job = await repo.get_next_pending_job(exclude_ids=self._in_flight)
+            return next_job.id if next_job else None
+
     async def _process_loop(self) -> None:
         """Main processing loop."""
         from app.database import get_db_context
@@ -59,6 +121,7 @@ class QueueWorker:
         # Maximum wait time when quota exhausted (1 hour)
         max_quota_wait_seconds = 3600
 
+        self._loop_started.set()
         while self._running:
             try:
                 # Check quota before attempting to process any jobs
@@ -74,31 +137,59 @@ class QueueWorker:
                     await asyncio.sleep(max_quota_wait_seconds)
                     continue
 
-                async with get_db_context() as db:
-                    repo = QueueRepository(db)
-                    # Check for pending jobs
-                    active_jobs = await repo.get_active_jobs()
-                    if len(active_jobs) >= self.settings.max_concurrent_uploads:
-                        await asyncio.sleep(5)
-                        continue
-
-                    next_job = await repo.get_next_pending_job()
-                    if not next_job:
-                        await asyncio.sleep(5)
-                        continue
+                await self._upload_slots.acquire()
+                reservation: QuotaReservation | None = None
+                wait_seconds = 5
+                try:
+                    # Jobs started by other processes count against the limit
+                    async with get_db_context() as db:
+                        repo = QueueRepository(db)
+                        active_jobs = await repo.get_active_jobs()
+                    external = len(
+                        [j for j in active_jobs if j.id not in self._in_flight]
+                    )
+                    at_capacity = (
+                        len(self._in_flight) + external
+                        >= self.settings.max_concurrent_uploads
+                    )
+                    job_id = None if at_capacity else await self._next_job_id()
+                    if job_id is not None:
+                        # Hold the insert cost before starting, so concurrent
+                        # jobs cannot all pass the check and then overspend
+                        reservation = quota_tracker.reserve("videos.insert")
+                except QuotaExceededError as e:
+                    wait_seconds = max_quota_wait_seconds
+                    logger.warning(
+                        "Quota exhausted (remaining=%d). "
+                        "Waiting %d seconds before checking again.",
+                        e.remaining,
+                        max_quota_wait_seconds,
+                    )
+                except BaseException:
+                    self._upload_slots.release()
+                    raise
+
+                # Release and wait outside the try, so a cancellation during
+                # the sleep cannot release the slot a second time
+                if reservation is None:
+                    self._upload_slots.release()
+                    await asyncio.sleep(wait_seconds)
+                    continue
 
-                    # Process the job
-                    await self._process_job(next_job.id)
+                self._spawn_job(job_id, reservation)
 
             except Exception:
                 logger.exception("Error in worker loop")
                 await asyncio.sleep(5)
 
-    async def _process_job(self, job_id: Any) -> None:
+    async def _process_job(
+        self, job_id: Any, reservation: QuotaReservation | None = None
+    ) -> None:
         """Process a single upload job with a single DB session.
 
         Args:
             job_id: Job UUID to process
+            reservation: videos.insert quota already held for this job
         """
         from app.database import get_db_context
         from app.drive.services import DriveService
@@ -185,6 +276,7 @@ class QueueWorker:
                     metadata=job.metadata,
                     progress_callback=progress_callback,
                     drive_credentials=credentials,
+                    reservation=reservation,
                 )
 
                 if result.success:
@@ -319,7 +411,8 @@ class QueueWorker:
 
         This method is designed for Heroku Scheduler or cron-like execution.
         It processes all pending jobs and then exits, rather than running
-        continuously like the main worker loop.
+        continuously like the main worker loop. Up to
+        ``max_concurrent_uploads`` jobs run at the same time.
 
         Args:
             max_jobs: Maximum number of jobs to process (0 = unlimited)
@@ -327,9 +420,6 @@ class QueueWorker:
         Returns:
             Number of jobs processed
         """
-        from app.database import get_db_context
-        from app.queue.repositories import QueueRepository
-
         processed = 0
         logger.info("Starting batch processing...")
 
@@ -350,20 +440,32 @@ class QueueWorker:
                     logger.info("Reached max jobs limit (%d)", max_jobs)
                     break
 
-                # Get next pending job
-                async with get_db_context() as db:
-                    repo = QueueRepository(db)
-                    next_job = await repo.get_next_pending_job()
+                await self._upload_slots.acquire()
+                try:
+                    job_id = await self._next_job_id()
+                except BaseException:
+                    self._upload_slots.release()
+                    raise
 
-                    if not next_job:
-                        logger.info("No more pending jobs.")
-                        break
+                if job_id is None:
+                    self._upload_slots.release()
+                    logger.info("No more pending jobs.")
+                    break
 
-                # Process the job
-                await self._process_job(next_job.id)
+                # Hold the insert cost before starting, so concurrent jobs
+                # cannot all pass the check and then overspend
+                try:
+                    reservation = quota_tracker.reserve("videos.insert")
+                except QuotaExceededError:
+                    self._upload_slots.release()
+                    logger.warning("Quota exhausted during batch processing.")
+                    break
+
+                # Process the job alongside the others already running
+                self._spawn_job(job_id, reservation)
                 processed += 1
 
-                # Re-check quota after each job
+                # Re-check quota before starting another job
                 if not quota_tracker.can_perform("videos.insert"):
                     logger.warning("Quota exhausted during batch processing.")
                     break
@@ -371,6 +473,10 @@ class QueueWorker:
         except Exception:
             logger.exception("Error during batch processing")
 
+        # Let jobs that are already running finish before exiting
+        if self._job_tasks:
+            await asyncio.gather(*self._job_tasks, return_exceptions=True)
+
         logger.info("Batch complete. Processed %d jobs.", processed)
         return processed
 
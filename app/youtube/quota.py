@@ -9,9 +9,48 @@ from datetime import datetime
 from threading import Lock
 from zoneinfo import ZoneInfo
 
+from app.exceptions import QuotaExceededError
+
 logger = logging.getLogger(__name__)
 
 
+class QuotaReservation:
+    """Quota units held for an in-flight API operation.
+
+    Returned by QuotaTracker.reserve(). Exactly one of commit() or
+    rollback() takes effect; later calls are no-ops, so a rollback in a
+    ``finally`` block is safe after a successful commit. Reservations
+    issued before QuotaTracker.reset() are ignored when settled.
+    """
+
+    def __init__(
+        self,
+        tracker: "QuotaTracker",
+        operation: str,
+        count: int,
+        cost: int,
+        generation: int,
+    ) -> None:
+        self._tracker = tracker
+        self.operation = operation
+        self.count = count
+        self.cost = cost
+        self.generation = generation
+        self._settled = False
+
+    def commit(self) -> None:
+        """Record the reserved operation as used quota."""
+        if not self._settled:
+            self._settled = True
+            self._tracker._settle(self, used=True)
+
+    def rollback(self) -> None:
+        """Release the reserved units without recording usage."""
+        if not self._settled:
+            self._settled = True
+            self._tracker._settle(self, used=False)
+
+
 class QuotaTracker:
     """Track YouTube API quota usage.
     
@@ -51,6 +90,8 @@ class QuotaTracker:
         self._lock = Lock()
         self._reset_date: str | None = None
         self._daily_total: int = 0  # Cached daily total
+        self._reserved: int = 0  # Units held by in-flight reservations
+        self._generation: int = 0  # Bumped by reset() to orphan reservations
 
     @staticmethod
     def _get_today_key() -> str:
@@ -108,16 +149,20 @@ class QuotaTracker:
             Total units used today
         """
         self._check_reset()
-        with self._lock:
-            return self._daily_total  # Return cached value
+        # A single attribute read is atomic; only compound updates need the lock
+        return self._daily_total
 
     def get_remaining_quota(self) -> int:
         """Get remaining quota for today.
         
+        Units held by outstanding reservations count as spent.
+
         Returns:
             Estimated remaining units
         """
-        return max(0, self._daily_limit - self.get_daily_usage())
+        self._check_reset()
+        with self._lock:
+            return max(0, self._daily_limit - self._daily_total - self._reserved)
 
     def get_usage_summary(self) -> dict:
         """Get detailed usage summary.
@@ -131,6 +176,7 @@ class QuotaTracker:
         with self._lock:
             today_usage = dict(self._usage.get(today, {}))
             total = self._daily_total  # Use cached value
+            reserved = self._reserved
 
         breakdown = {}
         for op, count in today_usage.items():
@@ -145,7 +191,8 @@ class QuotaTracker:
             "date": today,
             "total_used": total,
             "daily_limit": self._daily_limit,
-            "remaining": max(0, self._daily_limit - total),
+            "reserved": reserved,
+            "remaining": max(0, self._daily_limit - total - reserved),
             "usage_percentage": round(total / self._daily_limit * 100, 2),
             "breakdown": breakdown,
         }
@@ -163,6 +210,61 @@ class QuotaTracker:
         cost = self.QUOTA_COSTS.get(operation, 1) * count
         return self.get_remaining_quota() >= cost
 
+    def reset(self) -> None:
+        """Discard all recorded usage and outstanding reservations.
+
+        Reservations issued before the reset become no-ops when settled.
+        """
+        with self._lock:
+            self._usage = defaultdict(lambda: defaultdict(int))
+            self._reset_date = None
+            self._daily_total = 0
+            self._reserved = 0
+            self._generation += 1
+
+    def reserve(self, operation: str, count: int = 1) -> QuotaReservation:
+        """Atomically hold quota for an operation before performing it.
+
+        Unlike can_perform() followed by track(), concurrent callers cannot
+        both pass the check and then overspend the daily limit.
+
+        Args:
+            operation: API operation name
+            count: Number of times to perform
+
+        Returns:
+            QuotaReservation to commit on success or roll back on failure
+
+        Raises:
+            QuotaExceededError: If the remaining quota cannot cover the cost
+        """
+        self._check_reset()
+        cost = self.QUOTA_COSTS.get(operation, 1) * count
+
+        with self._lock:
+            remaining = max(0, self._daily_limit - self._daily_total - self._reserved)
+            if remaining < cost:
+                raise QuotaExceededError(remaining=remaining, required=cost)
+            self._reserved += cost
+            generation = self._generation
+
+        logger.debug("Reserved %d units for %s x%d", cost, operation, count)
+        return QuotaReservation(self, operation, count, cost, generation)
+
+    def _settle(self, reservation: QuotaReservation, used: bool) -> None:
+        """Release a reservation, recording its usage when used is True."""
+        self._check_reset()
+        today = self._get_today_key()
+
+        with self._lock:
+            # reset() already dropped the units this reservation held
+            if reservation.generation != self._generation:
+                return
+            self._reserved -= reservation.cost
+            if used:
+                self._usage[today][reservation.operation] += reservation.count
+                self._daily_total += reservation.cost
+
 
 # Module-level singleton
 _quota_tracker: QuotaTracker | None = None
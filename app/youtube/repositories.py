@@ -9,11 +9,11 @@ import logging
 from typing import Any
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 
 from app.config import get_settings
+from app.core.google_clients import get_api_client
 from app.core.protocols import YouTubeRepositoryProtocol
 from app.youtube.schemas import UploadResult, VideoMetadata
 
@@ -29,6 +29,7 @@ class YouTubeRepository(YouTubeRepositoryProtocol):
 
     YOUTUBE_API_SERVICE_NAME = "youtube"
     YOUTUBE_API_VERSION = "v3"
+    _PARTS_VIDEO_INSERT = "snippet,status"
 
     def __init__(self, credentials: Credentials) -> None:
         """Initialize YouTube repository with credentials.
@@ -37,10 +38,8 @@ class YouTubeRepository(YouTubeRepositoryProtocol):
             credentials: Google OAuth credentials
         """
         self._credentials = credentials
-        self._service = build(
-            self.YOUTUBE_API_SERVICE_NAME,
-            self.YOUTUBE_API_VERSION,
-            credentials=credentials,
+        self._service = get_api_client(
+            self.YOUTUBE_API_SERVICE_NAME, self.YOUTUBE_API_VERSION, credentials
         )
         self._settings = get_settings()
         self._uploads_playlist_cache: str | None = None
@@ -75,18 +74,7 @@ class YouTubeRepository(YouTubeRepositoryProtocol):
         """
         import asyncio
 
-        body = {
-            "snippet": {
-                "title": metadata.title,
-                "description": metadata.description,
-                "tags": metadata.tags,
-                "categoryId": metadata.category_id,
-            },
-            "status": {
-                "privacyStatus": metadata.privacy_status.value,
-                "selfDeclaredMadeForKids": metadata.made_for_kids,
-            },
-        }
+        body = metadata.to_youtube_body()
 
         media = MediaIoBaseUpload(
             file_stream,
@@ -97,7 +85,7 @@ class YouTubeRepository(YouTubeRepositoryProtocol):
 
         try:
             request = self._service.videos().insert(
-                part="snippet,status",
+                part=self._PARTS_VIDEO_INSERT,
                 body=body,
                 media_body=media,
                 notifySubscribers=metadata.notify_subscribers,
@@ -145,18 +133,7 @@ class YouTubeRepository(YouTubeRepositoryProtocol):
         """
         import asyncio
 
-        body = {
-            "snippet": {
-                "title": metadata.title,
-                "description": metadata.description,
-                "tags": metadata.tags,
-                "categoryId": metadata.category_id,
-            },
-            "status": {
-                "privacyStatus": metadata.privacy_status.value,
-                "selfDeclaredMadeForKids": metadata.made_for_kids,
-            },
-        }
+        body = metadata.to_youtube_body()
 
         media = MediaFileUpload(
             file_path,
@@ -167,7 +144,7 @@ class YouTubeRepository(YouTubeRepositoryProtocol):
 
         try:
             request = self._service.videos().insert(
-                part="snippet,status",
+                part=self._PARTS_VIDEO_INSERT,
                 body=body,
                 media_body=media,
                 notifySubscribers=metadata.notify_subscribers,
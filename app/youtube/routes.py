@@ -11,6 +11,27 @@ from app.youtube.service import YouTubeService
 router = APIRouter(prefix="/youtube", tags=["youtube"])
 
 
+def _to_youtube_video(item: dict) -> YouTubeVideo:
+    """Convert a search.list result item to a YouTubeVideo.
+
+    Args:
+        item: search.list result item
+
+    Returns:
+        YouTubeVideo schema
+    """
+    snippet = item.get("snippet", {})
+    thumbnails = snippet.get("thumbnails", {})
+    return YouTubeVideo(
+        id=item.get("id", {}).get("videoId", ""),
+        title=snippet.get("title", ""),
+        description=snippet.get("description"),
+        thumbnail_url=thumbnails.get("default", {}).get("url"),
+        channel_id=snippet.get("channelId"),
+        published_at=snippet.get("publishedAt"),
+    )
+
+
 @router.get("/channel")
 async def get_channel_info(
     service: YouTubeService = Depends(get_youtube_service),
@@ -50,24 +71,7 @@ async def list_my_videos(
     """
     try:
         items = service.list_my_videos(max_results)
-        videos = []
-        for item in items:
-            snippet = item.get("snippet", {})
-            video_id = item.get("id", {}).get("videoId", "")
-            thumbnails = snippet.get("thumbnails", {})
-            thumbnail_url = thumbnails.get("default", {}).get("url")
-
-            videos.append(
-                YouTubeVideo(
-                    id=video_id,
-                    title=snippet.get("title", ""),
-                    description=snippet.get("description"),
-                    thumbnail_url=thumbnail_url,
-                    channel_id=snippet.get("channelId"),
-                    published_at=snippet.get("publishedAt"),
-                )
-            )
-        return videos
+        return [_to_youtube_video(item) for item in items]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -75,6 +79,35 @@ async def list_my_videos(
         ) from e
 
 
+@router.get("/dashboard")
+async def get_dashboard(
+    max_results: int = Query(
+        default=25, ge=1, le=50, description="Max videos to return"
+    ),
+    service: YouTubeService = Depends(get_youtube_service),
+) -> dict:
+    """Get channel information and recent videos in a single API round-trip.
+
+    Args:
+        max_results: Maximum number of videos to return
+        service: YouTubeService (injected via DI)
+
+    Returns:
+        Dict with channel information and list of YouTube videos
+    """
+    try:
+        snapshot = service.get_dashboard_snapshot(max_results)
+        return {
+            "channel": snapshot["channel"],
+            "videos": [_to_youtube_video(item) for item in snapshot["videos"]],
+        }
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to load dashboard: {e!s}",
+        ) from e
+
+
 @router.post("/upload", response_model=UploadResult)
 async def upload_video(
     request: UploadRequest,
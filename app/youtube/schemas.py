@@ -1,6 +1,7 @@
 """Pydantic schemas for YouTube."""
 
 from enum import Enum
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -55,6 +56,28 @@ class VideoMetadata(BaseModel):
         default=False, description="Whether to notify subscribers"
     )
 
+    def to_youtube_body(self) -> dict[str, Any]:
+        """Build the videos.insert request body (snippet and status parts).
+
+        Built by hand rather than with model_dump(), which is slower and
+        would still need reshaping into the API's nested camelCase layout.
+
+        Returns:
+            Request body dict
+        """
+        return {
+            "snippet": {
+                "title": self.title,
+                "description": self.description,
+                "tags": self.tags,
+                "categoryId": self.category_id,
+            },
+            "status": {
+                "privacyStatus": self.privacy_status.value,
+                "selfDeclaredMadeForKids": self.made_for_kids,
+            },
+        }
+
 
 class UploadRequest(BaseModel):
     """Request to upload a video from Drive to YouTube."""
@@ -1,29 +1,33 @@
 """YouTube service for video uploads."""
 
 import asyncio
+import collections
+import functools
+import hashlib
 import io
-import json
 import logging
-import os
-import shutil
-import tempfile
+import random
+import re
+import time
 from collections.abc import Awaitable, Callable
+from pathlib import Path
 from typing import Any
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+from googleapiclient.http import MediaIoBaseUpload, MediaUpload
 
 from app.auth.oauth import get_oauth_service
 from app.config import get_settings
+from app.core.google_clients import get_api_client
 from app.drive.services import DriveService
 from app.exceptions import (
+    DriveAccessError,
     FileSizeExceededError,
-    InsufficientDiskSpaceError,
-    QuotaExceededError,
+    PlaylistLookupError,
+    UploadStreamError,
 )
-from app.youtube.quota import get_quota_tracker
+from app.youtube.quota import QuotaReservation, get_quota_tracker
 from app.youtube.schemas import (
     UploadProgress,
     UploadResult,
@@ -35,65 +39,421 @@ AsyncProgressCallback = Callable[[UploadProgress], Awaitable[None]]
 
 logger = logging.getLogger(__name__)
 
+# Resumable upload chunks must be a multiple of 256 KiB
+UPLOAD_CHUNK_ALIGNMENT = 256 * 1024
+# Bounds for automatically scaled chunk sizes
+MIN_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+MAX_UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Max downloaded chunks buffered between the Drive download and YouTube upload
+PIPELINE_QUEUE_SIZE = 2
+
+# Minimum progress delta (in percent) between progress callbacks
+PROGRESS_REPORT_STEP = 1.0
+
+# Chunk failures worth resuming the upload session for, and the backoff cap
+_RETRYABLE_CHUNK_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_CHUNK_RETRY_DELAY = 60.0
+
+# Matches retryable quota/rate-limit reasons in an HttpError JSON body
+_RETRYABLE_REASON_PATTERN = re.compile(
+    rb'"reason"\s*:\s*"(quotaExceeded|rateLimitExceeded|userRateLimitExceeded)"'
+)
+
 
 def _is_retryable_error(exception: BaseException) -> bool:
     """Check if an error is retryable (quota/rate limit).
-    
+
     Args:
         exception: The exception to check
-        
+
     Returns:
         True if the error should trigger a retry
     """
-    if isinstance(exception, HttpError):
-        # 403 = quota exceeded, 429 = rate limit
-        if exception.resp.status in [403, 429]:
-            error_reason = ""
-            try:
-                error_content = json.loads(exception.content.decode("utf-8"))
-                error_reason = (
-                    error_content.get("error", {})
-                    .get("errors", [{}])[0]
-                    .get("reason", "")
-                )
-            except (json.JSONDecodeError, KeyError, IndexError, UnicodeDecodeError) as e:
-                logger.warning("Could not parse HttpError content for retry check: %s", e)
-
-            # Retry on quota/rate limit errors, but not on permission errors
-            if error_reason in ["quotaExceeded", "rateLimitExceeded", "userRateLimitExceeded"]:
-                logger.warning(
-                    "Retryable API error: status=%s, reason=%s",
-                    exception.resp.status,
-                    error_reason,
-                )
-                return True
-
-            # 429 is always rate limit
-            if exception.resp.status == 429:
-                return True
+    if not isinstance(exception, HttpError):
+        return False
+
+    # 429 is always rate limit
+    if exception.resp.status == 429:
+        return True
+
+    # 403 = quota exceeded or permission error; only the former is retryable.
+    # The verdict is stored on the exception so repeated retry decisions on
+    # the same failure skip the body scan and log the reason only once.
+    if exception.resp.status == 403:
+        cached = getattr(exception, "_retryable_cached", None)
+        if cached is not None:
+            return cached
+
+        content = exception.content if isinstance(exception.content, bytes) else b""
+        match = _RETRYABLE_REASON_PATTERN.search(content)
+        if match:
+            logger.warning(
+                "Retryable API error: status=%s, reason=%s",
+                exception.resp.status,
+                match.group(1).decode("ascii"),
+            )
+        exception._retryable_cached = match is not None
+        return exception._retryable_cached
 
     return False
 
 
+def _chunk_retry_delay(error: HttpError, attempt: int) -> float | None:
+    """Get the wait before resuming an upload session after a failed chunk.
+
+    Args:
+        error: Error raised by next_chunk() after its own retries
+        attempt: Number of consecutive failures before this one
+
+    Returns:
+        Seconds to wait, or None if the error should abort the upload
+    """
+    if error.resp.status not in _RETRYABLE_CHUNK_STATUSES:
+        return None
+    retry_after = error.resp.get("retry-after")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_CHUNK_RETRY_DELAY)
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    return min(2**attempt + random.random(), MAX_CHUNK_RETRY_DELAY)
+
+
+class _ProgressThrottle:
+    """Decides which upload progress updates reach the progress callback.
+
+    Each callback typically writes and commits the job row, so updates are
+    limited to PROGRESS_REPORT_STEP deltas and at most ``update_hz`` per
+    second. The first and the final (100%) update are always reported.
+    """
+
+    __slots__ = ("_min_interval", "_last_progress", "_last_time")
+
+    def __init__(self, update_hz: float) -> None:
+        """Initialize the throttle.
+
+        Args:
+            update_hz: Maximum callbacks per second (0 disables the time limit)
+        """
+        self._min_interval = 1.0 / update_hz if update_hz > 0 else 0.0
+        self._last_progress = -PROGRESS_REPORT_STEP
+        self._last_time = float("-inf")
+
+    def ready(self, progress: float) -> bool:
+        """Check if a progress update should be reported, recording it if so.
+
+        Args:
+            progress: Current progress percentage
+
+        Returns:
+            True if a progress callback should be invoked
+        """
+        if progress < 100.0 and progress - self._last_progress < PROGRESS_REPORT_STEP:
+            return False
+        now = time.monotonic()
+        if progress < 100.0 and now - self._last_time < self._min_interval:
+            return False
+        self._last_progress = progress
+        self._last_time = now
+        return True
+
+
+def _upload_progress(
+    file_id: str, progress: float, bytes_uploaded: int, total_bytes: int
+) -> UploadProgress:
+    """Build an "uploading" progress report without re-validating fields.
+
+    Args:
+        file_id: File ID for progress tracking
+        progress: Progress percentage
+        bytes_uploaded: Bytes acknowledged by YouTube so far
+        total_bytes: Size of the video file in bytes
+
+    Returns:
+        UploadProgress for the progress callback
+    """
+    return UploadProgress.model_construct(
+        file_id=file_id,
+        status="uploading",
+        progress=progress,
+        bytes_uploaded=bytes_uploaded,
+        total_bytes=total_bytes,
+        message=f"Uploading to YouTube: {progress:.1f}%",
+    )
+
+
+class _QueueMediaUpload(MediaUpload):
+    """Resumable media body fed by an asyncio queue of downloaded chunks.
+
+    prefetch() is awaited on the event loop before each next_chunk() so the
+    executor thread running the request only spends time on the HTTP PUT,
+    never waiting for Drive. Bytes before the requested offset are
+    acknowledged by YouTube and discarded, so memory stays bounded to the
+    queue plus one upload chunk.
+    """
+
+    def __init__(
+        self,
+        queue: "asyncio.Queue[bytes | BaseException | None]",
+        loop: asyncio.AbstractEventLoop,
+        size: int,
+        mimetype: str,
+        chunksize: int,
+        resumable: bool = True,
+    ) -> None:
+        super().__init__()
+        self._queue = queue
+        self._loop = loop
+        self._size = size
+        self._mimetype = mimetype
+        # A single-chunk upload still has to be read through the buffer
+        self._chunksize = chunksize if chunksize > 0 else max(size, 1)
+        self._resumable = resumable
+        # Downloaded chunks are kept as-is (no concatenation into one buffer),
+        # so each byte is copied once, when getbytes() assembles a request body
+        self._chunks: collections.deque[memoryview] = collections.deque()
+        self._buffered = 0  # Total bytes held in self._chunks
+        self._buffer_offset = 0  # File offset of self._chunks[0][0]
+        self._eof = False
+
+    def chunksize(self) -> int:
+        return self._chunksize
+
+    def mimetype(self) -> str:
+        return self._mimetype
+
+    def size(self) -> int:
+        return self._size
+
+    def resumable(self) -> bool:
+        return self._resumable
+
+    def _discard_before(self, begin: int) -> None:
+        if begin < self._buffer_offset:
+            raise UploadStreamError(
+                f"Cannot rewind streamed upload to {begin} "
+                f"(already discarded up to {self._buffer_offset})"
+            )
+        drop = min(begin - self._buffer_offset, self._buffered)
+        self._buffer_offset = begin
+        self._buffered -= drop
+        while drop:
+            head = self._chunks[0]
+            if len(head) <= drop:
+                self._chunks.popleft()
+                drop -= len(head)
+            else:
+                self._chunks[0] = head[drop:]
+                drop = 0
+
+    def _accept(self, item: "bytes | BaseException | None") -> None:
+        if item is None:
+            self._eof = True
+        elif isinstance(item, BaseException):
+            raise item
+        elif item:
+            self._chunks.append(memoryview(item))
+            self._buffered += len(item)
+
+    async def prefetch(self, begin: int) -> None:
+        """Buffer the chunk starting at begin without blocking a thread.
+
+        Args:
+            begin: File offset the next chunk starts at
+        """
+        self._discard_before(begin)
+        while not self._eof and self._buffered < self._chunksize:
+            self._accept(await self._queue.get())
+
+    def getbytes(self, begin: int, length: int) -> bytes:
+        self._discard_before(begin)
+        # Normally satisfied by prefetch(); block on the loop only as a fallback
+        while not self._eof and self._buffered < length:
+            self._accept(
+                asyncio.run_coroutine_threadsafe(self._queue.get(), self._loop).result()
+            )
+        pieces = []
+        remaining = length
+        for chunk in self._chunks:
+            if remaining <= 0:
+                break
+            pieces.append(chunk[:remaining])
+            remaining -= len(chunk)
+        # A request that lines up with one downloaded chunk needs no copy at all
+        if len(pieces) == 1:
+            (head,) = pieces
+            if isinstance(head.obj, bytes) and len(head) == len(head.obj):
+                return head.obj
+        return b"".join(pieces)
+
+
+def _credentials_cache_key(credentials: Credentials) -> str | None:
+    """Derive a stable, non-reversible cache key for a set of credentials.
+
+    The refresh token is preferred because it survives access-token refreshes.
+
+    Args:
+        credentials: Google OAuth credentials
+
+    Returns:
+        Short hex digest, or None if the credentials carry no usable token
+    """
+    secret = getattr(credentials, "refresh_token", None)
+    if not isinstance(secret, str) or not secret:
+        secret = getattr(credentials, "token", None)
+    if not isinstance(secret, str) or not secret:
+        return None
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16]
+
+
+# Uploads playlist IDs resolved in this process, keyed by _credentials_cache_key.
+# Only successful lookups are stored, so a transient failure is retried.
+_uploads_playlist_ids: dict[str, str] = {}
+
+
 class YouTubeService:
     """Service for interacting with YouTube Data API."""
 
     YOUTUBE_API_SERVICE_NAME = "youtube"
     YOUTUBE_API_VERSION = "v3"
 
+    # Resource parts requested by each call
+    _PARTS_VIDEO_INSERT = "snippet,status"
+    _PARTS_VIDEO_EXISTS = "id"  # Minimal fields to reduce data transfer
+    _PARTS_VIDEO_BATCH = "snippet,contentDetails,status"
+    _PARTS_CHANNEL_INFO = "snippet,statistics"
+    _PARTS_CHANNEL_UPLOADS = "contentDetails"
+    _PARTS_PLAYLIST_ITEMS = "snippet,contentDetails"
+    _PARTS_SEARCH = "snippet"
+    # Partial-response masks: only the fields callers and routes read
+    _FIELDS_CHANNEL_INFO = (
+        "items(id,snippet(title,description,customUrl,thumbnails),statistics)"
+    )
+    _FIELDS_SEARCH = (
+        "items(id/videoId,snippet(title,description,channelId,publishedAt,"
+        "thumbnails/default))"
+    )
+
     def __init__(self, credentials: Credentials) -> None:
         """Initialize YouTube service with credentials.
 
         Args:
             credentials: Google OAuth credentials
         """
-        self.service = build(
-            self.YOUTUBE_API_SERVICE_NAME,
-            self.YOUTUBE_API_VERSION,
-            credentials=credentials,
+        self.service = get_api_client(
+            self.YOUTUBE_API_SERVICE_NAME, self.YOUTUBE_API_VERSION, credentials
         )
+        self.credentials = credentials
         self.settings = get_settings()
-        self._uploads_playlist_cache: str | None = None  # Cache for uploads playlist ID
+        self._quota = get_quota_tracker()
+        # Cache for uploads playlist ID (persisted across restarts)
+        self._uploads_playlist_cache: str | None = self._load_uploads_playlist_id()
+
+    @functools.cached_property
+    def _drive(self) -> DriveService:
+        """Drive service bound to this service's credentials (created lazily)."""
+        return DriveService(credentials=self.credentials)
+
+    # Each service.<resource>() call builds a new Resource wrapper, so keep one
+    @functools.cached_property
+    def _videos(self) -> Any:
+        """videos resource of the API client."""
+        return self.service.videos()
+
+    @functools.cached_property
+    def _channels(self) -> Any:
+        """channels resource of the API client."""
+        return self.service.channels()
+
+    @functools.cached_property
+    def _playlist_items(self) -> Any:
+        """playlistItems resource of the API client."""
+        return self.service.playlistItems()
+
+    def _get_chunk_size(self, file_size: int) -> int:
+        """Choose the resumable upload chunk size for a file.
+
+        Each chunk is a separate HTTP round-trip, so large files use chunks of
+        roughly 1/8 of the file (between 8 MiB and 64 MiB, and never below
+        ``upload_chunk_size``). Chunks never exceed the file itself, and files
+        up to ``single_request_threshold`` are sent in one request.
+
+        Args:
+            file_size: Size of the video file in bytes
+
+        Returns:
+            Chunk size in bytes, or -1 to upload as a single chunk
+        """
+        if 0 < file_size <= self.settings.single_request_threshold:
+            return -1
+        scaled = max(
+            MIN_UPLOAD_CHUNK_SIZE,
+            self.settings.upload_chunk_size,
+            min(MAX_UPLOAD_CHUNK_SIZE, file_size // 8),
+        )
+        if file_size > 0:
+            scaled = min(scaled, file_size)
+        # Round up to the alignment resumable uploads require
+        return -(-scaled // UPLOAD_CHUNK_ALIGNMENT) * UPLOAD_CHUNK_ALIGNMENT
+
+    def _uploads_playlist_cache_path(self) -> Path | None:
+        """Get the on-disk cache path for this user's uploads playlist ID.
+
+        Returns:
+            Cache file path, or None if persistence is unavailable
+        """
+        key = _credentials_cache_key(self.credentials)
+        if not key or not self.settings.cache_dir:
+            return None
+        return Path(self.settings.cache_dir) / f"uploads_playlist_id_{key}"
+
+    def _load_uploads_playlist_id(self) -> str | None:
+        """Load a previously resolved uploads playlist ID.
+
+        The process-wide cache is checked first so short-lived service
+        instances share one lookup; the on-disk cache covers restarts.
+
+        Returns:
+            Cached playlist ID or None if not cached
+        """
+        key = _credentials_cache_key(self.credentials)
+        if key and key in _uploads_playlist_ids:
+            return _uploads_playlist_ids[key]
+
+        path = self._uploads_playlist_cache_path()
+        if path is None:
+            return None
+        try:
+            playlist_id = path.read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning("Failed to read uploads playlist cache %s: %s", path, e)
+            return None
+
+        if key and playlist_id:
+            _uploads_playlist_ids[key] = playlist_id
+        return playlist_id
+
+    def _save_uploads_playlist_id(self, playlist_id: str) -> None:
+        """Remember a resolved uploads playlist ID in process and on disk.
+
+        Args:
+            playlist_id: Uploads playlist ID to persist
+        """
+        key = _credentials_cache_key(self.credentials)
+        if key:
+            _uploads_playlist_ids[key] = playlist_id
+
+        path = self._uploads_playlist_cache_path()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(playlist_id, encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to write uploads playlist cache %s: %s", path, e)
 
     async def upload_video_async(
         self,
@@ -103,8 +463,12 @@ class YouTubeService:
         mime_type: str = "video/mp4",
         progress_callback: AsyncProgressCallback | None = None,
         file_id: str = "",
+        body: dict[str, Any] | None = None,
     ) -> UploadResult:
-        """Upload a video to YouTube using resumable upload (async version).
+        """Upload a video to YouTube (async version).
+
+        Files up to ``single_request_threshold`` are sent in one multipart
+        request; larger files use a chunked resumable upload.
 
         Args:
             file_stream: BytesIO stream containing video data
@@ -113,72 +477,26 @@ class YouTubeService:
             mime_type: Video MIME type
             progress_callback: Optional async callback for progress updates
             file_id: Optional file ID for progress tracking
+            body: Optional pre-built insert body (built from metadata if omitted)
 
         Returns:
             UploadResult with video ID and URL
         """
-        body = {
-            "snippet": {
-                "title": metadata.title,
-                "description": metadata.description,
-                "tags": metadata.tags,
-                "categoryId": metadata.category_id,
-            },
-            "status": {
-                "privacyStatus": metadata.privacy_status.value,
-                "selfDeclaredMadeForKids": metadata.made_for_kids,
-            },
-        }
-
+        chunksize = self._get_chunk_size(file_size)
         media = MediaIoBaseUpload(
             file_stream,
             mimetype=mime_type,
-            chunksize=self.settings.upload_chunk_size,
-            resumable=True,
+            chunksize=chunksize,
+            resumable=chunksize != -1,
+        )
+        return await self._upload_media_async(
+            media=media,
+            metadata=metadata,
+            file_size=file_size,
+            progress_callback=progress_callback,
+            file_id=file_id,
+            body=body,
         )
-
-        try:
-            request = self.service.videos().insert(
-                part="snippet,status",
-                body=body,
-                media_body=media,
-                notifySubscribers=metadata.notify_subscribers,
-            )
-
-            response = None
-            while response is None:
-                # Run blocking API call in thread pool to avoid blocking event loop
-                status, response = await asyncio.get_event_loop().run_in_executor(
-                    None, request.next_chunk
-                )
-                if status and progress_callback:
-                    progress = status.progress() * 100
-                    await progress_callback(
-                        UploadProgress(
-                            file_id=file_id,
-                            status="uploading",
-                            progress=progress,
-                            bytes_uploaded=int(status.resumable_progress),
-                            total_bytes=file_size,
-                            message=f"Uploading: {progress:.1f}%",
-                        )
-                    )
-
-            video_id = response.get("id")
-            return UploadResult(
-                success=True,
-                video_id=video_id,
-                video_url=f"https://www.youtube.com/watch?v={video_id}",
-                message="Upload completed successfully",
-            )
-
-        except HttpError as e:
-            logger.exception("YouTube upload failed")
-            return UploadResult(
-                success=False,
-                message="Upload failed",
-                error=str(e),
-            )
 
     def upload_video(
         self,
@@ -188,8 +506,12 @@ class YouTubeService:
         mime_type: str = "video/mp4",
         progress_callback: Any | None = None,
         file_id: str = "",
+        body: dict[str, Any] | None = None,
     ) -> UploadResult:
-        """Upload a video to YouTube using resumable upload (sync version).
+        """Upload a video to YouTube (sync version).
+
+        Files up to ``single_request_threshold`` are sent in one multipart
+        request; larger files use a chunked resumable upload.
 
         Note: This is a synchronous wrapper. For async code with async callbacks,
         use upload_video_async() instead.
@@ -201,53 +523,65 @@ class YouTubeService:
             mime_type: Video MIME type
             progress_callback: Optional sync callback for progress updates
             file_id: Optional file ID for progress tracking
+            body: Optional pre-built insert body (built from metadata if omitted)
 
         Returns:
             UploadResult with video ID and URL
         """
-        body = {
-            "snippet": {
-                "title": metadata.title,
-                "description": metadata.description,
-                "tags": metadata.tags,
-                "categoryId": metadata.category_id,
-            },
-            "status": {
-                "privacyStatus": metadata.privacy_status.value,
-                "selfDeclaredMadeForKids": metadata.made_for_kids,
-            },
-        }
+        if body is None:
+            body = metadata.to_youtube_body()
 
+        chunksize = self._get_chunk_size(file_size)
         media = MediaIoBaseUpload(
             file_stream,
             mimetype=mime_type,
-            chunksize=self.settings.upload_chunk_size,
-            resumable=True,
+            chunksize=chunksize,
+            resumable=chunksize != -1,
         )
 
         try:
-            request = self.service.videos().insert(
-                part="snippet,status",
+            request = self._videos.insert(
+                part=self._PARTS_VIDEO_INSERT,
                 body=body,
                 media_body=media,
                 notifySubscribers=metadata.notify_subscribers,
             )
 
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status and progress_callback:
-                    progress = status.progress() * 100
-                    progress_callback(
-                        UploadProgress(
-                            file_id=file_id,
-                            status="uploading",
-                            progress=progress,
-                            bytes_uploaded=int(status.resumable_progress),
-                            total_bytes=file_size,
-                            message=f"Uploading: {progress:.1f}%",
+            if media.resumable():
+                response = None
+                throttle = _ProgressThrottle(self.settings.progress_update_hz)
+                retries = self.settings.chunk_retry_count
+                failures = 0
+                while response is None:
+                    try:
+                        status, response = request.next_chunk(num_retries=retries)
+                    except HttpError as e:
+                        delay = _chunk_retry_delay(e, failures) if failures < retries else None
+                        if delay is None:
+                            raise
+                        failures += 1
+                        logger.warning(
+                            "Chunk upload failed (status=%s), resuming in %.1fs",
+                            e.resp.status,
+                            delay,
                         )
-                    )
+                        time.sleep(delay)
+                        continue
+                    failures = 0
+                    if status and progress_callback:
+                        progress = status.progress() * 100
+                        if not throttle.ready(progress):
+                            continue
+                        progress_callback(
+                            _upload_progress(
+                                file_id, progress, int(status.resumable_progress), file_size
+                            )
+                        )
+            else:
+                # Small file: one multipart request, no upload session
+                response = request.execute()
+                if progress_callback:
+                    progress_callback(_upload_progress(file_id, 100.0, file_size, file_size))
 
             video_id = response.get("id")
             return UploadResult(
@@ -272,12 +606,14 @@ class YouTubeService:
         progress_callback: AsyncProgressCallback | None = None,
         drive_credentials: Credentials | None = None,
         file_id: str | None = "",
+        body: dict[str, Any] | None = None,
     ) -> UploadResult:
         """Upload a video from Google Drive to YouTube (async version).
 
-        This method downloads the video from Drive to a temporary file, then
-        uploads it to YouTube. Uses temp file storage to minimize memory usage
-        for large video files.
+        The Drive download and the YouTube upload run concurrently: downloaded
+        chunks flow through a bounded queue into the resumable upload, so wall
+        time is roughly max(download, upload) and memory stays bounded to a
+        few chunks regardless of file size.
 
         Args:
             drive_file_id: Google Drive file ID
@@ -285,17 +621,17 @@ class YouTubeService:
             progress_callback: Optional async callback for progress updates
             drive_credentials: Optional credentials for Drive API
             file_id: Optional file ID for tracking
+            body: Optional pre-built insert body (built from metadata if omitted)
 
         Returns:
             UploadResult with video ID and URL
         """
-        temp_file_path: str | None = None
         try:
             # Get Drive service (prefer provided credentials, otherwise fallback)
             if drive_credentials:
-                drive_service = DriveService(drive_credentials)
+                drive_service = DriveService(credentials=drive_credentials)
             else:
-                drive_service = get_drive_service()
+                drive_service = self._drive
 
             # Get file metadata
             file_info = await drive_service.get_file_metadata(drive_file_id)
@@ -323,81 +659,33 @@ class YouTubeService:
                     file_name=file_name,
                 )
 
-            # Check available disk space before creating temp file
-            # Add 100MB buffer for safety
-            required_space = file_size + (100 * 1024 * 1024)
-            temp_dir = tempfile.gettempdir()
-            disk_usage = shutil.disk_usage(temp_dir)
-            if disk_usage.free < required_space:
-                raise InsufficientDiskSpaceError(
-                    required=required_space,
-                    available=disk_usage.free,
-                )
-
-            # Create temp file with appropriate extension
-            file_ext = os.path.splitext(file_name)[1] or ".mp4"
-            temp_fd, temp_file_path = tempfile.mkstemp(suffix=file_ext)
-
+            queue: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(
+                maxsize=PIPELINE_QUEUE_SIZE
+            )
+            chunksize = self._get_chunk_size(file_size)
+            media = _QueueMediaUpload(
+                queue,
+                asyncio.get_running_loop(),
+                size=file_size,
+                mimetype=mime_type,
+                chunksize=chunksize,
+                resumable=chunksize != -1,
+            )
+            producer = asyncio.create_task(
+                self._pump_drive_chunks(drive_service, drive_file_id, queue)
+            )
             try:
-                # Download file from Drive to temp file
-                with os.fdopen(temp_fd, "wb") as temp_file:
-                    downloader = drive_service.download_to_file(drive_file_id, temp_file)
-
-                    done = False
-                    while not done:
-                        # Run blocking download in thread pool
-                        status, done = await asyncio.get_event_loop().run_in_executor(
-                            None, downloader.next_chunk
-                        )
-                        if status and progress_callback:
-                            progress = status.progress() * 50  # 0-50% for download
-                            await progress_callback(
-                                UploadProgress(
-                                    file_id=drive_file_id,
-                                    status="downloading",
-                                    progress=progress,
-                                    bytes_uploaded=int(status.resumable_progress),
-                                    total_bytes=file_size,
-                                    message=f"Downloading from Drive: {progress:.1f}%",
-                                )
-                            )
-
-                logger.info(
-                    "Downloaded %s to temp file: %s (%d bytes)",
-                    drive_file_id, temp_file_path, file_size
-                )
-
-                if progress_callback:
-                    await progress_callback(
-                        UploadProgress(
-                            file_id=drive_file_id,
-                            status="uploading",
-                            progress=50,
-                            total_bytes=file_size,
-                            message="Starting YouTube upload...",
-                        )
-                    )
-
-                # Upload to YouTube from temp file
-                result = await self._upload_from_file_async(
-                    file_path=temp_file_path,
+                return await self._upload_media_async(
+                    media=media,
                     metadata=metadata,
                     file_size=file_size,
-                    mime_type=mime_type,
                     progress_callback=progress_callback,
                     file_id=drive_file_id,
+                    body=body,
                 )
-
-                return result
-
             finally:
-                # Cleanup temp file
-                if temp_file_path and os.path.exists(temp_file_path):
-                    try:
-                        os.unlink(temp_file_path)
-                        logger.debug("Cleaned up temp file: %s", temp_file_path)
-                    except OSError as e:
-                        logger.warning("Failed to cleanup temp file %s: %s", temp_file_path, e)
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
 
         except ValueError as e:
             return UploadResult(
@@ -413,81 +701,123 @@ class YouTubeService:
                 error=str(e),
             )
 
-    async def _upload_from_file_async(
+    async def _pump_drive_chunks(
+        self,
+        drive_service: DriveService,
+        drive_file_id: str,
+        queue: "asyncio.Queue[bytes | BaseException | None]",
+    ) -> None:
+        """Download a Drive file into a queue (producer side of the pipeline).
+
+        Puts None after the last chunk. On failure or cancellation, pending
+        chunks are discarded and the error is queued so the uploader fails
+        instead of finalizing a truncated video.
+
+        Args:
+            drive_service: Drive service used for the download
+            drive_file_id: Google Drive file ID
+            queue: Bounded queue shared with the uploader
+        """
+        try:
+            async for chunk in drive_service.iter_file_chunks(
+                drive_file_id, self.settings.upload_chunk_size
+            ):
+                await queue.put(chunk)
+            await queue.put(None)
+            logger.info("Downloaded %s from Drive", drive_file_id)
+        except BaseException as e:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(
+                DriveAccessError(f"Drive download failed for {drive_file_id}: {e}")
+            )
+            raise
+
+    async def _upload_media_async(
         self,
-        file_path: str,
+        media: MediaUpload,
         metadata: VideoMetadata,
         file_size: int,
-        mime_type: str,
         progress_callback: AsyncProgressCallback | None = None,
         file_id: str = "",
+        body: dict[str, Any] | None = None,
     ) -> UploadResult:
-        """Upload a video file to YouTube (internal async helper).
+        """Upload a media body to YouTube (internal async helper).
+
+        Non-resumable media is sent as a single multipart request; resumable
+        media is uploaded chunk by chunk.
 
         Args:
-            file_path: Path to the video file on disk
+            media: Media body to upload
             metadata: Video metadata
             file_size: Size of the video file in bytes
-            mime_type: Video MIME type
             progress_callback: Optional async callback for progress updates
             file_id: Optional file ID for progress tracking
+            body: Optional pre-built insert body (built from metadata if omitted)
 
         Returns:
             UploadResult with video ID and URL
         """
-        body = {
-            "snippet": {
-                "title": metadata.title,
-                "description": metadata.description,
-                "tags": metadata.tags,
-                "categoryId": metadata.category_id,
-            },
-            "status": {
-                "privacyStatus": metadata.privacy_status.value,
-                "selfDeclaredMadeForKids": metadata.made_for_kids,
-            },
+        if body is None:
+            body = metadata.to_youtube_body()
+
+        insert_kwargs = {
+            "part": self._PARTS_VIDEO_INSERT,
+            "body": body,
+            "media_body": media,
+            "notifySubscribers": metadata.notify_subscribers,
         }
 
-        # Use MediaFileUpload for file-based upload (more memory efficient)
-        media = MediaFileUpload(
-            file_path,
-            mimetype=mime_type,
-            chunksize=self.settings.upload_chunk_size,
-            resumable=True,
-        )
-
         try:
-            request = self.service.videos().insert(
-                part="snippet,status",
-                body=body,
-                media_body=media,
-                notifySubscribers=metadata.notify_subscribers,
-            )
-
-            # Adjusted progress callback for 50-100% range
-            async def adjusted_progress(progress_pct: float, bytes_uploaded: int) -> None:
+            if not media.resumable():
+                if isinstance(media, _QueueMediaUpload):
+                    await media.prefetch(0)
+                # The multipart body is assembled while the request is built,
+                # so build and send it off the event loop
+                response = await asyncio.to_thread(
+                    lambda: self._videos.insert(**insert_kwargs).execute()
+                )
                 if progress_callback:
-                    adjusted_pct = 50 + (progress_pct / 2)  # Map to 50-100%
-                    await progress_callback(
-                        UploadProgress(
-                            file_id=file_id,
-                            status="uploading",
-                            progress=adjusted_pct,
-                            bytes_uploaded=bytes_uploaded,
-                            total_bytes=file_size,
-                            message=f"Uploading to YouTube: {adjusted_pct:.1f}%",
+                    await progress_callback(_upload_progress(file_id, 100.0, file_size, file_size))
+            else:
+                request = self._videos.insert(**insert_kwargs)
+                response = None
+                throttle = _ProgressThrottle(self.settings.progress_update_hz)
+                retries = self.settings.chunk_retry_count
+                failures = 0
+                while response is None:
+                    if isinstance(media, _QueueMediaUpload):
+                        await media.prefetch(request.resumable_progress)
+                    # Run blocking API call in a worker thread so other coroutines
+                    # (e.g., the Drive download) keep running during the chunk
+                    try:
+                        status, response = await asyncio.to_thread(
+                            request.next_chunk, num_retries=retries
+                        )
+                    except HttpError as e:
+                        # The session survives a failed chunk: the next call asks
+                        # YouTube how many bytes it has and resumes from there
+                        delay = _chunk_retry_delay(e, failures) if failures < retries else None
+                        if delay is None:
+                            raise
+                        failures += 1
+                        logger.warning(
+                            "Chunk upload failed (status=%s), resuming in %.1fs",
+                            e.resp.status,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    failures = 0
+                    if status and progress_callback:
+                        progress = status.progress() * 100
+                        if not throttle.ready(progress):
+                            continue
+                        await progress_callback(
+                            _upload_progress(
+                                file_id, progress, int(status.resumable_progress), file_size
+                            )
                         )
-                    )
-
-            response = None
-            while response is None:
-                # Run blocking API call in thread pool
-                status, response = await asyncio.get_event_loop().run_in_executor(
-                    None, request.next_chunk
-                )
-                if status:
-                    progress_pct = status.progress() * 100
-                    await adjusted_progress(progress_pct, int(status.resumable_progress))
 
             video_id = response.get("id")
             return UploadResult(
@@ -505,17 +835,19 @@ class YouTubeService:
                 error=str(e),
             )
 
-
     def get_channel_info(self) -> dict[str, Any]:
         """Get authenticated user's YouTube channel information.
 
         Returns:
             Channel information dict
         """
-        quota_tracker = get_quota_tracker()
         try:
             response = (
-                self.service.channels().list(part="snippet,statistics", mine=True).execute()
+                self._channels.list(
+                    part=self._PARTS_CHANNEL_INFO,
+                    mine=True,
+                    fields=self._FIELDS_CHANNEL_INFO,
+                ).execute()
             )
             items = response.get("items", [])
             if items:
@@ -523,7 +855,7 @@ class YouTubeService:
             return {}
         finally:
             # Track quota even if request fails
-            quota_tracker.track("channels.list")
+            self._quota.track("channels.list")
 
     def list_my_videos(self, max_results: int = 25) -> list[dict[str, Any]]:
         """List videos uploaded by the authenticated user.
@@ -537,20 +869,80 @@ class YouTubeService:
         Returns:
             List of video information dicts
         """
-        quota_tracker = get_quota_tracker()
         response = (
             self.service.search()
             .list(
-                part="snippet",
+                part=self._PARTS_SEARCH,
                 forMine=True,
                 type="video",
                 maxResults=max_results,
+                fields=self._FIELDS_SEARCH,
             )
             .execute()
         )
-        quota_tracker.track("search.list")
+        self._quota.track("search.list")
         return response.get("items", [])
 
+    def get_dashboard_snapshot(self, max_results: int = 25) -> dict[str, Any]:
+        """Get channel information and recent videos in one HTTP round-trip.
+
+        Combines get_channel_info() and list_my_videos() into a single batch
+        request. Quota cost is unchanged (channels.list + search.list).
+
+        Args:
+            max_results: Maximum number of videos to return
+
+        Returns:
+            Dict with "channel" (channel information dict) and "videos"
+            (list of video information dicts)
+
+        Raises:
+            HttpError: If either request in the batch fails
+        """
+        responses: dict[str, Any] = {}
+        errors: list[HttpError] = []
+
+        def on_response(request_id: str, response: Any, exception: HttpError | None) -> None:
+            if exception is not None:
+                errors.append(exception)
+            else:
+                responses[request_id] = response
+
+        batch = self.service.new_batch_http_request(callback=on_response)
+        batch.add(
+            self._channels.list(
+                part=self._PARTS_CHANNEL_INFO,
+                mine=True,
+                fields=self._FIELDS_CHANNEL_INFO,
+            ),
+            request_id="channel",
+        )
+        batch.add(
+            self.service.search().list(
+                part=self._PARTS_SEARCH,
+                forMine=True,
+                type="video",
+                maxResults=max_results,
+                fields=self._FIELDS_SEARCH,
+            ),
+            request_id="videos",
+        )
+        try:
+            batch.execute()
+        finally:
+            # Both calls are billed even when the batch fails
+            self._quota.track("channels.list")
+            self._quota.track("search.list")
+
+        if errors:
+            raise errors[0]
+
+        channel_items = responses["channel"].get("items", [])
+        return {
+            "channel": channel_items[0] if channel_items else {},
+            "videos": responses["videos"].get("items", []),
+        }
+
     def check_video_exists_on_youtube(self, video_id: str) -> bool:
         """Check if a video exists on YouTube.
         
@@ -559,33 +951,62 @@ class YouTubeService:
         
         Args:
             video_id: YouTube video ID to check
-            
+
         Returns:
             True if video exists, False otherwise
         """
-        quota_tracker = get_quota_tracker()
-        try:
-            response = (
-                self.service.videos()
-                .list(
-                    part="id",  # Minimal fields to reduce data transfer
-                    id=video_id,
+        return self.check_videos_exist([video_id])[video_id]
+
+    def check_videos_exist(self, video_ids: list[str]) -> dict[str, bool]:
+        """Check whether multiple videos exist on YouTube.
+
+        IDs are checked in groups of 50 (the videos.list maximum), so each
+        group costs only 1 quota unit and a single HTTP round-trip.
+
+        Args:
+            video_ids: YouTube video IDs to check
+
+        Returns:
+            Dict mapping each video ID to True if it exists, False otherwise
+        """
+        # Blank IDs can never exist, so don't spend quota asking about them;
+        # repeated IDs are looked up once
+        results: dict[str, bool] = {
+            video_id: False for video_id in video_ids if not video_id.strip()
+        }
+        lookup_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id.strip()]
+        if not lookup_ids:
+            return results
+
+        for i in range(0, len(lookup_ids), 50):
+            chunk = lookup_ids[i:i + 50]
+            try:
+                response = (
+                    self._videos
+                    .list(
+                        part=self._PARTS_VIDEO_EXISTS,
+                        id=",".join(chunk),
+                    )
+                    .execute()
                 )
-                .execute()
-            )
-            return len(response.get("items", [])) > 0
-        except HttpError as e:
-            logger.warning("Failed to check video %s: %s", video_id, e)
-            return False
-        finally:
-            # Track quota even if request fails
-            quota_tracker.track("videos.list")
+                found_ids = {item.get("id") for item in response.get("items", [])}
+                for video_id in chunk:
+                    results[video_id] = video_id in found_ids
+            except HttpError as e:
+                logger.warning("Failed to check videos %s: %s", chunk, e)
+                for video_id in chunk:
+                    results[video_id] = False
+            finally:
+                # Track quota even if request fails
+                self._quota.track("videos.list")
+
+        return results
 
     def _get_uploads_playlist_id(self) -> str | None:
         """Get the uploads playlist ID for the authenticated channel.
         
-        This is cached to avoid repeated API calls.
-        Costs 1 quota unit on first call.
+        This is cached per credentials for the whole process (and on disk)
+        to avoid repeated API calls. Costs 1 quota unit on first call.
         
         Returns:
             Uploads playlist ID or None if not found
@@ -594,12 +1015,11 @@ class YouTubeService:
         if self._uploads_playlist_cache is not None:
             return self._uploads_playlist_cache
 
-        quota_tracker = get_quota_tracker()
         try:
             response = (
-                self.service.channels()
+                self._channels
                 .list(
-                    part="contentDetails",
+                    part=self._PARTS_CHANNEL_UPLOADS,
                     mine=True,
                 )
                 .execute()
@@ -615,14 +1035,16 @@ class YouTubeService:
                 .get("relatedPlaylists", {})
                 .get("uploads")
             )
-            self._uploads_playlist_cache = playlist_id  # Cache the result
+            if playlist_id:
+                self._uploads_playlist_cache = playlist_id  # Cache the result
+                self._save_uploads_playlist_id(playlist_id)
             return playlist_id
         except HttpError as e:
             logger.warning("Failed to get uploads playlist: %s", e)
             return None
         finally:
             # Track quota even if request fails
-            quota_tracker.track("channels.list")
+            self._quota.track("channels.list")
 
     def list_my_videos_optimized(
         self, max_results: int = 25
@@ -630,27 +1052,30 @@ class YouTubeService:
         """List videos using playlistItems API (optimized version).
         
         This uses playlistItems.list which costs only 1-2 quota units
-        instead of search.list which costs 100 units.
-        
+        instead of search.list which costs 100 units. There is deliberately
+        no fallback to search.list; callers must opt in to it explicitly.
+
         Args:
             max_results: Maximum number of videos to return
-            
+
         Returns:
             List of video information dicts
-        """
-        quota_tracker = get_quota_tracker()
 
+        Raises:
+            PlaylistLookupError: If the uploads playlist cannot be resolved
+        """
         # Get uploads playlist ID
         playlist_id = self._get_uploads_playlist_id()
         if not playlist_id:
-            logger.warning("Could not get uploads playlist, falling back to search")
-            return self.list_my_videos(max_results)
+            raise PlaylistLookupError(
+                "Could not resolve uploads playlist for the authenticated channel"
+            )
 
         try:
             response = (
-                self.service.playlistItems()
+                self._playlist_items
                 .list(
-                    part="snippet,contentDetails",
+                    part=self._PARTS_PLAYLIST_ITEMS,
                     playlistId=playlist_id,
                     maxResults=max_results,
                 )
@@ -662,44 +1087,48 @@ class YouTubeService:
             return []
         finally:
             # Track quota even if request fails
-            quota_tracker.track("playlistItems.list")
+            self._quota.track("playlistItems.list")
 
     def get_videos_batch(self, video_ids: list[str]) -> list[dict[str, Any]]:
-        """Get information for multiple videos in a single request.
-        
+        """Get information for multiple videos in as few requests as possible.
+
         This is much more efficient than calling videos.list for each video.
-        Costs only 1 quota unit for up to 50 videos.
-        
+        Duplicate IDs are dropped, and IDs are requested in groups of 50,
+        each costing only 1 quota unit.
+
         Args:
-            video_ids: List of YouTube video IDs (max 50)
-            
+            video_ids: List of YouTube video IDs
+
         Returns:
             List of video information dicts
         """
-        if not video_ids:
+        # Deduplicate (preserving order) and drop blank IDs so they don't cost quota
+        unique_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id.strip()]
+        if not unique_ids:
             return []
 
-        quota_tracker = get_quota_tracker()
+        items: list[dict[str, Any]] = []
 
         # YouTube API allows max 50 IDs per request
-        batch_ids = video_ids[:50]
-
-        try:
-            response = (
-                self.service.videos()
-                .list(
-                    part="snippet,contentDetails,status",
-                    id=",".join(batch_ids),
+        for i in range(0, len(unique_ids), 50):
+            chunk = unique_ids[i:i + 50]
+            try:
+                response = (
+                    self._videos
+                    .list(
+                        part=self._PARTS_VIDEO_BATCH,
+                        id=",".join(chunk),
+                    )
+                    .execute()
                 )
-                .execute()
-            )
-            return response.get("items", [])
-        except HttpError as e:
-            logger.warning("Failed to get videos batch: %s", e)
-            return []
-        finally:
-            # Track quota even if request fails
-            quota_tracker.track("videos.list")
+                items.extend(response.get("items", []))
+            except HttpError as e:
+                logger.warning("Failed to get videos batch: %s", e)
+            finally:
+                # Track quota even if request fails
+                self._quota.track("videos.list")
+
+        return items
 
     async def upload_from_drive_with_retry_async(
         self,
@@ -708,6 +1137,7 @@ class YouTubeService:
         progress_callback: AsyncProgressCallback | None = None,
         drive_credentials: Credentials | None = None,
         max_attempts: int = 3,
+        reservation: QuotaReservation | None = None,
     ) -> UploadResult:
         """Upload a video from Google Drive to YouTube with retry logic (async version).
 
@@ -720,52 +1150,60 @@ class YouTubeService:
             progress_callback: Optional async callback for progress updates
             drive_credentials: Optional credentials for Drive API
             max_attempts: Maximum number of retry attempts
+            reservation: videos.insert reservation already held by the caller;
+                one is taken here when omitted
 
         Returns:
             UploadResult with video ID and URL
-        """
-        quota_tracker = get_quota_tracker()
 
-        # Check if we have enough quota before attempting upload
-        if not quota_tracker.can_perform("videos.insert"):
-            raise QuotaExceededError(
-                remaining=quota_tracker.get_remaining_quota(),
-                required=1600,
-            )
+        Raises:
+            QuotaExceededError: If the daily quota cannot cover videos.insert
+        """
+        # Hold the insert cost up front so concurrent uploads cannot overspend
+        if reservation is None:
+            reservation = self._quota.reserve("videos.insert")
 
         logger.info(
             "Starting upload with retry: %s (quota remaining: %d)",
             drive_file_id,
-            quota_tracker.get_remaining_quota(),
+            self._quota.get_remaining_quota(),
         )
 
+        # Insert body is identical across attempts, so build it once
+        body = metadata.to_youtube_body()
+
         last_exception: Exception | None = None
-        for attempt in range(max_attempts):
-            try:
-                result = await self.upload_from_drive_async(
-                    drive_file_id=drive_file_id,
-                    metadata=metadata,
-                    progress_callback=progress_callback,
-                    drive_credentials=drive_credentials,
-                )
+        try:
+            for attempt in range(max_attempts):
+                try:
+                    result = await self.upload_from_drive_async(
+                        drive_file_id=drive_file_id,
+                        metadata=metadata,
+                        progress_callback=progress_callback,
+                        drive_credentials=drive_credentials,
+                        body=body,
+                    )
 
-                # Track the upload operation
-                if result.success:
-                    quota_tracker.track("videos.insert")
+                    # Record the upload against quota only when it went through
+                    if result.success:
+                        reservation.commit()
 
-                return result
+                    return result
 
-            except HttpError as e:
-                if _is_retryable_error(e) and attempt < max_attempts - 1:
-                    wait_time = min(60, 4 * (2 ** attempt))  # Exponential backoff
-                    logger.warning(
-                        "Retrying upload after %d seconds (attempt %d/%d): %s",
-                        wait_time, attempt + 1, max_attempts, e
-                    )
-                    await asyncio.sleep(wait_time)
-                    last_exception = e
-                else:
-                    raise
+                except HttpError as e:
+                    if _is_retryable_error(e) and attempt < max_attempts - 1:
+                        wait_time = min(60, 4 * (2 ** attempt))  # Exponential backoff
+                        logger.warning(
+                            "Retrying upload after %d seconds (attempt %d/%d): %s",
+                            wait_time, attempt + 1, max_attempts, e
+                        )
+                        await asyncio.sleep(wait_time)
+                        last_exception = e
+                    else:
+                        raise
+        finally:
+            # No-op after a commit; otherwise refunds the held units
+            reservation.rollback()
 
         # Should not reach here, but just in case
         if last_exception:
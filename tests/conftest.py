@@ -1,15 +1,17 @@
 """Common test fixtures for DigitalOcean migration tests."""
 
-import asyncio
 import os
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.database import Base
 
@@ -20,70 +22,136 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 TEST_ENCRYPTION_KEY = "test-encryption-key-32-bytes!!"
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _shared_engine():
+    """Create the shared test database engine and schema once per session.
 
-@pytest_asyncio.fixture
-async def test_engine():
-    """Create a test database engine."""
+    StaticPool keeps the single in-memory SQLite connection alive, so every
+    session in the test run sees the same database. Under pytest-xdist each
+    worker is a separate process and so builds its own private database.
+    """
     # Import models to register them with Base
     from app import models  # noqa: F401
 
     engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
 
+    # The sqlite driver defers BEGIN until the first write, which breaks the
+    # SAVEPOINT rollback in test_session; let SQLAlchemy emit BEGIN itself.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _configure_connection(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # The database is thrown away after the run, so skip durability work
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        # StaticPool means this is the only connection, so never release locks
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
     await engine.dispose()
 
 
 @pytest_asyncio.fixture
-async def test_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async_session_maker = async_sessionmaker(
-        bind=test_engine,
+async def test_engine(_shared_engine):
+    """Provide the test database engine, emptied again after each test.
+
+    Tests commit through their own sessions, so rows are deleted on teardown
+    instead of rolled back; this is much cheaper than re-running the DDL.
+    """
+    yield _shared_engine
+
+    async with _shared_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
+@pytest.fixture(scope="session")
+def session_factory(_shared_engine) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory for the shared test engine once."""
+    return async_sessionmaker(
+        bind=_shared_engine,
         class_=AsyncSession,
         expire_on_commit=False,
         autoflush=False,
     )
 
-    async with async_session_maker() as session:
+
+@pytest_asyncio.fixture
+async def test_session(
+    _shared_engine, session_factory
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a test database session inside a transaction rolled back afterwards.
+
+    Commits inside the test only release a SAVEPOINT, so nothing written
+    through this session outlives the test.
+    """
+    async with _shared_engine.connect() as conn:
+        transaction = await conn.begin()
+        session = session_factory(bind=conn, join_transaction_mode="create_savepoint")
         try:
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+def _app_client():
+    """Create one TestClient for the FastAPI app, shared by the whole run.
+
+    The client is not entered as a context manager, so the lifespan (database
+    initialization and worker shutdown) never runs.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    return TestClient(app)
+
+
+@pytest.fixture
+def app_client(_app_client):
+    """Provide the shared TestClient, reset after each test.
+
+    Tests install dependency overrides and may receive cookies, so both are
+    cleared on teardown to keep the next test independent.
+    """
+    yield _app_client
+
+    _app_client.app.dependency_overrides.clear()
+    _app_client.cookies.clear()
 
 
 @pytest.fixture
 def mock_settings():
     """Create mock settings for testing."""
-    settings = MagicMock()
-    settings.database_url = TEST_DATABASE_URL
-    settings.async_database_url = TEST_DATABASE_URL
-    settings.secret_key = TEST_ENCRYPTION_KEY
-    settings.debug = True
-    settings.app_env = "development"
-    settings.max_concurrent_uploads = 2
-    settings.google_client_id = "test-client-id"
-    settings.google_client_secret = "test-client-secret"
-    settings.google_redirect_uri = "http://localhost:8000/auth/callback"
-    settings.scopes_list = ["scope1", "scope2"]
-    return settings
+    return SimpleNamespace(
+        database_url=TEST_DATABASE_URL,
+        async_database_url=TEST_DATABASE_URL,
+        secret_key=TEST_ENCRYPTION_KEY,
+        debug=True,
+        app_env="development",
+        max_concurrent_uploads=2,
+        google_client_id="test-client-id",
+        google_client_secret="test-client-secret",
+        google_redirect_uri="http://localhost:8000/auth/callback",
+        scopes_list=["scope1", "scope2"],
+    )
 
 
 @pytest.fixture
@@ -101,7 +169,7 @@ def sample_video_metadata() -> dict[str, Any]:
 @pytest.fixture
 def sample_queue_job_data(sample_video_metadata) -> dict[str, Any]:
     """Create sample queue job data for testing."""
-    import json
+    import orjson
 
     return {
         "id": uuid4(),
@@ -110,7 +178,7 @@ def sample_queue_job_data(sample_video_metadata) -> dict[str, Any]:
         "drive_md5_checksum": "abc123def456",
         "folder_path": "/test/folder",
         "batch_id": "batch-001",
-        "metadata_json": json.dumps(sample_video_metadata),
+        "metadata_json": orjson.dumps(sample_video_metadata).decode(),
         "status": "pending",
         "progress": 0.0,
         "message": "",
@@ -132,11 +200,15 @@ def env_override():
 
 @pytest.fixture
 def clear_settings_cache():
-    """Clear the settings cache before and after test."""
+    """Clear the settings cache, and ciphers keyed from it, before and after test."""
     from app.config import get_settings
+    from app.crypto import clear_cipher_cache
+
     get_settings.cache_clear()
+    clear_cipher_cache()
     yield
     get_settings.cache_clear()
+    clear_cipher_cache()
 
 
 # ============================================================================
@@ -148,20 +220,20 @@ def clear_settings_cache():
 def mock_google_credentials():
     """Create mock Google OAuth credentials.
     
-    Returns a MagicMock that simulates google.oauth2.credentials.Credentials
-    with common attributes pre-configured for testing.
+    Returns a plain value holder with the google.oauth2.credentials.Credentials
+    attributes commonly read in tests.
     """
-    mock_creds = MagicMock()
-    mock_creds.token = "mock-access-token"
-    mock_creds.refresh_token = "mock-refresh-token"
-    mock_creds.expired = False
-    mock_creds.valid = True
-    mock_creds.scopes = [
-        "https://www.googleapis.com/auth/youtube",
-        "https://www.googleapis.com/auth/drive.readonly",
-    ]
-    mock_creds.expiry = None
-    return mock_creds
+    return SimpleNamespace(
+        token="mock-access-token",
+        refresh_token="mock-refresh-token",
+        expired=False,
+        valid=True,
+        scopes=[
+            "https://www.googleapis.com/auth/youtube",
+            "https://www.googleapis.com/auth/drive.readonly",
+        ],
+        expiry=None,
+    )
 
 
 @pytest.fixture
@@ -210,13 +282,14 @@ def mock_youtube_service(mock_google_credentials):
 
         # Mock successful upload result
         from app.youtube.schemas import UploadResult
-        service.upload_from_drive.return_value = UploadResult(
+        upload_result = UploadResult(
             success=True,
             video_id="test-video-id",
             video_url="https://www.youtube.com/watch?v=test-video-id",
             message="Upload completed successfully",
         )
-        service.upload_from_drive_with_retry.return_value = service.upload_from_drive.return_value
+        service.upload_from_drive_async = AsyncMock(return_value=upload_result)
+        service.upload_from_drive_with_retry_async = AsyncMock(return_value=upload_result)
 
         mock_class.return_value = service
         yield service
@@ -272,7 +345,10 @@ def test_video_file(tmp_path):
         Path to the temporary test video file
     """
     video_path = tmp_path / "test_video.mp4"
-    # Create a minimal "video" file (not actually valid video data)
-    video_path.write_bytes(b"\x00" * 1024)  # 1KB dummy file
+    # Create a minimal "video" file (not actually valid video data).
+    # Extending with truncate() is O(1) and sparse, so the size can grow
+    # to realistic video sizes without writing the bytes.
+    with video_path.open("wb") as f:
+        f.truncate(1024)  # 1KB dummy file of zeros
     return video_path
 
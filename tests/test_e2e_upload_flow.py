@@ -4,34 +4,52 @@ Test categories:
 6.1 完全なアップロードフローテスト
 """
 
+import sqlite3
 from datetime import UTC, datetime
-from uuid import uuid4
+from itertools import count
+from uuid import UUID, uuid4
 
+import orjson
 import pytest
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
+from app.database import Base
+from app.models import QueueJobModel, UploadHistory
 from app.youtube.schemas import PrivacyStatus, VideoMetadata
 
+# Statements shared by the tests, built once
+_PENDING_JOBS = select(QueueJobModel).where(QueueJobModel.status == "pending")
+_JOBS_BY_BATCH = select(QueueJobModel).where(
+    QueueJobModel.batch_id == bindparam("batch_id")
+)
+_HISTORY_BY_DRIVE_FILE = select(UploadHistory).where(
+    UploadHistory.drive_file_id == bindparam("drive_file_id")
+)
+_HISTORY_BY_FOLDER = select(UploadHistory).where(
+    UploadHistory.folder_path == bindparam("folder_path")
+)
+
+
+_job_numbers = count(1)
+
 
 def make_job_id() -> str:
-    """Create a string job ID for SQLite compatibility."""
-    return str(uuid4())
+    """Create a string job ID for SQLite compatibility.
+
+    IDs come from a counter rather than uuid4, but keep the canonical UUID
+    form so they still fit the String(36) column and parse as UUIDs.
+    """
+    return str(UUID(int=next(_job_numbers)))
 
 
 class TestCompleteUploadFlow:
     """6.1 完全なアップロードフローテスト"""
 
     @pytest.mark.asyncio
-    async def test_complete_upload_flow(self, test_engine):
+    async def test_complete_upload_flow(self, test_engine, session_factory):
         """Test complete flow: file upload → queue → worker → completion."""
-        from app.models import QueueJobModel, UploadHistory
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
 
         job_id = make_job_id()
         metadata = VideoMetadata(
@@ -40,8 +58,10 @@ class TestCompleteUploadFlow:
             privacy_status=PrivacyStatus.PRIVATE,
         )
 
-        # Step 1: API endpoint creates a queue job
-        async with session_maker() as session:
+        # One session throughout: the job stays in the identity map, so each
+        # step only flushes an UPDATE instead of re-selecting the row
+        async with session_factory() as session:
+            # Step 1: API endpoint creates a queue job
             job = QueueJobModel(
                 id=job_id,
                 user_id="test-user",
@@ -60,52 +80,30 @@ class TestCompleteUploadFlow:
             session.add(job)
             await session.commit()
 
-        # Step 2: Worker picks up the job
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.status == "pending")
-            )
+            # Step 2: Worker picks up the job
+            result = await session.execute(_PENDING_JOBS)
             pending_job = result.scalars().first()
 
-            assert pending_job is not None
-            assert pending_job.id == job_id
+            assert pending_job is job
 
             # Update to downloading
-            pending_job.status = "downloading"
-            pending_job.started_at = datetime.now(UTC)
-            pending_job.message = "Downloading from Google Drive..."
+            job.status = "downloading"
+            job.started_at = datetime.now(UTC)
+            job.message = "Downloading from Google Drive..."
             await session.commit()
 
-        # Step 3: Download completes, start upload
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            job = result.scalars().first()
-
+            # Step 3: Download completes, start upload
             job.status = "uploading"
             job.progress = 25.0
             job.message = "Uploading to YouTube..."
             await session.commit()
 
-        # Step 4: Upload progresses
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            job = result.scalars().first()
-
+            # Step 4: Upload progresses
             job.progress = 75.0
             job.message = "Upload 75% complete..."
             await session.commit()
 
-        # Step 5: Upload completes
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            job = result.scalars().first()
-
+            # Step 5: Upload completes
             job.status = "completed"
             job.progress = 100.0
             job.video_id = "yt-e2e-12345"
@@ -114,41 +112,30 @@ class TestCompleteUploadFlow:
             job.message = "Upload completed successfully"
             await session.commit()
 
-        # Step 6: Save to upload history
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            completed_job = result.scalars().first()
-
+            # Step 6: Save to upload history
             history = UploadHistory(
-                drive_file_id=completed_job.drive_file_id,
-                drive_file_name=completed_job.drive_file_name,
-                drive_md5_checksum=completed_job.drive_md5_checksum or "",
-                youtube_video_id=completed_job.video_id,
-                youtube_video_url=completed_job.video_url,
-                folder_path=completed_job.folder_path or "",
+                drive_file_id=job.drive_file_id,
+                drive_file_name=job.drive_file_name,
+                drive_md5_checksum=job.drive_md5_checksum or "",
+                youtube_video_id=job.video_id,
+                youtube_video_url=job.video_url,
+                folder_path=job.folder_path or "",
                 status="completed",
                 uploaded_at=datetime.now(UTC),
             )
             session.add(history)
             await session.commit()
 
-        # Verify final state
-        async with session_maker() as session:
+        # Verify final state from a fresh session
+        async with session_factory() as session:
             # Queue job completed
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            final_job = result.scalars().first()
+            final_job = await session.get(QueueJobModel, job_id)
             assert final_job.status == "completed"
             assert final_job.video_id == "yt-e2e-12345"
 
             # Upload history recorded
             result = await session.execute(
-                select(UploadHistory).where(
-                    UploadHistory.drive_file_id == "e2e-drive-file"
-                )
+                _HISTORY_BY_DRIVE_FILE, {"drive_file_id": "e2e-drive-file"}
             )
             history_record = result.scalars().first()
             assert history_record is not None
@@ -158,26 +145,23 @@ class TestCompleteUploadFlow:
     async def test_restart_resilience(self):
         """Test jobs survive simulated restart and resume processing.
         
-        Note: This test uses a file-based SQLite database to properly test
-        persistence across connection disposal (simulating process restart).
+        Note: This test uses a named shared-cache in-memory SQLite database.
+        Disposing an engine closes all of its connections (simulating process
+        restart); a separate keeper connection stands in for the database file.
         """
-        import os
-        import tempfile
-
-        from sqlalchemy.ext.asyncio import create_async_engine
-
-        from app.database import Base
-        from app.models import QueueJobModel
-
-        # Create a temporary file-based database
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-            db_path = f.name
+        db_name = f"restart_test_{uuid4().hex}"
+        keeper = sqlite3.connect(f"file:{db_name}?mode=memory&cache=shared", uri=True)
 
         try:
-            db_url = f"sqlite+aiosqlite:///{db_path}"
+            db_url = f"sqlite+aiosqlite:///file:{db_name}?mode=memory&cache=shared&uri=true"
+            engine_options = {
+                "echo": False,
+                "poolclass": StaticPool,
+                "connect_args": {"check_same_thread": False},
+            }
 
             # Create engine and tables
-            engine1 = create_async_engine(db_url, echo=False)
+            engine1 = create_async_engine(db_url, **engine_options)
             async with engine1.begin() as conn:
                 await conn.run_sync(Base.metadata.create_all)
 
@@ -189,23 +173,24 @@ class TestCompleteUploadFlow:
 
             job_ids = []
 
+            base_metadata = VideoMetadata(
+                title="Restart Test", description="", privacy_status=PrivacyStatus.PRIVATE
+            ).model_dump()
+
             # Phase 1: Create jobs (before "restart")
             async with session_maker() as session:
                 for i in range(3):
                     job_id = make_job_id()
                     job_ids.append(job_id)
-                    metadata = VideoMetadata(
-                        title=f"Restart Test {i}",
-                        description="",
-                        privacy_status=PrivacyStatus.PRIVATE,
-                    )
                     job = QueueJobModel(
                         id=job_id,
                         user_id="test-user",
                         drive_file_id=f"restart-file-{i}",
                         drive_file_name=f"restart_{i}.mp4",
                         drive_md5_checksum=f"restart-md5-{i}",
-                        metadata_json=metadata.model_dump_json(),
+                        metadata_json=orjson.dumps(
+                            base_metadata | {"title": f"Restart Test {i}"}
+                        ).decode(),
                         status="pending",
                         progress=0.0,
                         message="",
@@ -220,7 +205,7 @@ class TestCompleteUploadFlow:
             await engine1.dispose()
 
             # Phase 2: After "restart", create new engine and verify jobs persist
-            engine2 = create_async_engine(db_url, echo=False)
+            engine2 = create_async_engine(db_url, **engine_options)
             new_session_maker = async_sessionmaker(
                 bind=engine2,
                 class_=AsyncSession,
@@ -228,33 +213,21 @@ class TestCompleteUploadFlow:
             )
 
             async with new_session_maker() as session:
-                result = await session.execute(
-                    select(QueueJobModel).where(QueueJobModel.status == "pending")
-                )
+                result = await session.execute(_PENDING_JOBS)
                 pending_jobs = result.scalars().all()
 
                 assert len(pending_jobs) == 3
-                retrieved_ids = [job.id for job in pending_jobs]
-                for job_id in job_ids:
-                    assert job_id in retrieved_ids
+                retrieved_ids = {job.id for job in pending_jobs}
+                assert set(job_ids) <= retrieved_ids
 
             await engine2.dispose()
 
         finally:
-            # Cleanup
-            if os.path.exists(db_path):
-                os.remove(db_path)
+            keeper.close()
 
     @pytest.mark.asyncio
-    async def test_error_recovery(self, test_engine):
+    async def test_error_recovery(self, test_engine, session_factory):
         """Test error recovery and retry mechanism."""
-        from app.models import QueueJobModel
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
 
         job_id = make_job_id()
         metadata = VideoMetadata(
@@ -263,8 +236,8 @@ class TestCompleteUploadFlow:
             privacy_status=PrivacyStatus.PRIVATE,
         )
 
-        # Create job
-        async with session_maker() as session:
+        async with session_factory() as session:
+            # Create job
             job = QueueJobModel(
                 id=job_id,
                 user_id="test-user",
@@ -282,38 +255,20 @@ class TestCompleteUploadFlow:
             session.add(job)
             await session.commit()
 
-        # First attempt fails
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            job = result.scalars().first()
-
+            # First attempt fails
             job.status = "pending"  # Reset for retry
             job.retry_count = 1
             job.error = "Network timeout during download"
             job.message = "Retry 1/3"
             await session.commit()
 
-        # Second attempt fails
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            job = result.scalars().first()
-
+            # Second attempt fails
             job.retry_count = 2
             job.error = "YouTube API rate limit"
             job.message = "Retry 2/3"
             await session.commit()
 
-        # Third attempt succeeds
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            job = result.scalars().first()
-
+            # Third attempt succeeds
             job.status = "completed"
             job.progress = 100.0
             job.video_id = "yt-recovered"
@@ -324,26 +279,16 @@ class TestCompleteUploadFlow:
             await session.commit()
 
         # Verify recovery
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            final_job = result.scalars().first()
+        async with session_factory() as session:
+            final_job = await session.get(QueueJobModel, job_id)
 
             assert final_job.status == "completed"
             assert final_job.retry_count == 2
             assert final_job.video_id == "yt-recovered"
 
     @pytest.mark.asyncio
-    async def test_max_retries_exceeded(self, test_engine):
+    async def test_max_retries_exceeded(self, test_engine, session_factory):
         """Test job fails permanently after max retries."""
-        from app.models import QueueJobModel
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
 
         job_id = make_job_id()
         metadata = VideoMetadata(
@@ -352,8 +297,8 @@ class TestCompleteUploadFlow:
             privacy_status=PrivacyStatus.PRIVATE,
         )
 
-        # Create job with max_retries=2
-        async with session_maker() as session:
+        async with session_factory() as session:
+            # Create job with max_retries=2
             job = QueueJobModel(
                 id=job_id,
                 user_id="test-user",
@@ -371,14 +316,7 @@ class TestCompleteUploadFlow:
             session.add(job)
             await session.commit()
 
-        # Exhaust retries
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            job = result.scalars().first()
-
-            # After max retries, mark as failed
+            # Exhaust retries: after max retries, mark as failed
             job.status = "failed"
             job.retry_count = 2
             job.error = "Max retries exceeded: persistent error"
@@ -386,93 +324,95 @@ class TestCompleteUploadFlow:
             await session.commit()
 
         # Verify permanent failure
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            final_job = result.scalars().first()
+        async with session_factory() as session:
+            final_job = await session.get(QueueJobModel, job_id)
 
             assert final_job.status == "failed"
             assert final_job.retry_count == 2
             assert "Max retries exceeded" in final_job.error
 
     @pytest.mark.asyncio
-    async def test_batch_upload_flow(self, test_engine):
+    async def test_batch_upload_flow(self, test_engine, session_factory):
         """Test batch upload with multiple files."""
-        from app.models import QueueJobModel, UploadHistory
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
 
         batch_id = "batch-e2e-001"
-        job_ids = []
-
-        # Create batch of jobs
-        async with session_maker() as session:
-            for i in range(5):
-                job_id = make_job_id()
-                job_ids.append(job_id)
-                metadata = VideoMetadata(
-                    title=f"Batch Video {i+1}",
-                    description=f"Part {i+1} of batch upload",
-                    privacy_status=PrivacyStatus.UNLISTED,
-                )
-                job = QueueJobModel(
-                    id=job_id,
-                    user_id="test-user",
-                    drive_file_id=f"batch-file-{i}",
-                    drive_file_name=f"batch_{i}.mp4",
-                    drive_md5_checksum=f"batch-md5-{i}",
-                    folder_path="/batch/folder",
-                    batch_id=batch_id,
-                    metadata_json=metadata.model_dump_json(),
-                    status="pending",
-                    progress=0.0,
-                    message="",
-                    retry_count=0,
-                    max_retries=3,
-                    created_at=datetime.now(UTC),
-                )
-                session.add(job)
-            await session.commit()
 
-        # Process all jobs
-        async with session_maker() as session:
-            for i, job_id in enumerate(job_ids):
-                result = await session.execute(
-                    select(QueueJobModel).where(QueueJobModel.id == job_id)
-                )
-                job = result.scalars().first()
-
-                job.status = "completed"
-                job.progress = 100.0
-                job.video_id = f"yt-batch-{i}"
-                job.video_url = f"https://youtube.com/watch?v=yt-batch-{i}"
-                job.completed_at = datetime.now(UTC)
-
-                # Save history
-                history = UploadHistory(
-                    drive_file_id=job.drive_file_id,
-                    drive_file_name=job.drive_file_name,
-                    drive_md5_checksum=job.drive_md5_checksum or "",
-                    youtube_video_id=job.video_id,
-                    youtube_video_url=job.video_url,
-                    folder_path=job.folder_path or "",
-                    status="completed",
-                    uploaded_at=datetime.now(UTC),
-                )
-                session.add(history)
+        job_ids = [make_job_id() for _ in range(5)]
+        # Validate the metadata once; only title and description vary per job
+        base_metadata = VideoMetadata(
+            title="Batch Video", privacy_status=PrivacyStatus.UNLISTED
+        ).model_dump()
+
+        async with session_factory() as session:
+            # Create batch of jobs in one executemany
+            created_at = datetime.now(UTC)
+            await session.execute(
+                insert(QueueJobModel),
+                [
+                    {
+                        "id": job_id,
+                        "user_id": "test-user",
+                        "drive_file_id": f"batch-file-{i}",
+                        "drive_file_name": f"batch_{i}.mp4",
+                        "drive_md5_checksum": f"batch-md5-{i}",
+                        "folder_path": "/batch/folder",
+                        "batch_id": batch_id,
+                        "metadata_json": orjson.dumps(
+                            base_metadata
+                            | {
+                                "title": f"Batch Video {i+1}",
+                                "description": f"Part {i+1} of batch upload",
+                            }
+                        ).decode(),
+                        "status": "pending",
+                        "progress": 0.0,
+                        "message": "",
+                        "retry_count": 0,
+                        "max_retries": 3,
+                        "created_at": created_at,
+                    }
+                    for i, job_id in enumerate(job_ids)
+                ],
+            )
+            await session.commit()
 
+            # Process all jobs: bulk UPDATE by primary key, then bulk history insert
+            completed_at = datetime.now(UTC)
+            await session.execute(
+                update(QueueJobModel),
+                [
+                    {
+                        "id": job_id,
+                        "status": "completed",
+                        "progress": 100.0,
+                        "video_id": f"yt-batch-{i}",
+                        "video_url": f"https://youtube.com/watch?v=yt-batch-{i}",
+                        "completed_at": completed_at,
+                    }
+                    for i, job_id in enumerate(job_ids)
+                ],
+            )
+            await session.execute(
+                insert(UploadHistory),
+                [
+                    {
+                        "drive_file_id": f"batch-file-{i}",
+                        "drive_file_name": f"batch_{i}.mp4",
+                        "drive_md5_checksum": f"batch-md5-{i}",
+                        "youtube_video_id": f"yt-batch-{i}",
+                        "youtube_video_url": f"https://youtube.com/watch?v=yt-batch-{i}",
+                        "folder_path": "/batch/folder",
+                        "status": "completed",
+                        "uploaded_at": completed_at,
+                    }
+                    for i in range(len(job_ids))
+                ],
+            )
             await session.commit()
 
         # Verify batch completion
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.batch_id == batch_id)
-            )
+        async with session_factory() as session:
+            result = await session.execute(_JOBS_BY_BATCH, {"batch_id": batch_id})
             batch_jobs = result.scalars().all()
 
             assert len(batch_jobs) == 5
@@ -480,9 +420,7 @@ class TestCompleteUploadFlow:
 
             # Verify all records in history
             result = await session.execute(
-                select(UploadHistory).where(
-                    UploadHistory.folder_path == "/batch/folder"
-                )
+                _HISTORY_BY_FOLDER, {"folder_path": "/batch/folder"}
             )
             history_records = result.scalars().all()
             assert len(history_records) == 5
@@ -6,9 +6,9 @@ from fastapi.testclient import TestClient
 from app.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client() -> TestClient:
-    """Create test client."""
+    """Create a test client shared by the read-only tests in this module."""
     return TestClient(app)
 
 
@@ -4,11 +4,22 @@ Test categories:
 4.1 トークン暗号化テスト
 """
 
-from datetime import UTC, datetime
+import base64
+import hashlib
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from cryptography.fernet import Fernet, InvalidToken
+from google.oauth2.credentials import Credentials
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.oauth import OAuthService
+from app.config import get_settings
+from app.crypto import decrypt_token, decrypt_tokens, encrypt_token, encrypt_tokens
+from app.models import OAuthToken
 
 
 class TestTokenEncryption:
@@ -17,8 +28,6 @@ class TestTokenEncryption:
     @staticmethod
     def test_token_encryption():
         """Test tokens are encrypted correctly."""
-        from app.crypto import decrypt_token, encrypt_token
-
         original_token = "ya29.a0AfH6SMBxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
 
         encrypted = encrypt_token(original_token)
@@ -34,8 +43,6 @@ class TestTokenEncryption:
     @staticmethod
     def test_token_decryption():
         """Test tokens can be decrypted and used."""
-        from app.crypto import decrypt_token, encrypt_token
-
         # Test with various token formats
         tokens = [
             "short_token",
@@ -44,16 +51,15 @@ class TestTokenEncryption:
             "unicode_トークン_日本語",
         ]
 
-        for original in tokens:
-            encrypted = encrypt_token(original)
-            decrypted = decrypt_token(encrypted)
-            assert decrypted == original, f"Failed for token: {original}"
+        encrypted = encrypt_tokens(tokens)
+
+        # Every token gets its own nonce
+        assert len(set(encrypted)) == len(tokens)
+        assert decrypt_tokens(encrypted) == tokens
 
     @staticmethod
     def test_refresh_token_encryption():
         """Test refresh tokens are also encrypted."""
-        from app.crypto import decrypt_token, encrypt_token
-
         refresh_token = "1//0eXxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"
 
         encrypted = encrypt_token(refresh_token)
@@ -64,8 +70,6 @@ class TestTokenEncryption:
     @staticmethod
     def test_encryption_uses_secret_key(clear_settings_cache):
         """Test encryption uses the configured secret key."""
-        from app.crypto import encrypt_token
-
         token = "test_token"
 
         # Encrypt with default key
@@ -74,20 +78,34 @@ class TestTokenEncryption:
         # Should produce consistent output with same key
         encrypted2 = encrypt_token(token)
 
-        # Note: Fernet encryption includes random IV, so same plaintext
+        # Note: AES-GCM encryption uses a random nonce, so same plaintext
         # produces different ciphertext. But both should decrypt correctly.
-        from app.crypto import decrypt_token
         assert decrypt_token(encrypted1) == token
         assert decrypt_token(encrypted2) == token
 
+    @staticmethod
+    def test_legacy_fernet_token_decrypts():
+        """Test tokens stored by earlier Fernet releases still decrypt."""
+        key = hashlib.sha256(get_settings().secret_key.encode()).digest()
+        legacy = Fernet(base64.urlsafe_b64encode(key)).encrypt(b"legacy_token")
+
+        assert decrypt_token(legacy.decode()) == "legacy_token"
+
+    @staticmethod
+    def test_tampered_token_raises_invalid_token():
+        """Test a modified AES-GCM token fails authentication."""
+        data = bytearray(base64.urlsafe_b64decode(encrypt_token("secret")))
+        data[-1] ^= 0x01
+
+        with pytest.raises(InvalidToken):
+            decrypt_token(base64.urlsafe_b64encode(bytes(data)).decode())
+
     @pytest.mark.asyncio
     async def test_token_persistence_in_db(self, test_session: AsyncSession):
         """Test encrypted tokens can be stored in database."""
-        from app.crypto import decrypt_token, encrypt_token
-        from app.models import OAuthToken
-
         access_token = "ya29.access_token_value"
         refresh_token = "1//refresh_token_value"
+        now = datetime.now(UTC)
 
         oauth_token = OAuthToken(
             user_id="session-123",
@@ -95,9 +113,9 @@ class TestTokenEncryption:
             encrypted_refresh_token=encrypt_token(refresh_token),
             token_uri="https://oauth2.googleapis.com/token",
             scopes='["scope1", "scope2"]',
-            expires_at=datetime.now(UTC),
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            expires_at=now,
+            created_at=now,
+            updated_at=now,
         )
 
         test_session.add(oauth_token)
@@ -117,19 +135,17 @@ class TestTokenEncryption:
     @pytest.mark.asyncio
     async def test_token_refresh_update(self, test_session: AsyncSession):
         """Test token refresh updates correctly in database."""
-        from app.crypto import decrypt_token, encrypt_token
-        from app.models import OAuthToken
-
         # Initial token
+        now = datetime.now(UTC)
         oauth_token = OAuthToken(
             user_id="refresh-test-user",
             encrypted_access_token=encrypt_token("old_access_token"),
             encrypted_refresh_token=encrypt_token("old_refresh_token"),
             token_uri="https://oauth2.googleapis.com/token",
             scopes='["scope1"]',
-            expires_at=datetime.now(UTC),
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
+            expires_at=now,
+            created_at=now,
+            updated_at=now,
         )
 
         test_session.add(oauth_token)
@@ -156,16 +172,12 @@ class TestTokenEncryption:
     @staticmethod
     def test_invalid_encrypted_data_raises_error():
         """Test decryption fails gracefully for invalid data."""
-        from app.crypto import decrypt_token
-
         with pytest.raises(Exception):
             decrypt_token("invalid-not-base64-encoded-data!!!")
 
     @staticmethod
     def test_empty_token_handling():
         """Test empty token handling."""
-        from app.crypto import decrypt_token, encrypt_token
-
         empty_token = ""
         encrypted = encrypt_token(empty_token)
         decrypted = decrypt_token(encrypted)
@@ -175,21 +187,23 @@ class TestTokenEncryption:
     @pytest.mark.asyncio
     async def test_multiple_users_tokens_isolated(self, test_session: AsyncSession):
         """Test tokens for different users are isolated."""
-        from app.crypto import decrypt_token, encrypt_token
-        from app.models import OAuthToken
-
         # Create tokens for two different users
-        for user_num in range(2):
-            oauth_token = OAuthToken(
-                user_id=f"user-{user_num}",
-                encrypted_access_token=encrypt_token(f"access_token_{user_num}"),
-                encrypted_refresh_token=encrypt_token(f"refresh_token_{user_num}"),
-                token_uri="https://oauth2.googleapis.com/token",
-                scopes='["scope1"]',
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-            )
-            test_session.add(oauth_token)
+        now = datetime.now(UTC)
+        await test_session.execute(
+            insert(OAuthToken),
+            [
+                {
+                    "user_id": f"user-{user_num}",
+                    "encrypted_access_token": encrypt_token(f"access_token_{user_num}"),
+                    "encrypted_refresh_token": encrypt_token(f"refresh_token_{user_num}"),
+                    "token_uri": "https://oauth2.googleapis.com/token",
+                    "scopes": '["scope1"]',
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for user_num in range(2)
+            ],
+        )
 
         await test_session.commit()
 
@@ -215,12 +229,62 @@ class TestOAuthServiceWithDB:
         # For now, it serves as a specification
         pass
 
+    @staticmethod
+    async def _store_token(test_engine, expires_at: datetime) -> None:
+        """Store an encrypted token row for user "oauth-user"."""
+        now = datetime.now(UTC)
+        async with async_sessionmaker(bind=test_engine)() as session:
+            session.add(
+                OAuthToken(
+                    user_id="oauth-user",
+                    encrypted_access_token=encrypt_token("stored-access-token"),
+                    encrypted_refresh_token=encrypt_token("stored-refresh-token"),
+                    token_uri="https://oauth2.googleapis.com/token",
+                    scopes='["scope1"]',
+                    expires_at=expires_at,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            await session.commit()
+
+    @staticmethod
+    def _db_context(test_engine):
+        """Build a get_db_context replacement bound to the test engine."""
+        @asynccontextmanager
+        async def db_context():
+            async with async_sessionmaker(bind=test_engine)() as session:
+                yield session
+                await session.commit()
+
+        return db_context
+
     @pytest.mark.asyncio
     async def test_oauth_service_loads_from_db(self, test_engine, mock_settings):
         """Test OAuthService loads credentials from database."""
-        pass
+        expires_at = datetime.now(UTC) + timedelta(minutes=30)
+        await self._store_token(test_engine, expires_at)
+
+        with patch("app.database.get_db_context", self._db_context(test_engine)):
+            credentials = await OAuthService().get_credentials("oauth-user")
+
+        assert credentials.token == "stored-access-token"
+        assert credentials.refresh_token == "stored-refresh-token"
+        assert credentials.expiry == expires_at.replace(tzinfo=None)
+        assert credentials.expired is False
 
     @pytest.mark.asyncio
     async def test_oauth_service_refreshes_token(self, test_engine, mock_settings):
         """Test OAuthService can refresh expired tokens."""
-        pass
+        await self._store_token(test_engine, datetime.now(UTC) - timedelta(minutes=5))
+
+        def refresh(credentials, request):
+            credentials.token = "refreshed-access-token"
+            credentials.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+
+        with patch("app.database.get_db_context", self._db_context(test_engine)), \
+                patch.object(Credentials, "refresh", autospec=True, side_effect=refresh):
+            credentials = await OAuthService().get_credentials("oauth-user")
+
+        assert credentials.token == "refreshed-access-token"
+        assert credentials.expired is False
@@ -5,19 +5,42 @@ Test categories:
 2.2 キュー操作テスト
 """
 
-from datetime import UTC, datetime
-from uuid import uuid4
+from datetime import UTC, datetime, timedelta
+from itertools import count
+from uuid import UUID
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models import QueueJobModel
 from app.youtube.schemas import PrivacyStatus, VideoMetadata
 
+# Statements shared by the tests, built once
+_PENDING_JOBS = (
+    select(QueueJobModel)
+    .where(QueueJobModel.status == "pending")
+    .order_by(QueueJobModel.created_at.asc())
+)
+_JOBS_BY_BATCH = select(QueueJobModel).where(
+    QueueJobModel.batch_id == bindparam("batch_id")
+)
+_QUEUED_JOBS_BY_MD5 = select(QueueJobModel).where(
+    QueueJobModel.drive_md5_checksum == bindparam("md5"),
+    QueueJobModel.status.in_(["pending", "downloading", "uploading"]),
+)
+
+
+_job_numbers = count(1)
+
 
 def make_job_id() -> str:
-    """Create a string job ID for SQLite compatibility."""
-    return str(uuid4())
+    """Create a string job ID for SQLite compatibility.
+
+    IDs come from a counter rather than uuid4, but keep the canonical UUID
+    form because QueueRepository parses stored IDs back into UUIDs.
+    """
+    return str(UUID(int=next(_job_numbers)))
 
 
 class TestQueuePersistence:
@@ -26,8 +49,6 @@ class TestQueuePersistence:
     @pytest.mark.asyncio
     async def test_queue_job_model_creation(self, test_session: AsyncSession):
         """Test QueueJob model can be created and saved to database."""
-        from app.models import QueueJobModel
-
         job_id = make_job_id()
         metadata = VideoMetadata(
             title="Test Video",
@@ -54,25 +75,14 @@ class TestQueuePersistence:
 
         test_session.add(job)
         await test_session.commit()
-        await test_session.refresh(job)
 
         assert job.id == job_id
         assert job.drive_file_id == "test-file-123"
         assert job.status == "pending"
 
     @pytest.mark.asyncio
-    async def test_job_persistence_across_sessions(self, test_engine):
+    async def test_job_persistence_across_sessions(self, test_engine, session_factory):
         """Test jobs persist across different database sessions."""
-        from sqlalchemy.ext.asyncio import async_sessionmaker
-
-        from app.models import QueueJobModel
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-
         job_id = make_job_id()
         metadata = VideoMetadata(
             title="Persistent Video",
@@ -81,7 +91,7 @@ class TestQueuePersistence:
         )
 
         # Session 1: Create job
-        async with session_maker() as session1:
+        async with session_factory() as session1:
             job = QueueJobModel(
                 id=job_id,
                 user_id="test-user",
@@ -100,62 +110,50 @@ class TestQueuePersistence:
             await session1.commit()
 
         # Session 2: Retrieve job
-        async with session_maker() as session2:
-            result = await session2.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            retrieved_job = result.scalars().first()
+        async with session_factory() as session2:
+            retrieved_job = await session2.get(QueueJobModel, job_id)
 
             assert retrieved_job is not None
             assert retrieved_job.drive_file_id == "persist-file"
             assert retrieved_job.status == "pending"
 
     @pytest.mark.asyncio
-    async def test_job_restore_after_restart(self, test_engine):
+    async def test_job_restore_after_restart(self, test_engine, session_factory):
         """Test jobs can be restored after simulated restart."""
-        from sqlalchemy.ext.asyncio import async_sessionmaker
-
-        from app.models import QueueJobModel
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-
         # Create multiple pending jobs
-        job_ids = []
-        async with session_maker() as session:
-            for i in range(3):
-                job_id = make_job_id()
-                job_ids.append(job_id)
-                metadata = VideoMetadata(
-                    title=f"Video {i}",
-                    description=f"Description {i}",
-                    privacy_status=PrivacyStatus.PRIVATE,
-                )
-                job = QueueJobModel(
-                    id=job_id,
-                    user_id="test-user",
-                    drive_file_id=f"file-{i}",
-                    drive_file_name=f"video_{i}.mp4",
-                    drive_md5_checksum=f"md5-{i}",
-                    metadata_json=metadata.model_dump_json(),
-                    status="pending",
-                    progress=0.0,
-                    message="",
-                    retry_count=0,
-                    max_retries=3,
-                    created_at=datetime.now(UTC),
-                )
-                session.add(job)
+        job_ids = [make_job_id() for _ in range(3)]
+        metadata_json = VideoMetadata(
+            title="Restored Video",
+            description="",
+            privacy_status=PrivacyStatus.PRIVATE,
+        ).model_dump_json()
+        now = datetime.now(UTC)
+        async with session_factory() as session:
+            await session.execute(
+                insert(QueueJobModel),
+                [
+                    {
+                        "id": job_id,
+                        "user_id": "test-user",
+                        "drive_file_id": f"file-{i}",
+                        "drive_file_name": f"video_{i}.mp4",
+                        "drive_md5_checksum": f"md5-{i}",
+                        "metadata_json": metadata_json,
+                        "status": "pending",
+                        "progress": 0.0,
+                        "message": "",
+                        "retry_count": 0,
+                        "max_retries": 3,
+                        "created_at": now,
+                    }
+                    for i, job_id in enumerate(job_ids)
+                ],
+            )
             await session.commit()
 
         # Simulate restart: new session, retrieve all pending jobs
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.status == "pending")
-            )
+        async with session_factory() as session:
+            result = await session.execute(_PENDING_JOBS)
             pending_jobs = result.scalars().all()
 
             assert len(pending_jobs) == 3
@@ -167,66 +165,95 @@ class TestQueueOperations:
     """2.2 キュー操作テスト"""
 
     @pytest.mark.asyncio
-    async def test_fifo_order_guarantee(self, test_engine):
+    async def test_fifo_order_guarantee(self, test_engine, session_factory):
         """Test FIFO order is maintained for pending jobs."""
-        import asyncio
-
-        from sqlalchemy.ext.asyncio import async_sessionmaker
+        # Create jobs with specific order; explicit offsets keep the
+        # timestamps distinct without waiting for the clock to move
+        created_order = [make_job_id() for _ in range(5)]
+        base_time = datetime.now(UTC)
+        metadata_json = VideoMetadata(
+            title="FIFO Video",
+            description="",
+            privacy_status=PrivacyStatus.PRIVATE,
+        ).model_dump_json()
+        async with session_factory() as session:
+            await session.execute(
+                insert(QueueJobModel),
+                [
+                    {
+                        "id": job_id,
+                        "user_id": "test-user",
+                        "drive_file_id": f"fifo-file-{i}",
+                        "drive_file_name": f"fifo_{i}.mp4",
+                        "drive_md5_checksum": f"fifo-md5-{i}",
+                        "metadata_json": metadata_json,
+                        "status": "pending",
+                        "progress": 0.0,
+                        "message": "",
+                        "retry_count": 0,
+                        "max_retries": 3,
+                        "created_at": base_time + timedelta(microseconds=i),
+                    }
+                    for i, job_id in enumerate(created_order)
+                ],
+            )
+            await session.commit()
 
-        from app.models import QueueJobModel
+        # Retrieve in FIFO order
+        async with session_factory() as session:
+            result = await session.execute(_PENDING_JOBS)
+            fifo_jobs = result.scalars().all()
 
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
+            retrieved_order = [job.id for job in fifo_jobs]
+            assert retrieved_order == created_order
 
-        # Create jobs with specific order
-        created_order = []
-        async with session_maker() as session:
-            for i in range(5):
-                job_id = make_job_id()
-                created_order.append(job_id)
-                metadata = VideoMetadata(
-                    title=f"FIFO Video {i}",
-                    description="",
-                    privacy_status=PrivacyStatus.PRIVATE,
-                )
-                job = QueueJobModel(
+    @pytest.mark.asyncio
+    async def test_next_pending_job_skips_excluded(self, test_session: AsyncSession):
+        """Test the next pending job skips jobs already being processed."""
+        from app.queue.repositories import QueueRepository
+
+        job_ids = [make_job_id() for _ in range(3)]
+        created_at = datetime.now(UTC)
+        for i, job_id in enumerate(job_ids):
+            test_session.add(
+                QueueJobModel(
                     id=job_id,
                     user_id="test-user",
-                    drive_file_id=f"fifo-file-{i}",
-                    drive_file_name=f"fifo_{i}.mp4",
-                    drive_md5_checksum=f"fifo-md5-{i}",
-                    metadata_json=metadata.model_dump_json(),
+                    drive_file_id=f"next-file-{i}",
+                    drive_file_name=f"next_{i}.mp4",
+                    metadata_json='{"title": "Next"}',
                     status="pending",
-                    progress=0.0,
-                    message="",
-                    retry_count=0,
-                    max_retries=3,
-                    created_at=datetime.now(UTC),
+                    created_at=created_at + timedelta(seconds=i),
                 )
-                session.add(job)
-                await session.commit()
-                await asyncio.sleep(0.01)  # Ensure different timestamps
+            )
+        await test_session.commit()
 
-        # Retrieve in FIFO order
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel)
-                .where(QueueJobModel.status == "pending")
-                .order_by(QueueJobModel.created_at.asc())
+        repo = QueueRepository(test_session)
+
+        assert (await repo.get_next_pending_job()).id == UUID(job_ids[0])
+        next_job = await repo.get_next_pending_job(exclude_ids={UUID(job_ids[0])})
+        assert next_job.id == UUID(job_ids[1])
+        assert await repo.get_next_pending_job(exclude_ids=job_ids) is None
+
+    @pytest.mark.asyncio
+    async def test_next_pending_job_uses_status_index(self, test_session: AsyncSession):
+        """Test the queue head is read from the index without sorting."""
+        from sqlalchemy import text
+
+        result = await test_session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM queue_jobs "
+                "WHERE status = 'pending' ORDER BY created_at LIMIT 1"
             )
-            fifo_jobs = result.scalars().all()
+        )
+        plan = " ".join(row.detail for row in result)
 
-            retrieved_order = [job.id for job in fifo_jobs]
-            assert retrieved_order == created_order
+        assert "ix_queue_jobs_status_created_at" in plan
+        assert "TEMP B-TREE" not in plan
 
     @pytest.mark.asyncio
     async def test_job_status_transitions(self, test_session: AsyncSession):
         """Test job status transitions work correctly."""
-        from app.models import QueueJobModel
-
         job_id = make_job_id()
         metadata = VideoMetadata(
             title="Status Test",
@@ -256,7 +283,6 @@ class TestQueueOperations:
         job.started_at = datetime.now(UTC)
         job.message = "Downloading from Drive..."
         await test_session.commit()
-        await test_session.refresh(job)
         assert job.status == "downloading"
         assert job.started_at is not None
 
@@ -265,7 +291,6 @@ class TestQueueOperations:
         job.progress = 50.0
         job.message = "Uploading to YouTube..."
         await test_session.commit()
-        await test_session.refresh(job)
         assert job.status == "uploading"
         assert job.progress == 50.0
 
@@ -276,15 +301,17 @@ class TestQueueOperations:
         job.video_id = "yt-12345"
         job.video_url = "https://youtube.com/watch?v=yt-12345"
         await test_session.commit()
+
+        # Reload once to check the whole lifecycle reached the database
         await test_session.refresh(job)
         assert job.status == "completed"
+        assert job.started_at is not None
+        assert job.progress == 100.0
         assert job.video_id == "yt-12345"
 
     @pytest.mark.asyncio
     async def test_error_handling_and_retry(self, test_session: AsyncSession):
         """Test error handling and retry mechanism."""
-        from app.models import QueueJobModel
-
         job_id = make_job_id()
         metadata = VideoMetadata(
             title="Retry Test",
@@ -315,7 +342,6 @@ class TestQueueOperations:
         job.error = "Network timeout"
         await test_session.commit()
 
-        await test_session.refresh(job)
         assert job.retry_count == 1
         assert job.status == "pending"  # Ready for retry
         assert job.error == "Network timeout"
@@ -326,47 +352,50 @@ class TestQueueOperations:
         job.error = "Max retries exceeded"
         await test_session.commit()
 
+        # Reload once to check the final state reached the database
         await test_session.refresh(job)
         assert job.retry_count == 3
         assert job.status == "failed"
+        assert job.error == "Max retries exceeded"
 
     @pytest.mark.asyncio
     async def test_batch_job_grouping(self, test_session: AsyncSession):
         """Test jobs can be grouped by batch_id."""
-        from app.models import QueueJobModel
-
         batch_id = "batch-group-001"
 
         # Create multiple jobs in same batch
-        for i in range(3):
-            metadata = VideoMetadata(
-                title=f"Batch Video {i}",
-                description="",
-                privacy_status=PrivacyStatus.PRIVATE,
-            )
-            job = QueueJobModel(
-                id=make_job_id(),
-                user_id="test-user",
-                drive_file_id=f"batch-file-{i}",
-                drive_file_name=f"batch_{i}.mp4",
-                drive_md5_checksum=f"batch-md5-{i}",
-                batch_id=batch_id,
-                metadata_json=metadata.model_dump_json(),
-                status="pending",
-                progress=0.0,
-                message="",
-                retry_count=0,
-                max_retries=3,
-                created_at=datetime.now(UTC),
-            )
-            test_session.add(job)
+        metadata_json = VideoMetadata(
+            title="Batch Video",
+            description="",
+            privacy_status=PrivacyStatus.PRIVATE,
+        ).model_dump_json()
+        now = datetime.now(UTC)
+        await test_session.execute(
+            insert(QueueJobModel),
+            [
+                {
+                    "id": make_job_id(),
+                    "user_id": "test-user",
+                    "drive_file_id": f"batch-file-{i}",
+                    "drive_file_name": f"batch_{i}.mp4",
+                    "drive_md5_checksum": f"batch-md5-{i}",
+                    "batch_id": batch_id,
+                    "metadata_json": metadata_json,
+                    "status": "pending",
+                    "progress": 0.0,
+                    "message": "",
+                    "retry_count": 0,
+                    "max_retries": 3,
+                    "created_at": now,
+                }
+                for i in range(3)
+            ],
+        )
 
         await test_session.commit()
 
         # Query by batch
-        result = await test_session.execute(
-            select(QueueJobModel).where(QueueJobModel.batch_id == batch_id)
-        )
+        result = await test_session.execute(_JOBS_BY_BATCH, {"batch_id": batch_id})
         batch_jobs = result.scalars().all()
 
         assert len(batch_jobs) == 3
@@ -376,8 +405,6 @@ class TestQueueOperations:
     @pytest.mark.asyncio
     async def test_md5_duplicate_detection(self, test_session: AsyncSession):
         """Test MD5 checksum can be used for duplicate detection."""
-        from app.models import QueueJobModel
-
         md5 = "duplicate-md5-checksum"
 
         # Create first job
@@ -404,12 +431,7 @@ class TestQueueOperations:
         await test_session.commit()
 
         # Check for duplicate
-        result = await test_session.execute(
-            select(QueueJobModel).where(
-                QueueJobModel.drive_md5_checksum == md5,
-                QueueJobModel.status.in_(["pending", "downloading", "uploading"])
-            )
-        )
+        result = await test_session.execute(_QUEUED_JOBS_BY_MD5, {"md5": md5})
         existing = result.scalars().first()
 
         assert existing is not None
@@ -6,30 +6,59 @@ Test categories:
 """
 
 import asyncio
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.models import QueueJobModel
+from app.queue.worker import QueueWorker
+from app.youtube.quota import QuotaTracker
 from app.youtube.schemas import PrivacyStatus, VideoMetadata
 
+# Shared timestamp; only relative order within a test matters
+_NOW = datetime.now(UTC)
+
+# The worker tests never read the metadata back, so every job shares it
+_METADATA_JSON = VideoMetadata.model_construct(
+    title="Worker Test",
+    description="",
+    privacy_status=PrivacyStatus.PRIVATE,
+).model_dump_json()
+
 
 def make_job_id() -> str:
     """Create a string job ID for SQLite compatibility."""
     return str(uuid4())
 
 
+# Columns every worker test job shares unless overridden
+_JOB_DEFAULTS = {
+    "user_id": "test-user",
+    "metadata_json": _METADATA_JSON,
+    "status": "pending",
+    "progress": 0.0,
+    "message": "",
+    "retry_count": 0,
+    "max_retries": 3,
+    "created_at": _NOW,
+}
+
+
+def make_job(**overrides) -> QueueJobModel:
+    """Create a pending queue job row with test defaults."""
+    fields = {"id": make_job_id(), **_JOB_DEFAULTS}
+    return QueueJobModel(**(fields | overrides))
+
+
 class TestWorkerProcessSeparation:
     """3.1 Workerプロセス分離テスト"""
 
     @pytest.mark.asyncio
     async def test_worker_can_run_standalone(self):
         """Test worker can be started as a standalone process."""
-        from app.queue.worker import QueueWorker
-
         worker = QueueWorker()
 
         # Worker should not be running initially
@@ -39,77 +68,50 @@ class TestWorkerProcessSeparation:
         await worker.start()
         assert worker.is_running() is True
 
-        # Give it a moment to start the loop
-        await asyncio.sleep(0.1)
+        # Wait until the processing loop is actually running
+        await asyncio.wait_for(worker._loop_started.wait(), timeout=1.0)
 
         # Stop worker
         await worker.stop()
         assert worker.is_running() is False
 
     @pytest.mark.asyncio
-    async def test_worker_db_communication(self, test_engine):
+    async def test_worker_db_communication(self, test_session):
         """Test worker communicates with web via database."""
-        from app.models import QueueJobModel
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-
         job_id = make_job_id()
-        metadata = VideoMetadata(
-            title="DB Communication Test",
-            description="",
-            privacy_status=PrivacyStatus.PRIVATE,
-        )
 
         # Web process: Create a job
-        async with session_maker() as web_session:
-            job = QueueJobModel(
+        test_session.add(
+            make_job(
                 id=job_id,
-                user_id="test-user",
                 drive_file_id="comm-test-file",
                 drive_file_name="comm.mp4",
                 drive_md5_checksum="comm-md5",
-                metadata_json=metadata.model_dump_json(),
-                status="pending",
-                progress=0.0,
-                message="",
-                retry_count=0,
-                max_retries=3,
-                created_at=datetime.now(UTC),
             )
-            web_session.add(job)
-            await web_session.commit()
+        )
+        await test_session.flush()
+        # Expiring forces each side to reload the row from the database
+        test_session.expire_all()
 
         # Worker process: Fetch and update job
-        async with session_maker() as worker_session:
-            result = await worker_session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            worker_job = result.scalars().first()
+        worker_job = await test_session.get(QueueJobModel, job_id)
 
-            assert worker_job is not None
-            worker_job.status = "downloading"
-            worker_job.message = "Worker updating..."
-            await worker_session.commit()
+        assert worker_job is not None
+        worker_job.status = "downloading"
+        worker_job.message = "Worker updating..."
+        await test_session.flush()
+        test_session.expire_all()
 
         # Web process: See the update
-        async with session_maker() as web_session:
-            result = await web_session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            updated_job = result.scalars().first()
+        updated_job = await test_session.get(QueueJobModel, job_id)
 
-            assert updated_job.status == "downloading"
-            assert updated_job.message == "Worker updating..."
+        assert updated_job.status == "downloading"
+        assert updated_job.message == "Worker updating..."
+        await test_session.commit()
 
     @pytest.mark.asyncio
     async def test_graceful_shutdown(self):
         """Test worker handles graceful shutdown correctly."""
-        from app.queue.worker import QueueWorker
-
         worker = QueueWorker()
         await worker.start()
 
@@ -122,12 +124,39 @@ class TestWorkerProcessSeparation:
         assert worker.is_running() is False
         assert worker._task is not None  # Task should exist but be cancelled
 
+    @pytest.mark.asyncio
+    async def test_stop_while_at_capacity_releases_slot_once(self):
+        """Test cancelling the capacity wait leaves every upload slot free."""
+        worker = QueueWorker()
+        limit = worker.settings.max_concurrent_uploads
+        repo = MagicMock()
+        # Other processes already run as many jobs as the limit allows
+        repo.get_active_jobs = AsyncMock(
+            return_value=[MagicMock(id=make_job_id()) for _ in range(limit)]
+        )
+        db_context = MagicMock()
+        db_context.return_value.__aenter__ = AsyncMock()
+        db_context.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        with (
+            patch("app.database.get_db_context", db_context),
+            patch("app.queue.repositories.QueueRepository", return_value=repo),
+        ):
+            await worker.start()
+            await asyncio.wait_for(worker._loop_started.wait(), timeout=1.0)
+            # Let the loop reach its sleep after finding no free capacity
+            while not repo.get_active_jobs.await_count:
+                await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            await worker.stop()
+
+        assert worker._upload_slots._value == limit
+
     @pytest.mark.skip(reason="Obsolete - QueueManager replaced with database-backed QueueManagerDB")
     @pytest.mark.asyncio
     async def test_worker_handles_no_pending_jobs(self):
         """Test worker handles case when no pending jobs exist."""
         from app.queue.manager import QueueManager
-        from app.queue.worker import QueueWorker
 
         # Create a worker with mocked queue manager
         worker = QueueWorker()
@@ -151,44 +180,22 @@ class TestWorkerIntegration:
     """3.2 TestClient統合テスト"""
 
     @pytest.mark.asyncio
-    async def test_background_task_execution(self, test_engine):
+    async def test_background_task_execution(self, test_engine, session_factory):
         """Test background tasks are executed by worker."""
-        from app.models import QueueJobModel
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-
         job_id = make_job_id()
-        metadata = VideoMetadata(
-            title="Background Task Test",
-            description="",
-            privacy_status=PrivacyStatus.PRIVATE,
-        )
-
         # Create a pending job
-        async with session_maker() as session:
-            job = QueueJobModel(
+        async with session_factory() as session:
+            job = make_job(
                 id=job_id,
-                user_id="test-user",
                 drive_file_id="bg-task-file",
                 drive_file_name="bg_task.mp4",
                 drive_md5_checksum="bg-md5",
-                metadata_json=metadata.model_dump_json(),
-                status="pending",
-                progress=0.0,
-                message="",
-                retry_count=0,
-                max_retries=3,
-                created_at=datetime.now(UTC),
             )
             session.add(job)
             await session.commit()
 
         # Simulate worker processing (without actual YouTube upload)
-        async with session_maker() as session:
+        async with session_factory() as session:
             result = await session.execute(
                 select(QueueJobModel).where(
                     QueueJobModel.status == "pending"
@@ -202,60 +209,37 @@ class TestWorkerIntegration:
                 pending_job.progress = 100.0
                 pending_job.video_id = "simulated-yt-id"
                 pending_job.video_url = "https://youtube.com/watch?v=simulated-yt-id"
-                pending_job.completed_at = datetime.now(UTC)
+                pending_job.completed_at = _NOW
                 await session.commit()
 
         # Verify job was processed
-        async with session_maker() as session:
-            result = await session.execute(
-                select(QueueJobModel).where(QueueJobModel.id == job_id)
-            )
-            final_job = result.scalars().first()
+        async with session_factory() as session:
+            final_job = await session.get(QueueJobModel, job_id)
 
             assert final_job.status == "completed"
             assert final_job.video_id == "simulated-yt-id"
 
     @pytest.mark.asyncio
-    async def test_endpoint_worker_integration(self, test_engine):
+    async def test_endpoint_worker_integration(self, test_engine, session_factory):
         """Test API endpoint and worker work together."""
-        from app.models import QueueJobModel
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-
         # Simulate API creating multiple jobs
-        job_ids = []
-        async with session_maker() as session:
-            for i in range(3):
-                job_id = make_job_id()
-                job_ids.append(job_id)
-                metadata = VideoMetadata(
-                    title=f"Integration Test {i}",
-                    description="",
-                    privacy_status=PrivacyStatus.PRIVATE,
-                )
-                job = QueueJobModel(
-                    id=job_id,
-                    user_id="test-user",
-                    drive_file_id=f"int-file-{i}",
-                    drive_file_name=f"int_{i}.mp4",
-                    drive_md5_checksum=f"int-md5-{i}",
-                    metadata_json=metadata.model_dump_json(),
-                    status="pending",
-                    progress=0.0,
-                    message="",
-                    retry_count=0,
-                    max_retries=3,
-                    created_at=datetime.now(UTC),
-                )
-                session.add(job)
+        # Distinct timestamps keep the FIFO order deterministic
+        jobs = [
+            make_job(
+                drive_file_id=f"int-file-{i}",
+                drive_file_name=f"int_{i}.mp4",
+                drive_md5_checksum=f"int-md5-{i}",
+                created_at=_NOW + timedelta(microseconds=i),
+            )
+            for i in range(3)
+        ]
+        job_ids = [job.id for job in jobs]
+        async with session_factory() as session:
+            session.add_all(jobs)
             await session.commit()
 
         # Simulate worker processing in order
-        async with session_maker() as session:
+        async with session_factory() as session:
             for expected_id in job_ids:
                 result = await session.execute(
                     select(QueueJobModel).where(
@@ -268,11 +252,11 @@ class TestWorkerIntegration:
                 assert job.id == expected_id  # FIFO order
 
                 job.status = "completed"
-                job.completed_at = datetime.now(UTC)
+                job.completed_at = _NOW
                 await session.commit()
 
         # Verify all jobs completed
-        async with session_maker() as session:
+        async with session_factory() as session:
             result = await session.execute(
                 select(QueueJobModel).where(QueueJobModel.status == "pending")
             )
@@ -280,65 +264,27 @@ class TestWorkerIntegration:
             assert len(pending) == 0
 
     @pytest.mark.asyncio
-    async def test_worker_skips_active_jobs(self, test_engine):
+    async def test_worker_skips_active_jobs(self, test_engine, session_factory):
         """Test worker respects max concurrent uploads limit."""
-        from app.models import QueueJobModel
-
-        session_maker = async_sessionmaker(
-            bind=test_engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-
         # Create one active and one pending job
-        async with session_maker() as session:
-            # Active job
-            active_metadata = VideoMetadata(
-                title="Active Job",
-                description="",
-                privacy_status=PrivacyStatus.PRIVATE,
-            )
-            active_job = QueueJobModel(
-                id=make_job_id(),
-                user_id="test-user",
-                drive_file_id="active-file",
-                drive_file_name="active.mp4",
-                drive_md5_checksum="active-md5",
-                metadata_json=active_metadata.model_dump_json(),
-                status="uploading",  # Already active
-                progress=50.0,
-                message="",
-                retry_count=0,
-                max_retries=3,
-                created_at=datetime.now(UTC),
-            )
-            session.add(active_job)
-
-            # Pending job
-            pending_metadata = VideoMetadata(
-                title="Pending Job",
-                description="",
-                privacy_status=PrivacyStatus.PRIVATE,
-            )
-            pending_job = QueueJobModel(
-                id=make_job_id(),
-                user_id="test-user",
-                drive_file_id="pending-file",
-                drive_file_name="pending.mp4",
-                drive_md5_checksum="pending-md5",
-                metadata_json=pending_metadata.model_dump_json(),
-                status="pending",
-                progress=0.0,
-                message="",
-                retry_count=0,
-                max_retries=3,
-                created_at=datetime.now(UTC),
-            )
-            session.add(pending_job)
+        active_job = make_job(
+            drive_file_id="active-file",
+            drive_file_name="active.mp4",
+            drive_md5_checksum="active-md5",
+            status="uploading",  # Already active
+            progress=50.0,
+        )
+        pending_job = make_job(
+            drive_file_id="pending-file",
+            drive_file_name="pending.mp4",
+            drive_md5_checksum="pending-md5",
+        )
+        async with session_factory() as session:
+            session.add_all([active_job, pending_job])
             await session.commit()
 
         # Count active jobs
-        async with session_maker() as session:
+        async with session_factory() as session:
             result = await session.execute(
                 select(QueueJobModel).where(
                     QueueJobModel.status.in_(["downloading", "uploading"])
@@ -356,8 +302,6 @@ class TestProcessBatch:
     @pytest.mark.asyncio
     async def test_process_batch_empty_queue(self, test_engine):
         """Test process_batch returns 0 when queue is empty."""
-        from app.queue.worker import QueueWorker
-
         worker = QueueWorker()
 
         # Mock database context to return no pending jobs
@@ -383,15 +327,13 @@ class TestProcessBatch:
     @pytest.mark.asyncio
     async def test_process_batch_respects_max_jobs(self, test_engine):
         """Test process_batch stops when max_jobs limit is reached."""
-        from app.queue.worker import QueueWorker
-
         worker = QueueWorker()
 
         # Create mock jobs
         mock_jobs = [MagicMock(id=f"job-{i}") for i in range(5)]
         call_count = 0
 
-        async def get_next_pending_job():
+        async def get_next_pending_job(exclude_ids=None):
             nonlocal call_count
             if call_count < len(mock_jobs):
                 job = mock_jobs[call_count]
@@ -421,11 +363,91 @@ class TestProcessBatch:
         # Should have processed exactly 2 jobs (max_jobs limit)
         assert result == 2
 
+    @pytest.mark.asyncio
+    async def test_process_batch_runs_jobs_concurrently(self, test_engine):
+        """Test process_batch overlaps jobs up to max_concurrent_uploads."""
+        worker = QueueWorker()
+        limit = worker.settings.max_concurrent_uploads
+        mock_jobs = [MagicMock(id=f"job-{i}") for i in range(limit + 2)]
+        running = 0
+        peak = 0
+        excluded = []
+        started = set()
+
+        async def get_next_pending_job(exclude_ids=None):
+            excluded.append(set(exclude_ids or ()))
+            for job in mock_jobs:
+                if job.id not in (exclude_ids or ()) and job.id not in started:
+                    return job
+            return None
+
+        async def process_job(job_id, reservation):
+            nonlocal running, peak
+            started.add(job_id)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        with patch("app.database.get_db_context") as mock_db_context:
+            mock_db = AsyncMock()
+            mock_db_context.return_value.__aenter__ = AsyncMock(return_value=mock_db)
+            mock_db_context.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            with patch("app.queue.repositories.QueueRepository") as mock_repo_class:
+                mock_repo = mock_repo_class.return_value
+                mock_repo.get_next_pending_job = get_next_pending_job
+
+                with patch.object(worker, "_process_job", side_effect=process_job):
+                    result = await worker.process_batch()
+
+        assert result == len(mock_jobs)
+        assert peak == min(limit, len(mock_jobs))
+        assert started == {job.id for job in mock_jobs}
+        assert not worker._job_tasks
+        assert any(excluded)
+
+    @pytest.mark.asyncio
+    async def test_process_batch_reserves_quota_before_starting_jobs(self, test_engine):
+        """Test only jobs whose insert quota is reserved are started."""
+        worker = QueueWorker()
+        worker._upload_slots = asyncio.Semaphore(2)
+        tracker = QuotaTracker(daily_limit=QuotaTracker.QUOTA_COSTS["videos.insert"])
+        mock_jobs = [MagicMock(id=f"job-{i}") for i in range(2)]
+        started = []
+
+        async def get_next_pending_job(exclude_ids=None):
+            for job in mock_jobs:
+                if job.id not in (exclude_ids or ()):
+                    return job
+            return None
+
+        async def process_job(job_id, reservation):
+            started.append(job_id)
+            # The running job already holds all of today's quota
+            assert tracker.get_remaining_quota() == 0
+            reservation.commit()
+
+        with patch("app.database.get_db_context") as mock_db_context:
+            mock_db_context.return_value.__aenter__ = AsyncMock()
+            mock_db_context.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            with (
+                patch("app.queue.repositories.QueueRepository") as mock_repo_class,
+                patch("app.queue.worker.get_quota_tracker", return_value=tracker),
+                patch.object(worker, "_process_job", side_effect=process_job),
+            ):
+                mock_repo_class.return_value.get_next_pending_job = get_next_pending_job
+                result = await worker.process_batch()
+
+        assert result == 1
+        assert started == ["job-0"]
+        assert tracker.get_daily_usage() == QuotaTracker.QUOTA_COSTS["videos.insert"]
+        assert worker._upload_slots._value == 2
+
     @pytest.mark.asyncio
     async def test_process_batch_stops_on_quota_exhausted(self, test_engine):
         """Test process_batch returns 0 when quota is exhausted."""
-        from app.queue.worker import QueueWorker
-
         worker = QueueWorker()
 
         with patch("app.youtube.quota.get_quota_tracker") as mock_quota:
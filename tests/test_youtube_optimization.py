@@ -6,22 +6,51 @@ Test categories:
 - Optimized API method tests
 """
 
-from unittest.mock import MagicMock, patch
+import asyncio
+import io
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.oauth2.credentials import Credentials
 from googleapiclient.errors import HttpError
 
+from app.core.google_clients import _build_client_cached
+from app.exceptions import (
+    PlaylistLookupError,
+    QuotaExceededError,
+    UploadStreamError,
+)
+from app.youtube import quota
+from app.youtube.quota import QuotaTracker
+from app.youtube.schemas import VideoMetadata
+from app.youtube.service import (
+    MAX_CHUNK_RETRY_DELAY,
+    MAX_UPLOAD_CHUNK_SIZE,
+    UPLOAD_CHUNK_ALIGNMENT,
+    YouTubeService,
+    _chunk_retry_delay,
+    _is_retryable_error,
+    _ProgressThrottle,
+    _QueueMediaUpload,
+)
+
+# Shared by tests that use the default daily limit; reset after each one
+_DEFAULT_TRACKER = QuotaTracker()
+
 
 class TestQuotaTracker:
     """Tests for QuotaTracker class."""
 
+    @pytest.fixture
+    def tracker(self):
+        """Provide the shared default-limit tracker, emptied after the test."""
+        yield _DEFAULT_TRACKER
+        _DEFAULT_TRACKER.reset()
+
     @staticmethod
-    def test_track_usage():
+    def test_track_usage(tracker):
         """Test tracking API usage."""
-        from app.youtube.quota import QuotaTracker
-
-        tracker = QuotaTracker()
-
         # Track some operations
         tracker.track("videos.list", 1)
         tracker.track("search.list", 1)
@@ -32,12 +61,8 @@ class TestQuotaTracker:
         assert usage == 1 + 100 + 2
 
     @staticmethod
-    def test_get_remaining_quota():
+    def test_get_remaining_quota(tracker):
         """Test remaining quota calculation."""
-        from app.youtube.quota import QuotaTracker
-
-        tracker = QuotaTracker(daily_limit=10000)
-
         # Track some usage
         tracker.track("videos.insert", 1)  # 1600 units
 
@@ -47,8 +72,6 @@ class TestQuotaTracker:
     @staticmethod
     def test_can_perform_operation():
         """Test checking if operation can be performed."""
-        from app.youtube.quota import QuotaTracker
-
         tracker = QuotaTracker(daily_limit=100)
 
         # Can perform small operation
@@ -58,11 +81,8 @@ class TestQuotaTracker:
         assert tracker.can_perform("videos.insert") is False
 
     @staticmethod
-    def test_get_usage_summary():
+    def test_get_usage_summary(tracker):
         """Test getting usage summary."""
-        from app.youtube.quota import QuotaTracker
-
-        tracker = QuotaTracker()
         tracker.track("videos.list", 5)
         tracker.track("search.list", 2)
 
@@ -77,68 +97,138 @@ class TestQuotaTracker:
     @staticmethod
     def test_quota_costs():
         """Test that quota costs are correctly defined."""
-        from app.youtube.quota import QuotaTracker
-
         assert QuotaTracker.QUOTA_COSTS["videos.insert"] == 1600
         assert QuotaTracker.QUOTA_COSTS["search.list"] == 100
         assert QuotaTracker.QUOTA_COSTS["videos.list"] == 1
         assert QuotaTracker.QUOTA_COSTS["playlistItems.list"] == 1
 
-
-class TestRetryLogic:
-    """Tests for retry logic helper functions."""
+    @staticmethod
+    def test_reserve_holds_quota_until_settled(tracker):
+        """Test that reserved units count as spent until commit or rollback."""
+        committed = tracker.reserve("videos.insert")
+        assert tracker.get_remaining_quota() == 10000 - 1600
+        assert tracker.get_daily_usage() == 0
+
+        committed.commit()
+        committed.rollback()  # no-op once committed
+        assert tracker.get_daily_usage() == 1600
+        assert tracker.get_remaining_quota() == 10000 - 1600
+
+        refunded = tracker.reserve("videos.insert")
+        refunded.rollback()
+        assert tracker.get_daily_usage() == 1600
+        assert tracker.get_remaining_quota() == 10000 - 1600
 
     @staticmethod
-    def test_is_retryable_error_quota_exceeded():
-        """Test that quota exceeded error is retryable."""
-        from app.youtube.service import _is_retryable_error
+    def test_reset_clears_usage_and_reservations(tracker):
+        """Test that reset() returns the tracker to a full daily quota."""
+        tracker.track("search.list", 3)
+        tracker.reserve("videos.insert")
 
-        # Create mock HttpError for quota exceeded
-        mock_resp = MagicMock()
-        mock_resp.status = 403
-        error_content = b'{"error": {"errors": [{"reason": "quotaExceeded"}]}}'
+        tracker.reset()
 
-        error = HttpError(mock_resp, error_content)
-        assert _is_retryable_error(error) is True
+        assert tracker.get_daily_usage() == 0
+        assert tracker.get_remaining_quota() == tracker.DEFAULT_DAILY_LIMIT
+        assert tracker.get_usage_summary()["breakdown"] == {}
 
     @staticmethod
-    def test_is_retryable_error_rate_limit():
-        """Test that rate limit error is retryable."""
-        from app.youtube.service import _is_retryable_error
+    def test_settling_reservation_from_before_reset_is_ignored(tracker):
+        """Test that a reservation issued before reset() cannot skew the totals."""
+        stale_rollback = tracker.reserve("videos.insert")
+        stale_commit = tracker.reserve("videos.insert")
 
-        # Create mock HttpError for rate limit
-        mock_resp = MagicMock()
-        mock_resp.status = 429
-        error_content = b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}'
+        tracker.reset()
+        stale_rollback.rollback()
+        stale_commit.commit()
 
-        error = HttpError(mock_resp, error_content)
-        assert _is_retryable_error(error) is True
+        assert tracker.get_daily_usage() == 0
+        assert tracker.get_remaining_quota() == tracker.DEFAULT_DAILY_LIMIT
+        assert tracker.get_usage_summary()["reserved"] == 0
 
     @staticmethod
-    def test_is_retryable_error_auth_error():
-        """Test that auth error is NOT retryable."""
-        from app.youtube.service import _is_retryable_error
+    def test_reserve_rejects_overcommit():
+        """Test that outstanding reservations block further reservations."""
+        tracker = QuotaTracker(daily_limit=2000)
+        tracker.reserve("videos.insert")
 
-        # Create mock HttpError for auth error
-        mock_resp = MagicMock()
-        mock_resp.status = 401
-        error_content = b'{"error": {"errors": [{"reason": "unauthorized"}]}}'
+        with pytest.raises(QuotaExceededError) as exc_info:
+            tracker.reserve("videos.insert")
 
-        error = HttpError(mock_resp, error_content)
-        assert _is_retryable_error(error) is False
+        assert exc_info.value.remaining == 400
+        assert exc_info.value.required == 1600
+        assert not tracker.can_perform("videos.insert")
+
+
+# Canned API responses; the service only reads them, so tests can share them
+_NO_ITEMS = {"items": []}
+_FIFTY_VIDEOS = {"items": [{"id": f"video-{i}"} for i in range(50)]}
+
+
+def _fake_credentials() -> SimpleNamespace:
+    """Create stand-in credentials without a token.
+
+    Without a token the service neither shares a cached API client nor caches
+    playlist lookups, so each test sees its own patched build().
+    """
+    return SimpleNamespace(client_id=None, token=None, refresh_token=None)
+
+
+def _http_error(status: int, reason: str) -> HttpError:
+    """Create an HttpError whose body carries a single error reason.
+
+    Give every test its own error: _is_retryable_error caches its verdict
+    on the exception.
+    """
+    content = b'{"error": {"errors": [{"reason": "%s"}]}}' % reason.encode()
+    # HttpError only reads .status and .reason from the response
+    return HttpError(SimpleNamespace(status=status, reason=""), content)
+
+
+class TestRetryLogic:
+    """Tests for retry logic helper functions."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            # Quota exceeded is retried once the quota resets
+            (_http_error(403, "quotaExceeded"), True),
+            # 429 is always a rate limit
+            (_http_error(429, "rateLimitExceeded"), True),
+            # Auth errors need user action
+            (_http_error(401, "unauthorized"), False),
+            # 403 without a quota reason is a permission error
+            (_http_error(403, "forbidden"), False),
+        ],
+        ids=["quota_exceeded", "rate_limit", "auth_error", "permission_denied"],
+    )
+    def test_is_retryable_error(error, expected):
+        """Test which API errors are retried."""
+        assert _is_retryable_error(error) is expected
+
+    @staticmethod
+    def test_is_retryable_error_user_rate_limit_pretty_printed():
+        """Test that pretty-printed userRateLimitExceeded body is retryable."""
+        error_content = (
+            b'{\n  "error": {\n    "errors": [\n'
+            b'      {"domain": "usageLimits", "reason" : "userRateLimitExceeded"}\n'
+            b"    ]\n  }\n}"
+        )
+
+        error = HttpError(SimpleNamespace(status=403, reason=""), error_content)
+        assert _is_retryable_error(error) is True
 
     @staticmethod
-    def test_is_retryable_error_permission_denied():
-        """Test that permission denied (403 non-quota) is NOT retryable."""
-        from app.youtube.service import _is_retryable_error
+    def test_is_retryable_error_memoized_per_exception():
+        """Test that the 403 verdict is computed once per exception."""
+        error = _http_error(403, "quotaExceeded")
 
-        # Create mock HttpError for forbidden (permission) error
-        mock_resp = MagicMock()
-        mock_resp.status = 403
-        error_content = b'{"error": {"errors": [{"reason": "forbidden"}]}}'
+        with patch("app.youtube.service._RETRYABLE_REASON_PATTERN") as pattern:
+            pattern.search.return_value = None
+            assert _is_retryable_error(error) is False
+            assert _is_retryable_error(error) is False
 
-        error = HttpError(mock_resp, error_content)
-        assert _is_retryable_error(error) is False
+        pattern.search.assert_called_once()
 
 
 class TestYouTubeServiceOptimization:
@@ -147,28 +237,19 @@ class TestYouTubeServiceOptimization:
     @pytest.fixture
     def mock_youtube_service(self):
         """Create a mock YouTube service."""
-
-        from google.oauth2.credentials import Credentials
-
-        with patch("app.youtube.service.build") as mock_build:
+        with patch("app.core.google_clients.build") as mock_build:
             mock_service = MagicMock()
             mock_build.return_value = mock_service
 
-            # Create mock credentials
-            mock_creds = MagicMock(spec=Credentials)
-
-            from app.youtube.service import YouTubeService
-
-            service = YouTubeService(mock_creds)
+            service = YouTubeService(_fake_credentials())
             service._mock_api = mock_service
             yield service
 
     @staticmethod
     def test_check_video_exists_on_youtube_found(mock_youtube_service):
         """Test checking video exists returns True when found."""
-        mock_youtube_service._mock_api.videos().list().execute.return_value = {
-            "items": [{"id": "test-video-id"}]
-        }
+        videos_list = mock_youtube_service._mock_api.videos().list
+        videos_list.return_value.execute.return_value = {"items": [{"id": "test-video-id"}]}
 
         result = mock_youtube_service.check_video_exists_on_youtube("test-video-id")
         assert result is True
@@ -176,13 +257,109 @@ class TestYouTubeServiceOptimization:
     @staticmethod
     def test_check_video_exists_on_youtube_not_found(mock_youtube_service):
         """Test checking video exists returns False when not found."""
-        mock_youtube_service._mock_api.videos().list().execute.return_value = {
-            "items": []
-        }
+        videos_list = mock_youtube_service._mock_api.videos().list
+        videos_list.return_value.execute.return_value = _NO_ITEMS
 
         result = mock_youtube_service.check_video_exists_on_youtube("nonexistent")
         assert result is False
 
+    @staticmethod
+    def test_check_videos_exist_batches_ids(mock_youtube_service):
+        """Test batched existence check issues one request per 50 IDs."""
+        videos_list = mock_youtube_service._mock_api.videos().list
+        videos_list.return_value.execute.return_value = {
+            "items": [{"id": "video-0"}, {"id": "video-60"}]
+        }
+
+        video_ids = [f"video-{i}" for i in range(75)]
+        result = mock_youtube_service.check_videos_exist(video_ids)
+
+        assert videos_list.call_count == 2
+        assert result["video-0"] is True
+        assert result["video-60"] is True
+        assert result["video-1"] is False
+        assert len(result) == 75
+
+    @staticmethod
+    def test_check_videos_exist_dedupes_ids(mock_youtube_service):
+        """Test repeated IDs are looked up once and fit in one 50-ID request."""
+        videos_list = mock_youtube_service._mock_api.videos().list
+        videos_list.return_value.execute.return_value = {"items": [{"id": "video-0"}]}
+
+        video_ids = [f"video-{i}" for i in range(30)] * 2
+        result = mock_youtube_service.check_videos_exist(video_ids)
+
+        videos_list.assert_called_once()
+        requested = videos_list.call_args.kwargs["id"].split(",")
+        assert requested == [f"video-{i}" for i in range(30)]
+        assert result["video-0"] is True
+        assert len(result) == 30
+
+    @staticmethod
+    def test_check_videos_exist_skips_empty_input(mock_youtube_service):
+        """Test empty and blank IDs are answered without an API call."""
+        mock_youtube_service._quota = MagicMock()
+        videos_list = mock_youtube_service._mock_api.videos().list
+
+        assert mock_youtube_service.check_videos_exist([]) == {}
+        assert mock_youtube_service.check_videos_exist(["", " "]) == {"": False, " ": False}
+        assert mock_youtube_service.check_video_exists_on_youtube("") is False
+        assert mock_youtube_service.check_video_exists_on_youtube(" \t") is False
+        assert mock_youtube_service.get_videos_batch(["", "  "]) == []
+
+        videos_list.assert_not_called()
+        mock_youtube_service._quota.track.assert_not_called()
+
+    @staticmethod
+    def test_get_dashboard_snapshot_uses_one_batch(mock_youtube_service):
+        """Test channel info and videos are fetched in one batch request."""
+        api = mock_youtube_service._mock_api
+        canned = {
+            "channel": {"items": [{"id": "channel123"}]},
+            "videos": {"items": [{"id": {"videoId": "video123"}}]},
+        }
+        added = []
+
+        def new_batch(callback):
+            batch = MagicMock()
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+            batch.execute.side_effect = lambda: [
+                callback(request_id, canned[request_id], None) for request_id in added
+            ]
+            return batch
+
+        api.new_batch_http_request.side_effect = new_batch
+        mock_youtube_service._quota = MagicMock()
+
+        snapshot = mock_youtube_service.get_dashboard_snapshot(10)
+
+        assert snapshot == {
+            "channel": {"id": "channel123"},
+            "videos": [{"id": {"videoId": "video123"}}],
+        }
+        api.new_batch_http_request.assert_called_once()
+        api.channels().list().execute.assert_not_called()
+        api.search().list().execute.assert_not_called()
+        assert mock_youtube_service._quota.track.call_count == 2
+
+    @staticmethod
+    def test_list_calls_request_partial_responses(mock_youtube_service):
+        """Test channel and search lookups ask only for the fields used."""
+        api = mock_youtube_service._mock_api
+        channels_list = api.channels().list
+        search_list = api.search().list
+        channels_list.return_value.execute.return_value = _NO_ITEMS
+        search_list.return_value.execute.return_value = _NO_ITEMS
+
+        mock_youtube_service.get_channel_info()
+        mock_youtube_service.list_my_videos()
+
+        channel_fields = channels_list.call_args.kwargs["fields"]
+        search_fields = search_list.call_args.kwargs["fields"]
+        assert "statistics" in channel_fields
+        assert "id/videoId" in search_fields
+        assert "thumbnails/default" in search_fields
+
     @staticmethod
     def test_get_videos_batch_empty_list(mock_youtube_service):
         """Test batch get with empty list returns empty."""
@@ -190,18 +367,28 @@ class TestYouTubeServiceOptimization:
         assert result == []
 
     @staticmethod
-    def test_get_videos_batch_max_50(mock_youtube_service):
-        """Test batch get limits to 50 videos."""
-        mock_youtube_service._mock_api.videos().list().execute.return_value = {
-            "items": [{"id": f"video-{i}"} for i in range(50)]
-        }
+    def test_get_videos_batch_chunks_by_50(mock_youtube_service):
+        """Test batch get requests all IDs in chunks of 50."""
+        videos_list = mock_youtube_service._mock_api.videos().list
+        videos_list.return_value.execute.return_value = _FIFTY_VIDEOS
 
         # Pass more than 50 IDs
         video_ids = [f"video-{i}" for i in range(100)]
         result = mock_youtube_service.get_videos_batch(video_ids)
 
-        # Should only return max 50
-        assert len(result) <= 50
+        # One request per 50 IDs, results combined
+        assert videos_list.call_count == 2
+        assert len(result) == 100
+
+    @staticmethod
+    def test_get_videos_batch_deduplicates_ids(mock_youtube_service):
+        """Test duplicate IDs are requested only once."""
+        videos_list = mock_youtube_service._mock_api.videos().list
+
+        mock_youtube_service.get_videos_batch(["a", "b", "a", "c", "b"])
+
+        call = videos_list.call_args
+        assert call.kwargs["id"] == "a,b,c"
 
     @staticmethod
     def test_list_my_videos_optimized_uses_playlist_api(mock_youtube_service):
@@ -228,6 +415,436 @@ class TestYouTubeServiceOptimization:
         mock_youtube_service._mock_api.playlistItems().list.assert_called()
         assert len(result) == 1
 
+    @staticmethod
+    def test_list_my_videos_optimized_raises_without_playlist(mock_youtube_service):
+        """Test optimized list does not fall back to search.list."""
+        mock_youtube_service._mock_api.channels().list().execute.return_value = {
+            "items": []
+        }
+
+        with pytest.raises(PlaylistLookupError):
+            mock_youtube_service.list_my_videos_optimized(25)
+
+        mock_youtube_service._mock_api.search().list.assert_not_called()
+
+    @staticmethod
+    def test_uploads_playlist_id_persisted(mock_youtube_service, tmp_path):
+        """Test resolved uploads playlist ID is reloaded from disk."""
+        mock_youtube_service.credentials.refresh_token = "refresh-token"
+        mock_youtube_service.settings = mock_youtube_service.settings.model_copy(
+            update={"cache_dir": str(tmp_path)}
+        )
+        mock_youtube_service._mock_api.channels().list().execute.return_value = {
+            "items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UU123"}}}]
+        }
+
+        assert mock_youtube_service._get_uploads_playlist_id() == "UU123"
+
+        with patch.dict("app.youtube.service._uploads_playlist_ids", clear=True), \
+                patch("app.youtube.service.get_settings") as mock_get_settings:
+            mock_get_settings.return_value = mock_youtube_service.settings
+            restarted = YouTubeService(mock_youtube_service.credentials)
+
+        assert restarted._uploads_playlist_cache == "UU123"
+
+    @staticmethod
+    def test_uploads_playlist_id_shared_across_instances(mock_youtube_service):
+        """Test a new service for the same user reuses the resolved playlist ID."""
+        mock_youtube_service.credentials.refresh_token = "refresh-token"
+        mock_youtube_service.settings = mock_youtube_service.settings.model_copy(
+            update={"cache_dir": ""}
+        )
+        channels_list = mock_youtube_service._mock_api.channels().list
+        channels_list().execute.return_value = {
+            "items": [{"contentDetails": {"relatedPlaylists": {"uploads": "UU123"}}}]
+        }
+        channels_list.reset_mock()
+
+        with patch.dict("app.youtube.service._uploads_playlist_ids", clear=True):
+            assert mock_youtube_service._get_uploads_playlist_id() == "UU123"
+            second = YouTubeService(mock_youtube_service.credentials)
+            assert second._get_uploads_playlist_id() == "UU123"
+
+        channels_list.assert_called_once()
+
+    @staticmethod
+    def test_get_chunk_size_scales_with_file_size(mock_youtube_service):
+        """Test chunk size grows with file size and small files use one chunk."""
+        base = mock_youtube_service.settings.upload_chunk_size
+
+        assert mock_youtube_service._get_chunk_size(1024 * 1024) == -1
+        assert mock_youtube_service._get_chunk_size(20 * 1024 * 1024) == base
+        assert (
+            mock_youtube_service._get_chunk_size(4 * 1024 * 1024 * 1024)
+            == MAX_UPLOAD_CHUNK_SIZE
+        )
+        mid = mock_youtube_service._get_chunk_size(300 * 1024 * 1024 + 12345)
+        assert base <= mid <= MAX_UPLOAD_CHUNK_SIZE
+        assert mid % UPLOAD_CHUNK_ALIGNMENT == 0
+
+    @staticmethod
+    def test_get_chunk_size_respects_thresholds(mock_youtube_service):
+        """Test single-request threshold, file-size cap and alignment."""
+        mib = 1024 * 1024
+        mock_youtube_service.settings = mock_youtube_service.settings.model_copy(
+            update={"single_request_threshold": 5 * mib, "upload_chunk_size": 10 * mib + 1}
+        )
+
+        assert mock_youtube_service._get_chunk_size(5 * mib) == -1
+        assert mock_youtube_service._get_chunk_size(6 * mib) == 6 * mib
+        assert mock_youtube_service._get_chunk_size(40 * mib) == 10 * mib + UPLOAD_CHUNK_ALIGNMENT
+
+    @staticmethod
+    def test_upload_video_throttles_progress_callbacks(mock_youtube_service):
+        """Test progress callbacks are only emitted for >= 1% progress deltas."""
+        def make_status(fraction):
+            status = MagicMock()
+            status.progress.return_value = fraction
+            status.resumable_progress = int(fraction * 100)
+            return status
+
+        mock_youtube_service.settings = mock_youtube_service.settings.model_copy(
+            update={"progress_update_hz": 0}
+        )
+        request = mock_youtube_service._mock_api.videos().insert.return_value
+        request.next_chunk.side_effect = [
+            (make_status(0.001), None),
+            (make_status(0.002), None),
+            (make_status(0.005), None),
+            (make_status(0.5), None),
+            (None, {"id": "uploaded-id"}),
+        ]
+        reports = []
+
+        result = mock_youtube_service.upload_video(
+            io.BytesIO(b"\x00" * 100),
+            VideoMetadata(title="Throttle Test"),
+            file_size=20 * 1024 * 1024,  # Above the single-request threshold
+            progress_callback=reports.append,
+        )
+
+        assert result.success is True
+        assert [round(r.progress, 1) for r in reports] == [0.1, 50.0]
+
+    @staticmethod
+    def test_chunk_retry_delay():
+        """Test chunk retry waits honor Retry-After and cap the backoff."""
+        def error(status, retry_after=None):
+            return HttpError(MagicMock(status=status, get=lambda key: retry_after), b"")
+
+        assert _chunk_retry_delay(error(404), 0) is None
+        assert _chunk_retry_delay(error(429, "7"), 0) == 7.0
+        assert 4 <= _chunk_retry_delay(error(503), 2) < 5
+        assert _chunk_retry_delay(error(500), 10) == MAX_CHUNK_RETRY_DELAY
+
+    @staticmethod
+    def test_progress_throttle_limits_update_rate():
+        """Test progress updates are limited per second, except the final one."""
+        throttle = _ProgressThrottle(update_hz=4)
+        with patch("app.youtube.service.time.monotonic") as mock_clock:
+            mock_clock.return_value = 10.0
+            assert throttle.ready(5.0) is True
+            mock_clock.return_value = 10.1
+            assert throttle.ready(20.0) is False
+            mock_clock.return_value = 10.3
+            assert throttle.ready(5.5) is False  # Less than 1% since last report
+            assert throttle.ready(30.0) is True
+            mock_clock.return_value = 10.31
+            assert throttle.ready(100.0) is True
+
+    @staticmethod
+    def test_upload_video_small_file_single_request(mock_youtube_service):
+        """Test small files skip the resumable session and upload in one request."""
+        request = mock_youtube_service._mock_api.videos().insert.return_value
+        request.execute.return_value = {"id": "small-id"}
+        reports = []
+
+        result = mock_youtube_service.upload_video(
+            io.BytesIO(b"\x00" * 100),
+            VideoMetadata(title="Small"),
+            file_size=100,
+            progress_callback=reports.append,
+        )
+
+        assert result.video_id == "small-id"
+        media = mock_youtube_service._mock_api.videos().insert.call_args.kwargs["media_body"]
+        assert media.resumable() is False
+        request.next_chunk.assert_not_called()
+        assert [r.progress for r in reports] == [100.0]
+
+    @staticmethod
+    def test_upload_video_uses_prebuilt_body(mock_youtube_service):
+        """Test a pre-built insert body is passed through unchanged."""
+        metadata = VideoMetadata(title="Body Test", tags=["a", "b"])
+        body = metadata.to_youtube_body()
+        videos_api = mock_youtube_service._mock_api.videos()
+        videos_api.insert.return_value.execute.return_value = {"id": "x"}
+
+        mock_youtube_service.upload_video(
+            io.BytesIO(b"\x00"), metadata, file_size=1, body=body
+        )
+
+        assert videos_api.insert.call_args.kwargs["body"] is body
+        assert body["snippet"]["tags"] == ["a", "b"]
+        assert body["snippet"]["categoryId"] == metadata.category_id
+        assert body["status"]["privacyStatus"] == "private"
+        assert body["status"]["selfDeclaredMadeForKids"] is False
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_upload_with_retry_refunds_quota_on_failure(mock_youtube_service):
+        """Test that a failed upload releases its videos.insert reservation."""
+        tracker = QuotaTracker(daily_limit=10000)
+        mock_youtube_service._quota = tracker
+        error = HttpError(MagicMock(status=400), b"bad request")
+        mock_youtube_service.upload_from_drive_async = AsyncMock(side_effect=error)
+
+        with pytest.raises(HttpError):
+            await mock_youtube_service.upload_from_drive_with_retry_async(
+                "file123", VideoMetadata(title="Test")
+            )
+
+        assert tracker.get_remaining_quota() == 10000
+        assert tracker.get_daily_usage() == 0
+
+    @staticmethod
+    def test_api_client_reused_for_same_token():
+        """Test the discovery client is built once per client ID and token."""
+        _build_client_cached.cache_clear()
+        with patch("app.core.google_clients.build") as mock_build:
+            first = YouTubeService(Credentials(token="token-a", client_id="client"))
+            second = YouTubeService(Credentials(token="token-a", client_id="client"))
+            other = YouTubeService(Credentials(token="token-b", client_id="client"))
+
+        assert first.service is second.service
+        assert mock_build.call_count == 2
+        assert mock_build.call_args.kwargs["cache_discovery"] is False
+        assert other.service is mock_build.return_value
+        _build_client_cached.cache_clear()
+
+    @staticmethod
+    def test_videos_resource_built_once(mock_youtube_service):
+        """Test repeated calls reuse one videos() resource wrapper."""
+        mock_youtube_service._mock_api.videos().list().execute.return_value = {"items": []}
+        mock_youtube_service._mock_api.videos.reset_mock()
+
+        mock_youtube_service.check_videos_exist(["a"])
+        mock_youtube_service.get_videos_batch(["b"])
+
+        mock_youtube_service._mock_api.videos.assert_called_once_with()
+
+    @staticmethod
+    def test_drive_service_created_once(mock_youtube_service):
+        """Test the fallback Drive service is created lazily and reused."""
+        with patch("app.youtube.service.DriveService") as mock_drive_class:
+            first = mock_youtube_service._drive
+            second = mock_youtube_service._drive
+
+        assert first is second
+        mock_drive_class.assert_called_once_with(
+            credentials=mock_youtube_service.credentials
+        )
+
+
+class TestDriveToYouTubePipeline:
+    """Tests for the concurrent Drive download / YouTube upload pipeline."""
+
+    @pytest.fixture
+    def youtube_service(self):
+        """Create a YouTube service with mocked API and Drive services."""
+        with patch("app.core.google_clients.build") as mock_build:
+            mock_api = MagicMock()
+            mock_build.return_value = mock_api
+
+            service = YouTubeService(_fake_credentials())
+            service._mock_api = mock_api
+            yield service
+
+    @staticmethod
+    def _attach_drive(service, data: bytes, fail_after: int | None = None):
+        """Attach a fake Drive service that streams ``data`` in 100 KB chunks."""
+        drive = MagicMock()
+        drive.get_file_metadata = AsyncMock(
+            return_value={"size": str(len(data)), "mimeType": "video/mp4", "name": "v.mp4"}
+        )
+
+        async def iter_file_chunks(file_id, chunk_size):
+            for i in range(0, len(data), 100_000):
+                if fail_after is not None and i >= fail_after:
+                    raise OSError("connection reset")
+                yield data[i:i + 100_000]
+
+        drive.iter_file_chunks = iter_file_chunks
+        service.__dict__["_drive"] = drive
+
+    @staticmethod
+    def _attach_uploader(
+        service, received: bytearray, fail_at: int | None = None
+    ) -> list[MagicMock]:
+        """Make videos.insert consume the media body in 256 KiB chunks.
+
+        If ``fail_at`` is set, the first chunk starting at or past that offset
+        fails once with a 503 carrying ``Retry-After: 0``.
+
+        Returns:
+            List that collects each insert request the service creates
+        """
+        failures = []
+        requests = []
+
+        def fake_insert(**kwargs):
+            media = kwargs["media_body"]
+            request = MagicMock()
+            request.resumable_progress = 0
+
+            def next_chunk(num_retries=0):
+                if fail_at is not None and len(received) >= fail_at and not failures:
+                    failures.append(num_retries)
+                    media.getbytes(len(received), 256 * 1024)  # Partially sent
+                    raise HttpError(
+                        MagicMock(status=503, get=lambda key: "0"), b"unavailable"
+                    )
+                received.extend(media.getbytes(len(received), 256 * 1024))
+                request.resumable_progress = len(received)
+                if len(received) >= media.size():
+                    return None, {"id": "streamed-id"}
+                status = MagicMock()
+                status.progress.return_value = len(received) / media.size()
+                status.resumable_progress = len(received)
+                return status, None
+
+            def execute():
+                received.extend(media.getbytes(0, media.size()))
+                return {"id": "streamed-id"}
+
+            request.next_chunk.side_effect = next_chunk
+            request.execute.side_effect = execute
+            requests.append(request)
+            return request
+
+        service._mock_api.videos().insert.side_effect = fake_insert
+        return requests
+
+    @pytest.mark.asyncio
+    async def test_upload_from_drive_streams_all_bytes(self, youtube_service):
+        """Test Drive chunks are uploaded in order without a temp file."""
+        data = bytes(range(256)) * 4000
+        received = bytearray()
+        self._attach_drive(youtube_service, data)
+        self._attach_uploader(youtube_service, received)
+
+        result = await youtube_service.upload_from_drive_async(
+            "drive-id", VideoMetadata(title="Pipeline Test")
+        )
+
+        assert result.success is True
+        assert result.video_id == "streamed-id"
+        assert bytes(received) == data
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_queue_media_upload_copies_each_byte_once():
+        """Test request bodies are sliced from downloaded chunks, not a merged buffer."""
+        parts = [b"a" * 10, b"b" * 10, b"c" * 10]
+        queue: asyncio.Queue = asyncio.Queue()
+        for part in [*parts, None]:
+            queue.put_nowait(part)
+        media = _QueueMediaUpload(
+            queue, asyncio.get_running_loop(), 30, "video/mp4", chunksize=10
+        )
+
+        await media.prefetch(0)
+        assert media.getbytes(0, 10) is parts[0]
+        await media.prefetch(5)
+        assert media.getbytes(5, 10) == b"a" * 5 + b"b" * 5
+        await media.prefetch(15)
+        assert media.getbytes(15, 15) == b"b" * 5 + b"c" * 10
+        with pytest.raises(UploadStreamError):
+            media.getbytes(0, 10)
+
+    @pytest.mark.asyncio
+    async def test_upload_from_drive_resumes_after_failed_chunk(self, youtube_service):
+        """Test a transient chunk failure resumes the session instead of restarting."""
+        # Large enough to take the chunked path rather than a single request
+        data = bytes(range(256)) * 24_000
+        assert len(data) > youtube_service.settings.single_request_threshold
+        received = bytearray()
+        self._attach_drive(youtube_service, data)
+        requests = self._attach_uploader(youtube_service, received, fail_at=3_000_000)
+
+        result = await youtube_service.upload_from_drive_async(
+            "drive-id", VideoMetadata(title="Flaky Chunk Test")
+        )
+
+        assert result.success is True
+        assert bytes(received) == data
+        # One session; every chunk sent once plus a single retry of the failed one
+        (request,) = requests
+        request.execute.assert_not_called()
+        assert request.next_chunk.call_count == -(-len(data) // (256 * 1024)) + 1
+
+    @pytest.mark.asyncio
+    async def test_upload_from_drive_fails_on_download_error(self, youtube_service):
+        """Test a Drive failure aborts the upload instead of truncating it."""
+        data = bytes(range(256)) * 4000
+        received = bytearray()
+        self._attach_drive(youtube_service, data, fail_after=300_000)
+        self._attach_uploader(youtube_service, received)
+
+        result = await youtube_service.upload_from_drive_async(
+            "drive-id", VideoMetadata(title="Pipeline Failure Test")
+        )
+
+        assert result.success is False
+        assert "Drive download failed" in result.error
+        assert len(received) < len(data)
+
+    @pytest.mark.asyncio
+    async def test_upload_from_drive_reports_rewind_as_upload_failure(self, youtube_service):
+        """Test a request for discarded bytes fails the upload, not authentication."""
+        data = bytes(range(256)) * 24_000
+        self._attach_drive(youtube_service, data)
+        insert = youtube_service._mock_api.videos().insert
+        request = MagicMock()
+        request.resumable_progress = 0
+
+        def next_chunk(num_retries=0):
+            # Always ask for the first chunk again, as a restarted session would
+            insert.call_args.kwargs["media_body"].getbytes(0, 256 * 1024)
+            request.resumable_progress = 256 * 1024
+            return MagicMock(), None
+
+        request.next_chunk.side_effect = next_chunk
+        insert.side_effect = None
+        insert.return_value = request
+
+        result = await youtube_service.upload_from_drive_async(
+            "drive-id", VideoMetadata(title="Rewind Test")
+        )
+
+        assert result.success is False
+        assert result.message == "Upload failed"
+        assert "Cannot rewind" in result.error
+
+    @pytest.mark.asyncio
+    async def test_upload_threads_never_wait_for_drive(self, youtube_service):
+        """Test chunks are buffered on the event loop before next_chunk runs."""
+        data = bytes(range(256)) * 40_000
+        received = bytearray()
+        self._attach_drive(youtube_service, data)
+        self._attach_uploader(youtube_service, received)
+
+        with patch(
+            "app.youtube.service.asyncio.run_coroutine_threadsafe",
+            side_effect=AssertionError("upload thread blocked on Drive"),
+        ):
+            result = await youtube_service.upload_from_drive_async(
+                "drive-id", VideoMetadata(title="Prefetch Test")
+            )
+
+        assert result.success is True
+        assert bytes(received) == data
+
 
 class TestQuotaSingleton:
     """Test quota tracker singleton behavior."""
@@ -235,8 +852,6 @@ class TestQuotaSingleton:
     @staticmethod
     def test_get_quota_tracker_returns_same_instance():
         """Test that get_quota_tracker returns singleton."""
-        from app.youtube import quota
-
         # Reset singleton for test
         quota._quota_tracker = None
 
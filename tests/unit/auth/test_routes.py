@@ -8,30 +8,55 @@ Tests for:
 - Logout functionality
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
 
+from app.core.dependencies import (
+    get_oauth_service_dep,
+    get_session_data,
+    get_session_manager_dep,
+)
+from app.main import app
 
-@pytest.fixture
-def mock_oauth_service():
-    """Mock OAuth service for auth tests."""
+
+@pytest.fixture(scope="session")
+def _oauth_service_template():
+    """Build the OAuth service mock once; mock_oauth_service resets it per test."""
     service = MagicMock()
     # Make async methods return AsyncMock
-    service.is_authenticated = AsyncMock(return_value=False)
-    service.get_user_info = AsyncMock(return_value=None)
-    service.get_credentials = AsyncMock(return_value=None)
+    service.is_authenticated = AsyncMock()
+    service.get_user_info = AsyncMock()
+    service.get_credentials = AsyncMock()
     service.exchange_code = AsyncMock()
     service.logout = AsyncMock()
-    service.get_authorization_url = MagicMock(return_value=(
+    return service
+
+
+@pytest.fixture
+def mock_oauth_service(_oauth_service_template):
+    """Mock OAuth service for auth tests."""
+    service = _oauth_service_template
+    service.reset_mock(return_value=True, side_effect=True)
+    service.is_authenticated.return_value = False
+    service.get_user_info.return_value = None
+    service.get_credentials.return_value = None
+    service.get_authorization_url.return_value = (
         "https://accounts.google.com/o/oauth2/v2/auth?...",
         "state123",
-    ))
+    )
     return service
 
 
+@pytest.fixture
+def mock_session_manager(app_client):
+    """Mock session manager injected into the login route."""
+    manager = MagicMock()
+    app.dependency_overrides[get_session_manager_dep] = lambda: manager
+    return manager
+
+
 @pytest.fixture
 def session_data():
     """Sample session data."""
@@ -42,11 +67,8 @@ def session_data():
 
 
 @pytest.fixture
-def test_client_with_session(session_data, mock_oauth_service):
+def test_client_with_session(session_data, mock_oauth_service, app_client):
     """Create test client with authenticated session."""
-    from app.core.dependencies import get_oauth_service_dep, get_session_data
-    from app.main import app
-
     # Override dependencies
     async def override_session_data():
         return session_data
@@ -57,19 +79,12 @@ def test_client_with_session(session_data, mock_oauth_service):
     app.dependency_overrides[get_session_data] = override_session_data
     app.dependency_overrides[get_oauth_service_dep] = override_oauth_service
 
-    client = TestClient(app)
-    yield client
-
-    # Clean up overrides
-    app.dependency_overrides.clear()
+    return app_client
 
 
 @pytest.fixture
-def test_client_no_session(mock_oauth_service):
+def test_client_no_session(mock_oauth_service, app_client):
     """Create test client without session."""
-    from app.core.dependencies import get_oauth_service_dep, get_session_data
-    from app.main import app
-
     # Override dependencies
     async def override_no_session():
         return None
@@ -80,18 +95,31 @@ def test_client_no_session(mock_oauth_service):
     app.dependency_overrides[get_session_data] = override_no_session
     app.dependency_overrides[get_oauth_service_dep] = override_oauth_service
 
-    client = TestClient(app)
-    yield client
-
-    # Clean up overrides
-    app.dependency_overrides.clear()
+    return app_client
 
 
 @pytest.fixture
-def test_client():
+def test_client(app_client):
     """Create test client for the FastAPI app."""
-    from app.main import app
-    return TestClient(app)
+    return app_client
+
+
+@pytest.mark.unit
+class TestRequiresLogin:
+    """Tests that pages needing an app login redirect to the login page."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "path",
+        ["/auth/dashboard", "/auth/google"],
+        ids=["dashboard", "google_login"],
+    )
+    def test_redirects_to_login(test_client_no_session, path):
+        """Test that unauthenticated users are sent to the login page."""
+        response = test_client_no_session.get(path, follow_redirects=False)
+
+        assert response.status_code == status.HTTP_303_SEE_OTHER
+        assert "/auth/login" in response.headers["location"]
 
 
 @pytest.mark.unit
@@ -123,57 +151,40 @@ class TestLoginSubmit:
     """Tests for login form submission."""
 
     @staticmethod
-    def test_login_submit_success(test_client):
+    def test_login_submit_success(test_client, mock_session_manager):
         """Test successful login redirects to dashboard."""
-        with patch("app.auth.routes.get_session_manager") as mock_sm:
-            manager = MagicMock()
-            manager.verify_credentials.return_value = True
-            manager.create_session_token.return_value = "new-session-token"
-            mock_sm.return_value = manager
+        mock_session_manager.verify_credentials.return_value = True
+        mock_session_manager.create_session_token.return_value = "new-session-token"
 
-            response = test_client.post(
-                "/auth/login",
-                data={"username": "testuser", "password": "testpass"},
-                follow_redirects=False,
-            )
+        response = test_client.post(
+            "/auth/login",
+            data={"username": "testuser", "password": "testpass"},
+            follow_redirects=False,
+        )
 
-            assert response.status_code == status.HTTP_303_SEE_OTHER
-            assert "/auth/dashboard" in response.headers["location"]
+        assert response.status_code == status.HTTP_303_SEE_OTHER
+        assert "/auth/dashboard" in response.headers["location"]
 
     @staticmethod
-    def test_login_submit_invalid_credentials(test_client):
+    def test_login_submit_invalid_credentials(test_client, mock_session_manager):
         """Test invalid credentials redirects to login with error."""
-        with patch("app.auth.routes.get_session_manager") as mock_sm:
-            manager = MagicMock()
-            manager.verify_credentials.return_value = False
-            mock_sm.return_value = manager
+        mock_session_manager.verify_credentials.return_value = False
 
-            response = test_client.post(
-                "/auth/login",
-                data={"username": "wronguser", "password": "wrongpass"},
-                follow_redirects=False,
-            )
+        response = test_client.post(
+            "/auth/login",
+            data={"username": "wronguser", "password": "wrongpass"},
+            follow_redirects=False,
+        )
 
-            assert response.status_code == status.HTTP_303_SEE_OTHER
-            assert "/auth/login" in response.headers["location"]
-            assert "error=" in response.headers["location"]
+        assert response.status_code == status.HTTP_303_SEE_OTHER
+        assert "/auth/login" in response.headers["location"]
+        assert "error=" in response.headers["location"]
 
 
 @pytest.mark.unit
 class TestDashboard:
     """Tests for dashboard endpoint."""
 
-    @staticmethod
-    def test_dashboard_requires_auth(test_client_no_session):
-        """Test that dashboard redirects unauthenticated users to login."""
-        response = test_client_no_session.get(
-            "/auth/dashboard",
-            follow_redirects=False,
-        )
-
-        assert response.status_code == status.HTTP_303_SEE_OTHER
-        assert "/auth/login" in response.headers["location"]
-
     @staticmethod
     def test_dashboard_renders_for_authenticated_user(
         mock_oauth_service, test_client_with_session
@@ -202,17 +213,6 @@ class TestGoogleOAuth:
         assert response.status_code == status.HTTP_303_SEE_OTHER
         assert "accounts.google.com" in response.headers["location"]
 
-    @staticmethod
-    def test_google_login_requires_auth(test_client_no_session):
-        """Test that Google login requires app authentication first."""
-        response = test_client_no_session.get(
-            "/auth/google",
-            follow_redirects=False,
-        )
-
-        assert response.status_code == status.HTTP_303_SEE_OTHER
-        assert "/auth/login" in response.headers["location"]
-
     @staticmethod
     def test_oauth_callback_success(mock_oauth_service, test_client_with_session):
         """Test successful OAuth callback."""
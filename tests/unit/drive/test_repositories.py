@@ -0,0 +1,42 @@
+"""Unit tests for the Google Drive repository.
+
+Tests for:
+- Chunked file download (iter_file_chunks)
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.drive.repositories import DriveRepository
+
+
+class FakeDownloader:
+    """MediaIoBaseDownload stand-in that writes pre-defined HTTP chunks."""
+
+    def __init__(self, fd, request, chunksize):
+        self._fd = fd
+        self._parts = list(FakeDownloader.parts)
+
+    def next_chunk(self):
+        self._fd.write(self._parts.pop(0))
+        return MagicMock(), not self._parts
+
+
+@pytest.mark.unit
+class TestIterFileChunks:
+    """Tests for DriveRepository.iter_file_chunks."""
+
+    @staticmethod
+    @pytest.mark.asyncio
+    async def test_yields_downloaded_chunks_without_copying():
+        """Test each HTTP chunk is yielded as the same bytes object."""
+        FakeDownloader.parts = [b"a" * 10, b"b" * 10, b"c" * 5]
+
+        with patch("app.drive.repositories.get_api_client"), \
+                patch("app.drive.repositories.MediaIoBaseDownload", FakeDownloader):
+            repository = DriveRepository(MagicMock())
+            chunks = [chunk async for chunk in repository.iter_file_chunks("file-id", 10)]
+
+        assert chunks == FakeDownloader.parts
+        assert all(a is b for a, b in zip(chunks, FakeDownloader.parts, strict=True))
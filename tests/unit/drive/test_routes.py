@@ -9,43 +9,66 @@ Tests for:
 
 from unittest.mock import AsyncMock, MagicMock
 
+import httplib2
 import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
+from googleapiclient.errors import HttpError
 
-from app.drive.schemas import DriveFile, FileType
+from app.core.dependencies import get_drive_service, get_user_id_from_session
+from app.database import get_db
+from app.drive.schemas import DriveFile, DriveFolder, FileType
+from app.main import app
 
 
-@pytest.fixture
-def mock_drive_service():
-    """Mock Drive service for tests."""
+@pytest.fixture(scope="session")
+def _drive_service_template():
+    """Build the Drive service mock once; mock_drive_service resets it per test."""
     service = MagicMock()
     # Mock async methods with AsyncMock
-    service.list_files = AsyncMock(return_value=[])
+    service.list_files = AsyncMock()
     service.scan_folder = AsyncMock()
-    service.get_file_metadata = AsyncMock(return_value={})
-    service.get_folder_info = AsyncMock(return_value={})
-    service.get_all_videos_flat = AsyncMock(return_value=[])
+    service.get_file_metadata = AsyncMock()
+    service.get_folder_info = AsyncMock()
+    service.get_all_videos_flat = AsyncMock()
     return service
 
 
 @pytest.fixture
-def mock_queue_repo():
-    """Mock Queue repository for tests."""
+def mock_drive_service(_drive_service_template):
+    """Mock Drive service for tests."""
+    service = _drive_service_template
+    # Tests may swap in their own AsyncMocks; those are reset here as well
+    service.reset_mock(return_value=True, side_effect=True)
+    service.list_files.return_value = []
+    service.get_file_metadata.return_value = {}
+    service.get_folder_info.return_value = {}
+    service.get_all_videos_flat.return_value = []
+    return service
+
+
+@pytest.fixture(scope="session")
+def _queue_repo_template():
+    """Build the Queue repository mock once; mock_queue_repo resets it per test."""
     repo = MagicMock()
-    repo.is_file_id_in_queue = AsyncMock(return_value=False)
-    repo.is_md5_in_queue = AsyncMock(return_value=False)
+    repo.is_file_id_in_queue = AsyncMock()
+    repo.is_md5_in_queue = AsyncMock()
     repo.add_job = AsyncMock()
     return repo
 
 
 @pytest.fixture
-def test_client_with_mocks(mock_drive_service, mock_queue_repo):
-    """Create test client with mocked dependencies."""
-    from app.core.dependencies import get_drive_service, get_user_id_from_session
-    from app.database import get_db
-    from app.main import app
+def mock_queue_repo(_queue_repo_template):
+    """Mock Queue repository for tests."""
+    repo = _queue_repo_template
+    repo.reset_mock(return_value=True, side_effect=True)
+    repo.is_file_id_in_queue.return_value = False
+    repo.is_md5_in_queue.return_value = False
+    return repo
+
 
+@pytest.fixture
+def test_client_with_mocks(mock_drive_service, mock_queue_repo, app_client):
+    """Create test client with mocked dependencies."""
     # Override dependencies
     async def override_drive_service():
         return mock_drive_service
@@ -62,31 +85,50 @@ def test_client_with_mocks(mock_drive_service, mock_queue_repo):
     app.dependency_overrides[get_user_id_from_session] = override_user_id
     app.dependency_overrides[get_db] = override_db
 
-    client = TestClient(app)
-    yield client
-
-    # Clean up overrides
-    app.dependency_overrides.clear()
+    return app_client
 
 
 @pytest.fixture
-def test_client():
+def test_client(app_client):
     """Create test client for the FastAPI app."""
-    from app.main import app
-    return TestClient(app)
+    return app_client
 
 
 @pytest.mark.unit
-class TestListFiles:
-    """Tests for list files endpoint."""
+class TestRequiresAuth:
+    """Tests that Drive endpoints reject requests without a session."""
 
     @staticmethod
-    def test_list_files_requires_auth(test_client):
-        """Test that list files requires authentication."""
-        # No session cookie = should get 401
-        response = test_client.get("/drive/files")
+    @pytest.mark.parametrize(
+        ("method", "path", "json"),
+        [
+            ("GET", "/drive/files", None),
+            ("POST", "/drive/scan", {"folder_id": "folder123"}),
+            (
+                "POST",
+                "/drive/folder/upload",
+                {
+                    "folder_id": "folder123",
+                    "settings": {
+                        "title_template": "{filename}",
+                        "description_template": "Auto-uploaded",
+                        "default_privacy": "private",
+                    },
+                },
+            ),
+        ],
+        ids=["list_files", "scan_folder", "upload_folder"],
+    )
+    def test_requires_auth(test_client, method, path, json):
+        """Test that the endpoint returns 401 without a session cookie."""
+        response = test_client.request(method, path, json=json)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+
+@pytest.mark.unit
+class TestListFiles:
+    """Tests for list files endpoint."""
+
     @staticmethod
     def test_list_files_success(mock_drive_service, test_client_with_mocks):
         """Test successful file listing."""
@@ -131,8 +173,6 @@ class TestScanFolder:
     @staticmethod
     def test_scan_folder_success(mock_drive_service, test_client_with_mocks):
         """Test successful folder scan."""
-        from app.drive.schemas import DriveFolder
-
         mock_drive_service.scan_folder = AsyncMock(return_value=DriveFolder(
             id="folder123",
             name="Test Folder",
@@ -148,16 +188,6 @@ class TestScanFolder:
 
         assert response.status_code == status.HTTP_200_OK
 
-    @staticmethod
-    def test_scan_folder_requires_auth(test_client):
-        """Test that folder scan requires authentication."""
-        response = test_client.post(
-            "/drive/scan",
-            json={"folder_id": "folder123"},
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
 
 @pytest.mark.unit
 class TestGetFileInfo:
@@ -183,9 +213,6 @@ class TestGetFileInfo:
     @staticmethod
     def test_get_file_info_not_found(mock_drive_service, test_client_with_mocks):
         """Test file not found error."""
-        import httplib2
-        from googleapiclient.errors import HttpError
-
         mock_drive_service.get_file_metadata = AsyncMock(side_effect=HttpError(
             httplib2.Response({"status": 404}),
             b'{"error": {"message": "File not found"}}',
@@ -203,23 +230,6 @@ class TestGetFileInfo:
 class TestUploadFolder:
     """Tests for upload folder endpoint."""
 
-    @staticmethod
-    def test_upload_folder_requires_auth(test_client):
-        """Test that upload folder requires authentication."""
-        response = test_client.post(
-            "/drive/folder/upload",
-            json={
-                "folder_id": "folder123",
-                "settings": {
-                    "title_template": "{filename}",
-                    "description_template": "Auto-uploaded",
-                    "default_privacy": "private",
-                },
-            },
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     @staticmethod
     def test_upload_folder_empty_success(mock_drive_service, test_client_with_mocks):
         """Test folder upload with no videos."""
@@ -17,8 +17,9 @@ from uuid import uuid4
 
 import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
 
+from app.core.dependencies import get_queue_repository, get_user_id_from_session
+from app.main import app
 from app.queue.schemas import JobStatus, QueueJob, QueueStatus
 from app.youtube.schemas import VideoMetadata
 
@@ -57,11 +58,8 @@ def mock_queue_worker():
 
 
 @pytest.fixture
-def test_client_with_mocks(mock_queue_repo):
+def test_client_with_mocks(mock_queue_repo, app_client):
     """Create test client with mocked dependencies."""
-    from app.core.dependencies import get_queue_repository, get_user_id_from_session
-    from app.main import app
-
     # Override dependencies
     async def override_queue_repo():
         return mock_queue_repo
@@ -72,18 +70,13 @@ def test_client_with_mocks(mock_queue_repo):
     app.dependency_overrides[get_queue_repository] = override_queue_repo
     app.dependency_overrides[get_user_id_from_session] = override_user_id
 
-    client = TestClient(app)
-    yield client
-
-    # Clean up overrides
-    app.dependency_overrides.clear()
+    return app_client
 
 
 @pytest.fixture
-def test_client():
+def test_client(app_client):
     """Create test client for the FastAPI app."""
-    from app.main import app
-    return TestClient(app)
+    return app_client
 
 
 @pytest.fixture
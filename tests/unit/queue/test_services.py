@@ -0,0 +1,140 @@
+"""Unit tests for queue service status transitions.
+
+Tests for:
+- mark_job_* status transitions
+- retry_job eligibility and reset
+
+Uses an in-memory repository, so no database is involved; persistence of the
+same transitions is covered by tests/test_queue_persistence.py.
+"""
+
+from uuid import UUID
+
+import pytest
+
+from app.queue.schemas import JobStatus, QueueJob
+from app.queue.services import QueueService
+from app.youtube.schemas import VideoMetadata
+
+
+class FakeQueueRepository:
+    """Dict-backed stand-in for QueueRepository's update methods."""
+
+    def __init__(self, *jobs: QueueJob) -> None:
+        self.jobs: dict[UUID, QueueJob] = {job.id: job for job in jobs}
+
+    async def get_job(self, job_id: UUID) -> QueueJob | None:
+        return self.jobs.get(job_id)
+
+    async def update_job(self, job_id: UUID, **changes) -> QueueJob | None:
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        # Like the real repository, None leaves a field unchanged
+        updates = {k: v for k, v in changes.items() if v is not None}
+        self.jobs[job_id] = job.model_copy(update=updates)
+        return self.jobs[job_id]
+
+    async def increment_retry_count(self, job_id: UUID) -> QueueJob | None:
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        self.jobs[job_id] = job.model_copy(update={"retry_count": job.retry_count + 1})
+        return self.jobs[job_id]
+
+
+def make_job(**overrides) -> QueueJob:
+    """Create a queue job with test defaults."""
+    fields = {
+        "drive_file_id": "file-1",
+        "drive_file_name": "video.mp4",
+        "metadata": VideoMetadata(title="Status Test"),
+        "user_id": "test-user",
+    }
+    return QueueJob(**(fields | overrides))
+
+
+@pytest.mark.unit
+class TestStatusTransitions:
+    """Tests for the mark_job_* helpers."""
+
+    @pytest.mark.asyncio
+    async def test_job_moves_through_upload_lifecycle(self):
+        """Test pending -> downloading -> uploading -> completed."""
+        job = make_job()
+        service = QueueService(repository=FakeQueueRepository(job))
+
+        started = await service.mark_job_started(job.id)
+        assert started.status == JobStatus.DOWNLOADING
+        assert started.progress == 0.0
+
+        uploading = await service.mark_job_uploading(job.id, progress=50.0)
+        assert uploading.status == JobStatus.UPLOADING
+        assert uploading.progress == 50.0
+
+        completed = await service.mark_job_completed(
+            job.id, "yt-12345", "https://youtube.com/watch?v=yt-12345"
+        )
+        assert completed.status == JobStatus.COMPLETED
+        assert completed.progress == 100.0
+        assert completed.video_id == "yt-12345"
+
+    @pytest.mark.asyncio
+    async def test_mark_job_failed_records_error(self):
+        """Test a failed job keeps its error message."""
+        job = make_job(status=JobStatus.UPLOADING)
+        service = QueueService(repository=FakeQueueRepository(job))
+
+        failed = await service.mark_job_failed(job.id, "Network timeout")
+
+        assert failed.status == JobStatus.FAILED
+        assert failed.error == "Network timeout"
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_returns_none(self):
+        """Test transitions on a missing job return None."""
+        service = QueueService(repository=FakeQueueRepository())
+
+        assert await service.mark_job_started(make_job().id) is None
+
+
+@pytest.mark.unit
+class TestRetryJob:
+    """Tests for retry_job."""
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_requeued(self):
+        """Test a failed job under the retry limit goes back to pending."""
+        job = make_job(status=JobStatus.FAILED, error="Network timeout")
+        service = QueueService(repository=FakeQueueRepository(job))
+
+        retried, error = await service.retry_job(job.id)
+
+        assert error is None
+        assert retried.status == JobStatus.PENDING
+        assert retried.retry_count == 1
+        assert retried.progress == 0.0
+
+    @pytest.mark.asyncio
+    async def test_max_retries_exceeded(self):
+        """Test a job at its retry limit is not requeued."""
+        job = make_job(status=JobStatus.FAILED, retry_count=3, max_retries=3)
+        repo = FakeQueueRepository(job)
+        service = QueueService(repository=repo)
+
+        retried, error = await service.retry_job(job.id)
+
+        assert retried is None
+        assert error == "Maximum retries exceeded"
+        assert repo.jobs[job.id].status == JobStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_only_failed_jobs_are_retried(self):
+        """Test jobs in other states are rejected."""
+        job = make_job(status=JobStatus.UPLOADING)
+        service = QueueService(repository=FakeQueueRepository(job))
+
+        retried, error = await service.retry_job(job.id)
+
+        assert retried is None
+        assert error == "Job is not in failed status"
@@ -122,7 +122,7 @@ class TestQuotaExceededErrorInService:
 
     @staticmethod
     def test_upload_with_retry_checks_quota():
-        """Test that upload_from_drive_with_retry checks quota before upload."""
+        """Test that upload_from_drive_with_retry_async checks quota before upload."""
         with patch("app.youtube.service.get_quota_tracker") as mock_tracker_getter:
             mock_tracker = MagicMock()
             mock_tracker.can_perform.return_value = False
@@ -0,0 +1,53 @@
+"""Tests for shared Google API clients (app/core/google_clients.py).
+
+Test categories:
+- Client caching per API and access token
+- One reused transport per thread for thread safety
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from google.oauth2.credentials import Credentials
+
+from app.core.google_clients import _build_client_cached, get_api_client
+
+
+class TestGetApiClient:
+    """Tests for get_api_client."""
+
+    def setup_method(self) -> None:
+        _build_client_cached.cache_clear()
+
+    def teardown_method(self) -> None:
+        _build_client_cached.cache_clear()
+
+    def test_client_cached_per_api_and_token(self) -> None:
+        """Test the same token reuses one client per API."""
+        creds = Credentials(token="token-a", client_id="client")
+        same_token = Credentials(token="token-a", client_id="client")
+
+        drive = get_api_client("drive", "v3", creds)
+
+        assert get_api_client("drive", "v3", same_token) is drive
+        assert get_api_client("youtube", "v3", creds) is not drive
+        assert get_api_client("drive", "v3", Credentials(token="token-b")) is not drive
+
+    def test_client_without_token_not_cached(self) -> None:
+        """Test credentials without an access token get their own client."""
+        creds = Credentials(token=None)
+
+        assert get_api_client("drive", "v3", creds) is not get_api_client("drive", "v3", creds)
+
+    def test_requests_use_one_transport_per_thread(self) -> None:
+        """Test requests reuse a transport per thread and never share one across threads."""
+        client = get_api_client("youtube", "v3", Credentials(token="token-a"))
+
+        first = client.videos().list(part="id", id="a")
+        second = client.videos().list(part="id", id="b")
+        main_transport = first.http._transport()
+
+        assert second.http._transport() is main_transport
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            worker_transport = pool.submit(first.http._transport).result()
+            assert pool.submit(second.http._transport).result() is worker_transport
+        assert worker_transport is not main_transport
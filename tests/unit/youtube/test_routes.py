@@ -3,6 +3,7 @@
 Tests for:
 - Get channel info endpoint
 - List videos endpoint
+- Dashboard endpoint
 - Upload video endpoint
 - Quota status endpoint
 - Check video exists endpoint
@@ -12,7 +13,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
+
+from app.core.dependencies import get_user_credentials, get_youtube_service
+from app.main import app
+from app.youtube.schemas import UploadResult
 
 
 @pytest.fixture
@@ -67,11 +71,8 @@ def mock_quota_tracker():
 
 
 @pytest.fixture
-def test_client_with_mocks(mock_youtube_service, mock_credentials):
+def test_client_with_mocks(mock_youtube_service, mock_credentials, app_client):
     """Create test client with mocked dependencies."""
-    from app.core.dependencies import get_user_credentials, get_youtube_service
-    from app.main import app
-
     # Override dependencies
     async def override_youtube_service():
         return mock_youtube_service
@@ -82,18 +83,13 @@ def test_client_with_mocks(mock_youtube_service, mock_credentials):
     app.dependency_overrides[get_youtube_service] = override_youtube_service
     app.dependency_overrides[get_user_credentials] = override_credentials
 
-    client = TestClient(app)
-    yield client
-
-    # Clean up overrides
-    app.dependency_overrides.clear()
+    return app_client
 
 
 @pytest.fixture
-def test_client():
+def test_client(app_client):
     """Create test client for the FastAPI app."""
-    from app.main import app
-    return TestClient(app)
+    return app_client
 
 
 @pytest.mark.unit
@@ -159,6 +155,36 @@ class TestListMyVideos:
         assert response.json() == []
 
 
+@pytest.mark.unit
+class TestDashboard:
+    """Tests for dashboard endpoint."""
+
+    @staticmethod
+    def test_dashboard_requires_auth(test_client):
+        """Test that dashboard requires authentication."""
+        response = test_client.get("/youtube/dashboard")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @staticmethod
+    def test_dashboard_success(mock_youtube_service, test_client_with_mocks):
+        """Test loading channel info and videos together."""
+        mock_youtube_service.get_dashboard_snapshot.return_value = {
+            "channel": {"id": "channel123"},
+            "videos": [
+                {"id": {"videoId": "video123"}, "snippet": {"title": "Test Video"}},
+            ],
+        }
+
+        response = test_client_with_mocks.get("/youtube/dashboard?max_results=10")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["channel"]["id"] == "channel123"
+        assert data["videos"][0]["id"] == "video123"
+        assert data["videos"][0]["title"] == "Test Video"
+        mock_youtube_service.get_dashboard_snapshot.assert_called_once_with(10)
+
+
 @pytest.mark.unit
 class TestUploadVideo:
     """Tests for upload video endpoint."""
@@ -183,8 +209,6 @@ class TestUploadVideo:
     @staticmethod
     def test_upload_video_success(mock_youtube_service, test_client_with_mocks):
         """Test uploading video successfully."""
-        from app.youtube.schemas import UploadResult
-
         mock_result = UploadResult(
             success=True,
             video_id="youtube123",